@@ -0,0 +1,171 @@
+"""Multi-worker mode: N worker processes behind a session-affinity router.
+
+Every worker keeps its sessions in process memory, so each session has to be
+pinned to one worker. The mapping is deterministic rather than stored: worker
+`i` of `n` only mints session ids with ``shard_for(id, n) == i`` (see
+`GameManager`), and `SessionRouter` forwards each request to
+``shard_for(sessionId, n)``. The id is read from the ``sessionId`` query
+parameter or from the JSON body. Requests without one, like `/api/game/new`,
+go round-robin. Responses are streamed through, so SSE routes work as well.
+``GET /metrics`` is the exception: the router scrapes every worker and
+merges the results, with a ``worker`` label on every sample and a
+``cluster_worker_up`` gauge per worker.
+
+Run it with::
+
+    python -m backend.app.cluster --workers 4 --port 8000
+
+This starts workers on ``port+1 .. port+n`` with `WORKER_INDEX`/`WORKER_COUNT`
+set, and serves the router on `port`. If `POKER_DB_PATH` is set, all workers
+share the SQLite file, so a session still reloads after the worker count
+changes and its ids map to different workers.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+from contextlib import asynccontextmanager
+from typing import List, Optional, Sequence
+
+import httpx
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from .core.metrics import merge_expositions
+from .domain.session_store import shard_for
+
+
+# Connection-level headers that must not be forwarded by a proxy
+_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "host",
+    "content-length",
+}
+
+
+def _forward_headers(headers) -> List[tuple]:
+    return [(k, v) for k, v in headers.items() if k.lower() not in _HOP_HEADERS]
+
+
+def session_id_of(request: Request, body: bytes) -> Optional[str]:
+    session_id = request.query_params.get("sessionId")
+    if session_id is None and body and request.headers.get("content-type", "").startswith("application/json"):
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
+        if isinstance(payload, dict) and isinstance(payload.get("sessionId"), str):
+            session_id = payload["sessionId"]
+    return session_id
+
+
+class SessionRouter:
+    """ASGI app that pins each session to the worker owning its shard."""
+
+    def __init__(self, workers: Sequence[httpx.AsyncClient]) -> None:
+        if not workers:
+            raise ValueError("SessionRouter needs at least one worker")
+        self.workers = list(workers)
+        self._next = itertools.cycle(range(len(self.workers)))
+        methods = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+        routes = [Route("/metrics", self.metrics, methods=["GET"]), Route("/{path:path}", self.proxy, methods=methods)]
+        self.app = Starlette(routes=routes, lifespan=self._lifespan)
+
+    @asynccontextmanager
+    async def _lifespan(self, app):
+        yield
+        await self.aclose()
+
+    @classmethod
+    def for_urls(cls, urls: Sequence[str]) -> "SessionRouter":
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=64)
+        return cls([httpx.AsyncClient(base_url=url, timeout=None, limits=limits) for url in urls])
+
+    def worker_for(self, session_id: Optional[str]) -> int:
+        if session_id is None:
+            return next(self._next)
+        return shard_for(session_id, len(self.workers))
+
+    async def proxy(self, request: Request) -> StreamingResponse:
+        body = await request.body()
+        client = self.workers[self.worker_for(session_id_of(request, body))]
+        upstream = client.build_request(
+            request.method,
+            request.url.path,
+            params=request.query_params.multi_items(),
+            headers=_forward_headers(request.headers),
+            content=body,
+        )
+        response = await client.send(upstream, stream=True)
+        return StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            headers=dict(_forward_headers(response.headers)),
+            background=BackgroundTask(response.aclose),
+        )
+
+    async def metrics(self, request: Request) -> PlainTextResponse:
+        """Every worker's exposition merged into one; unreachable workers report up 0."""
+        responses = await asyncio.gather(*(client.get("/metrics") for client in self.workers), return_exceptions=True)
+        texts, up = [], ["# HELP cluster_worker_up Whether the router could scrape the worker", "# TYPE cluster_worker_up gauge"]
+        for index, response in enumerate(responses):
+            ok = isinstance(response, httpx.Response) and response.status_code == 200
+            if ok:
+                texts.append(response.text)
+            up.append(f'cluster_worker_up{{worker="{index}"}} {int(ok)}')
+        texts.append("\n".join(up) + "\n")
+        return PlainTextResponse(merge_expositions(texts), media_type="text/plain; version=0.0.4")
+
+    async def aclose(self) -> None:
+        for client in self.workers:
+            await client.aclose()
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.app(scope, receive, send)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run N game workers behind a session-affinity router")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    procs = []
+    urls = []
+    for index in range(args.workers):
+        port = args.port + 1 + index
+        env = {**os.environ, "WORKER_INDEX": str(index), "WORKER_COUNT": str(args.workers)}
+        procs.append(subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "backend.app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+            env=env,
+        ))
+        urls.append(f"http://127.0.0.1:{port}")
+    try:
+        uvicorn.run(SessionRouter.for_urls(urls), host=args.host, port=args.port)
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,5 +4,29 @@ import os
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 MODEL_ID = os.getenv("MODEL_ID", "claude-3-opus-20240229")
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
-
-
+CACHE_DIR = os.getenv("POKER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "poker-trainer"))
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "10000"))
+SESSION_TTL_SECONDS = float(os.getenv("SESSION_TTL_SECONDS", "3600"))
+SESSION_SWEEP_SECONDS = float(os.getenv("SESSION_SWEEP_SECONDS", "60"))
+# Offline preflop equity matrix (python -m backend.app.domain.preflop_equity), memmapped by every worker
+PREFLOP_EQUITY_PATH = os.getenv("PREFLOP_EQUITY_PATH", os.path.join(CACHE_DIR, "preflop_equity.bin"))
+# HU push/fold charts (python -m backend.app.domain.pushfold), one memmapped file per blind structure
+PUSHFOLD_DIR = os.getenv("PUSHFOLD_DIR", os.path.join(CACHE_DIR, "pushfold"))
+# Per-flop analysis cache: in-process LRU size and the shared on-disk store (empty path = memory only)
+FLOP_CACHE_ENTRIES = int(os.getenv("FLOP_CACHE_ENTRIES", "4096"))
+FLOP_CACHE_PATH = os.getenv("FLOP_CACHE_PATH", os.path.join(CACHE_DIR, "flop_cache.sqlite"))
+# Fixed (hero combo, runout) sample count per flop/turn decision of the equity villain
+VILLAIN_EQUITY_SAMPLES = int(os.getenv("VILLAIN_EQUITY_SAMPLES", "512"))
+# Per-session lock striping in GameManager
+LOCK_STRIPES = int(os.getenv("LOCK_STRIPES", "64"))
+BATCH_MAX_OPS = int(os.getenv("BATCH_MAX_OPS", "1000"))
+# SQLite session persistence; empty disables it
+DB_PATH = os.getenv("POKER_DB_PATH", "")
+# Multi-worker mode (see backend/app/cluster.py): this worker's shard and the shard count
+WORKER_INDEX = int(os.getenv("WORKER_INDEX", "0"))
+WORKER_COUNT = int(os.getenv("WORKER_COUNT", "1"))
+# Sampling profiler: /admin/profile requires the X-Admin-Token header to match (empty disables the route)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+PROFILE_SIGNAL = os.getenv("PROFILE_SIGNAL", "SIGUSR2")
+PROFILE_SECONDS = float(os.getenv("PROFILE_SECONDS", "30"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(CACHE_DIR, "profiles"))
@@ -1,3 +1,5 @@
+from fastapi import Request
+
 from .config import ANTHROPIC_API_KEY, MODEL_ID
 
 
@@ -6,3 +8,6 @@ def get_reasoning_engine():
     return None
 
 
+def get_game_manager(request: Request):
+    """The `GameManager` owned by this app instance (see `create_app`)."""
+    return request.app.state.game_manager
@@ -0,0 +1,296 @@
+"""In-process metrics with Prometheus text exposition.
+
+A deliberately small registry, cheap enough to leave on in production. Counter
+increments and histogram observations take no lock. They are appended to a
+deque (an atomic operation under the GIL) and folded into totals at scrape
+time, or once `PENDING_LIMIT` have accumulated. So `timed` costs about two
+`perf_counter` calls and an append per call.
+Metrics are per process. Each worker's ``/metrics`` labels every sample with
+its ``worker`` index, and the cluster router's ``/metrics`` merges all
+workers' expositions (`merge_expositions`). Values that belong to one app
+rather than the process, such as resident sessions, live in that app's own
+`Registry` (see `create_app`).
+
+    REQUESTS = counter("http_requests_total", "HTTP requests", ("method", "route", "status"))
+    REQUESTS.inc("GET", "/health", "200")
+
+    @timed(ENGINE_SECONDS, "showdown")
+    def _evaluate_showdown(self): ...
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Pending lock-free observations folded in by the observing thread past this many
+PENDING_LIMIT = 4096
+# Seconds; spans a table lookup (~10us) to a slow request (~1s)
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def render(self, extra: str = "") -> List[str]:
+        """Exposition lines; `extra` is a preformatted label list added to every sample."""
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._pending: "deque[Tuple[Tuple[str, ...], float]]" = deque()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._pending.append((labels, amount))
+        if len(self._pending) > PENDING_LIMIT:
+            self._fold()
+
+    def _fold(self) -> None:
+        with self._lock:
+            pending, values = self._pending, self._values
+            while pending:
+                labels, amount = pending.popleft()
+                values[labels] = values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        self._fold()
+        return self._values.get(labels, 0.0)
+
+    def render(self, extra: str = "") -> List[str]:
+        lines = super().render()
+        self._fold()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels, extra)} {_num(value)}")
+        return lines
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        """Sample the (unlabelled) value from `fn` at scrape time."""
+        self._function = fn
+
+    def value(self, *labels: str) -> float:
+        if self._function is not None and not labels:
+            return float(self._function())
+        return self._values.get(labels, 0.0)
+
+    def render(self, extra: str = "") -> List[str]:
+        lines = super().render()
+        if self._function is not None:
+            lines.append(f"{self.name}{_labels((), (), extra)} {_num(self.value())}")
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels, extra)} {_num(value)}")
+        return lines
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._bounds = np.array(self.buckets)
+        # labels -> [per-bucket counts (non-cumulative, last is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], List] = {}
+        # labels -> raw observations not yet bucketed
+        self._pending: Dict[Tuple[str, ...], "deque[float]"] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        pending = self._pending.get(labels)
+        if pending is None:
+            with self._lock:
+                pending = self._pending.setdefault(labels, deque())
+                self._series.setdefault(labels, [np.zeros(len(self.buckets) + 1, dtype=np.int64), 0.0])
+        pending.append(value)
+        if len(pending) > PENDING_LIMIT:
+            self._fold()
+
+    def _fold(self) -> None:
+        with self._lock:
+            for labels, pending in self._pending.items():
+                n = len(pending)
+                if not n:
+                    continue
+                # popleft only takes what is already there; concurrent appends stay queued
+                values = np.array([pending.popleft() for _ in range(n)])
+                series = self._series[labels]
+                series[0] += np.bincount(np.searchsorted(self._bounds, values, side="left"), minlength=len(self.buckets) + 1)
+                series[1] += float(values.sum())
+
+    def count(self, *labels: str) -> int:
+        self._fold()
+        series = self._series.get(labels)
+        return int(series[0].sum()) if series else 0
+
+    def render(self, extra: str = "") -> List[str]:
+        lines = super().render()
+        self._fold()
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts.tolist()):
+                cumulative += n
+                le = ",".join(filter(None, (extra, f'le="{_num(bound)}"')))
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels, extra)} {repr(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels, extra)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"metric {metric.name!r} already registered as {existing.kind}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def render(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """Text exposition; `labels` (e.g. the worker index) are added to every sample."""
+        extra = ",".join(f'{k}="{_escape(str(v))}"' for k, v in (labels or {}).items())
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render(extra))
+        return "\n".join(lines) + "\n"
+
+
+def merge_expositions(texts: Iterable[str]) -> str:
+    """Join several workers' expositions, keeping each family's HELP/TYPE lines once."""
+    families: Dict[str, Tuple[List[str], List[str]]] = {}
+    for text in texts:
+        samples: List[str] = []
+        for line in text.splitlines():
+            if line.startswith("# "):
+                header, samples = families.setdefault(line.split(" ", 3)[2], ([], []))
+                if line not in header:
+                    header.append(line)
+            elif line:
+                samples.append(line)
+    lines = [line for header, samples in families.values() for line in header + samples]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, help, labelnames))
+
+
+def gauge(name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, help, labelnames))
+
+
+def histogram(name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, help, labelnames, buckets))
+
+
+def timed(metric: Histogram, *labels: str):
+    """Decorator observing the wrapped call's wall time in `metric`."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                metric.observe(time.perf_counter() - start, *labels)
+        return wrapper
+    return decorate
+
+
+# Shared metrics (defined here so every module observes into the same series)
+HTTP_REQUESTS = counter("http_requests_total", "HTTP requests by route and status", ("method", "route", "status"))
+HTTP_SECONDS = histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+ENGINE_SECONDS = histogram("engine_seconds", "Time inside game engine hot paths", ("op",))
+SSE_STREAMS = gauge("sse_streams_open", "Open server-sent event streams", ("route",))
+
+
+class MetricsMiddleware:
+    """Pure-ASGI timing middleware (no BaseHTTPMiddleware task overhead).
+
+    Requests are labelled with the matched route template, not the raw path,
+    so label cardinality stays bounded. Streaming responses are timed until
+    the body completes.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = ["500"]
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope.get("method", "")
+            HTTP_SECONDS.observe(time.perf_counter() - start, method, path)
+            HTTP_REQUESTS.inc(method, path, status[0])
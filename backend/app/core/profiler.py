@@ -0,0 +1,121 @@
+"""On-demand statistical profiler for a live worker.
+
+`SamplingProfiler` polls `sys._current_frames()` from a background thread
+every `interval` seconds. Each sample becomes one stack per thread, and the
+result is in collapsed-stack format: ``thread;outer;...;leaf count`` per line.
+That output feeds flamegraph.pl, speedscope or inferno directly. Nothing is
+hooked into the interpreter, so there is no cost while it is idle, and the
+process keeps serving while it samples.
+
+The event loop thread shows the coroutine that is running at sample time,
+which covers the SSE generators. Sync routes, and so `apply_hero_action` and
+the showdown path, show up under Starlette's threadpool workers. Samples
+whose leaf is a known idle wait (selector poll, queue get, condition wait)
+are dropped unless ``include_idle=True``.
+
+Two triggers:
+
+- ``GET /admin/profile?seconds=N``, guarded by the `ADMIN_TOKEN` header check;
+- the `PROFILE_SIGNAL` signal (default SIGUSR2). It profiles for
+  `PROFILE_SECONDS` and writes ``profile-<pid>-<time>.collapsed`` to
+  `PROFILE_DIR`.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# (file basename, function) leaves that mean "blocked, not working"
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+_running = threading.Lock()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_qualname}"
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005, include_idle: bool = False) -> None:
+        self.interval = interval
+        self.include_idle = include_idle
+        self.samples = 0
+        self._stacks: Counter = Counter()
+
+    def _sample(self, own_ident: int, names: dict) -> None:
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            leaf = frame.f_code
+            if not self.include_idle and (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_LEAVES:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}").replace(";", "_").replace(" ", "_"))
+            self._stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def run(self, seconds: float) -> "SamplingProfiler":
+        """Sample all other threads for `seconds` (blocks the calling thread)."""
+        own = threading.get_ident()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            self._sample(own, names)
+            time.sleep(self.interval)
+        return self
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+
+def profile(seconds: float, interval: float = 0.005, include_idle: bool = False) -> Optional[str]:
+    """Collapsed stacks for the next `seconds`; None if another profile is already running."""
+    if not _running.acquire(blocking=False):
+        return None
+    try:
+        return SamplingProfiler(interval, include_idle).run(seconds).collapsed()
+    finally:
+        _running.release()
+
+
+def _profile_to_file(seconds: float, out_dir: str) -> None:
+    result = profile(seconds)
+    if result is None:
+        logger.warning("profile signal ignored: a profile is already running")
+        return
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"profile-{os.getpid()}-{int(time.time())}.collapsed")
+    with open(path, "w") as f:
+        f.write(result)
+    logger.warning("wrote %s", path)
+
+
+def install_signal_handler(signame: str, seconds: float, out_dir: str) -> bool:
+    """Profile in a background thread whenever `signame` arrives (main thread only)."""
+    signum = getattr(signal, signame, None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def handler(_signum, _frame) -> None:
+        threading.Thread(target=_profile_to_file, args=(seconds, out_dir), name="profiler", daemon=True).start()
+
+    signal.signal(signum, handler)
+    return True
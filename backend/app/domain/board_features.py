@@ -0,0 +1,95 @@
+"""Precomputed flop texture table.
+
+Every flop reduces to one of 1,755 suit-isomorphic classes. `flop_key`
+names the class (ranks high to low plus a suit pattern, e.g. ``"KK7abc"``,
+``"QJ9aab"``) and the table maps it to the texture features used by
+`PokerAdapter.classify_board`. The table is built lazily on first use and
+cached on disk under `CACHE_DIR`; the file carries `TEXTURE_VERSION` and
+is rebuilt whenever the stored version differs.
+"""
+from __future__ import annotations
+
+import json
+import os
+from itertools import combinations
+from typing import Dict, Optional, Sequence
+
+from ..core.config import CACHE_DIR
+from .cards import RANKS, Card, to_ints
+
+
+# Bump whenever `_flop_texture` changes so cached tables are rebuilt.
+TEXTURE_VERSION = 1
+TABLE_FILE = "flop_textures.json"
+
+_PATTERN = "abc"
+_table: Optional[Dict[str, Dict]] = None
+
+
+def flop_key(board: Sequence[Card]) -> str:
+    """Canonical suit-isomorphism key of the first three board cards."""
+    cards = to_ints(board[:3])
+    suits = [c & 3 for c in cards]
+    # Rank high to low; within a paired rank, the card sharing its suit with
+    # another flop card goes first so equivalent flops get the same pattern.
+    order = sorted(cards, key=lambda c: (-(c >> 2), -suits.count(c & 3)))
+    labels: Dict[int, str] = {}
+    pattern = ""
+    for c in order:
+        pattern += labels.setdefault(c & 3, _PATTERN[len(labels)])
+    return "".join(RANKS[c >> 2] for c in order) + pattern
+
+
+def _flop_texture(key: str) -> Dict:
+    ranks = sorted(RANKS.index(r) + 2 for r in key[:3])
+    high_cards = sum(1 for r in ranks if r >= 12)
+    feats: Dict = {
+        "monotone": key[3:] == "aaa",
+        "connected": (ranks[-1] - ranks[0]) <= 4,
+        "paired": len(set(ranks)) < 3,
+        "highCardHeavy": high_cards >= 2 or (ranks[-1] >= RANKS.index("A")),
+        "type": "dry",
+    }
+    if feats["monotone"] or feats["connected"]:
+        feats["type"] = "wet"
+    if feats["connected"] and feats["highCardHeavy"]:
+        feats["type"] = "dynamic"
+    return feats
+
+
+def build_table() -> Dict[str, Dict]:
+    keys = {flop_key(flop) for flop in combinations(range(52), 3)}
+    return {key: _flop_texture(key) for key in sorted(keys)}
+
+
+def load_table(cache_dir: Optional[str] = CACHE_DIR) -> Dict[str, Dict]:
+    """Read the versioned table from `cache_dir`, rebuilding it if stale or missing."""
+    path = os.path.join(cache_dir, TABLE_FILE) if cache_dir else None
+    if path and os.path.exists(path):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") == TEXTURE_VERSION:
+                return data["flops"]
+        except (OSError, ValueError, KeyError):
+            pass
+    table = build_table()
+    if path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump({"version": TEXTURE_VERSION, "flops": table}, f)
+            os.replace(tmp, path)
+        except OSError:
+            # Read-only cache dir: keep the in-memory table
+            pass
+    return table
+
+
+def flop_texture(board: Sequence[Card]) -> Dict:
+    """Texture features for a board with at least three cards (O(1) lookup)."""
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table[flop_key(board)]
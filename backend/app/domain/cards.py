@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Union
+
+
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
+SUITS = ["s", "h", "d", "c"]
+
+Card = Union[int, str]
+
+
+def generate_deck() -> List[str]:
+    return [r + s for r in RANKS for s in SUITS]
+
+
+# Integer encoding: card = rank_index * 4 + suit_index, so generate_deck()[i]
+# is the string form of card i and a fresh deck is simply range(52).
+CARD_STRS: List[str] = generate_deck()
+CARD_INDEX: Dict[str, int] = {c: i for i, c in enumerate(CARD_STRS)}
+
+
+def rank_of(card: int) -> int:
+    """Rank index 0..12 (2..A)."""
+    return card >> 2
+
+
+def suit_of(card: int) -> int:
+    """Suit index 0..3 in `SUITS` order."""
+    return card & 3
+
+
+def to_int(card: Card) -> int:
+    return card if isinstance(card, int) else CARD_INDEX[card]
+
+
+def to_ints(cards: Iterable[Card]) -> List[int]:
+    return [c if isinstance(c, int) else CARD_INDEX[c] for c in cards]
+
+
+def mask_of(cards: Iterable[int]) -> int:
+    """64-bit card-set bitmask (bit i set for card i)."""
+    mask = 0
+    for c in cards:
+        mask |= 1 << c
+    return mask
+
+
+def to_str(card: int) -> str:
+    return CARD_STRS[card]
+
+
+def to_strs(cards: Iterable[int]) -> List[str]:
+    return [CARD_STRS[c] for c in cards]
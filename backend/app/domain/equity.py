@@ -0,0 +1,271 @@
+"""Hero-vs-range equity via Monte Carlo rollouts.
+
+`EquityEngine.estimate` samples villain combos (by range weight) and board
+runouts, ranks both hands with `evaluate_batch`, and fans chunks of
+rollouts out over a `ProcessPoolExecutor`. Every chunk gets its own RNG
+spawned from one `SeedSequence`, so a fixed seed and sample budget is
+reproducible regardless of worker scheduling.
+
+Stopping rules (whichever hits first): `max_samples`, `target_stderr`
+(precision budget) or `time_budget` seconds.
+
+When the remaining work (villain combos x runouts) is at most
+`exact_threshold`, usually on the turn and river, the engine enumerates
+every scenario instead. (combo, runout) pairs that differ only by a suit
+permutation fixing hero + board are collapsed into one weighted
+representative before evaluation.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import os
+import time
+from itertools import combinations, permutations
+from math import comb
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch_eval import evaluate_batch
+from .cards import CARD_INDEX, RANKS, SUITS, Card, generate_deck, mask_of, to_ints
+from .ranges import COMBOS, RangeSpec, parse_range, unblocked
+
+
+Z_95 = 1.959963984540054
+
+# Card universe for enumeration, and every suit relabelling of it:
+# SUIT_PERMS[p][c] is card c with its suit permuted by permutation p.
+DECK: List[int] = [CARD_INDEX[c] for c in generate_deck()]
+SUIT_PERMS: np.ndarray = np.array(
+    [[CARD_INDEX[r + SUITS[perm[SUITS.index(s)]]] for r in RANKS for s in SUITS] for perm in permutations(range(len(SUITS)))],
+    dtype=np.int8,
+)
+
+
+@dataclass
+class EquityResult:
+    equity: float
+    ci_low: float
+    ci_high: float
+    stderr: float
+    samples: int
+    exact: bool = False
+    evaluated: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "equity": round(self.equity, 4),
+            "ci": [round(self.ci_low, 4), round(self.ci_high, 4)],
+            "stderr": round(self.stderr, 5),
+            "samples": self.samples,
+            "exact": self.exact,
+            "evaluated": self.evaluated,
+        }
+
+
+def _rollout_chunk(
+    hero: Tuple[int, ...],
+    board: Tuple[int, ...],
+    combos: np.ndarray,
+    cdf: np.ndarray,
+    n: int,
+    seed: np.random.SeedSequence,
+) -> Tuple[float, float, int]:
+    """Run `n` rollouts; returns (sum of scores, sum of squared scores, n).
+
+    Score per rollout is 1 for a hero win, 0.5 for a split, 0 for a loss.
+    """
+    rng = np.random.default_rng(seed)
+    villain = combos[np.searchsorted(cdf, rng.random(n) * cdf[-1], side="right")]
+
+    need = 5 - len(board)
+    if need:
+        dead = mask_of(hero + board)
+        live = np.array([c for c in range(52) if not dead >> c & 1], dtype=np.int8)
+        slot = np.full(52, -1, dtype=np.intp)
+        slot[live] = np.arange(len(live))
+        # Random sort keys per live card; villain cards are pushed past the cut.
+        keys = rng.random((n, len(live)))
+        rows = np.arange(n)
+        keys[rows, slot[villain[:, 0]]] = 2.0
+        keys[rows, slot[villain[:, 1]]] = 2.0
+        runout = live[np.argpartition(keys, need - 1, axis=1)[:, :need]]
+    else:
+        runout = np.empty((n, 0), dtype=np.int8)
+
+    shared = np.concatenate([np.broadcast_to(np.array(board, dtype=np.int8), (n, len(board))), runout], axis=1)
+    hero_str = evaluate_batch(np.concatenate([np.broadcast_to(np.array(hero, dtype=np.int8), (n, 2)), shared], axis=1))
+    villain_str = evaluate_batch(np.concatenate([villain, shared], axis=1))
+    score = (hero_str > villain_str) + 0.5 * (hero_str == villain_str)
+    return float(score.sum()), float(np.square(score).sum()), n
+
+
+def _result(total: float, total_sq: float, n: int) -> EquityResult:
+    if n == 0:
+        return EquityResult(0.0, 0.0, 0.0, 0.0, 0)
+    mean = total / n
+    var = max(0.0, total_sq / n - mean * mean)
+    stderr = math.sqrt(var / n)
+    return EquityResult(mean, max(0.0, mean - Z_95 * stderr), min(1.0, mean + Z_95 * stderr), stderr, n, evaluated=n)
+
+
+def _stabilizer(hero: Sequence[int], board: Sequence[int]) -> np.ndarray:
+    """Suit permutations that map the hero's cards and the board each onto themselves.
+
+    Swapping a hero card with a board card keeps the union fixed but changes
+    the spot (AhKh on AdKd is not AdKd on AhKh), so those are excluded.
+    """
+    keep = [
+        p
+        for p, perm in enumerate(SUIT_PERMS)
+        if all(sorted(perm[list(cards)].tolist()) == sorted(cards) for cards in (hero, board))
+    ]
+    return SUIT_PERMS[keep]
+
+
+def _sorted_code(cards: np.ndarray) -> np.ndarray:
+    """Order-independent base-52 code for each row of cards."""
+    code = np.zeros(len(cards), dtype=np.int64)
+    for col in np.sort(cards.astype(np.int64), axis=1).T:
+        code = code * 52 + col
+    return code
+
+
+def _enumerate(hero: Tuple[int, ...], board: Tuple[int, ...], combos: np.ndarray, weights: np.ndarray) -> EquityResult:
+    """Exact weighted equity over every villain combo and runout."""
+    need = 5 - len(board)
+    dead = mask_of(hero + board)
+    live = [c for c in DECK if not dead >> c & 1]
+    boards = list(combinations(live, need))
+    runouts = np.array(boards, dtype=np.int8).reshape(len(boards), need)
+
+    # Every (villain combo, runout) pair that shares no card
+    v_idx, r_idx = np.meshgrid(np.arange(len(combos)), np.arange(len(runouts)), indexing="ij")
+    v_idx, r_idx = v_idx.ravel(), r_idx.ravel()
+    v_mask = (np.int64(1) << combos[:, 0].astype(np.int64)) | (np.int64(1) << combos[:, 1].astype(np.int64))
+    r_mask = np.zeros(len(runouts), dtype=np.int64)
+    for col in runouts.T:
+        r_mask |= np.int64(1) << col.astype(np.int64)
+    ok = (v_mask[v_idx] & r_mask[r_idx]) == 0
+    v_idx, r_idx = v_idx[ok], r_idx[ok]
+    villain, runout = combos[v_idx], runouts[r_idx]
+    pair_weight = weights[v_idx]
+
+    # Orbit key: smallest (villain, runout) code over the stabilizer of hero and board
+    scale = np.int64(52) ** need
+    key = None
+    for perm in _stabilizer(hero, board):
+        code = _sorted_code(perm[villain]) * scale + _sorted_code(perm[runout])
+        key = code if key is None else np.minimum(key, code)
+    uniq, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    orbit_weight = np.bincount(inverse, weights=pair_weight)
+
+    villain, runout = villain[first], runout[first]
+    n = len(uniq)
+    shared = np.concatenate([np.broadcast_to(np.array(board, dtype=np.int8), (n, len(board))), runout], axis=1)
+    hero_str = evaluate_batch(np.concatenate([np.broadcast_to(np.array(hero, dtype=np.int8), (n, 2)), shared], axis=1))
+    villain_str = evaluate_batch(np.concatenate([villain, shared], axis=1))
+    score = (hero_str > villain_str) + 0.5 * (hero_str == villain_str)
+    equity = float((score * orbit_weight).sum() / orbit_weight.sum())
+    return EquityResult(equity, equity, equity, 0.0, int(ok.sum()), exact=True, evaluated=n)
+
+
+class EquityEngine:
+    """Equity service with a lazily started process pool.
+
+    `workers <= 1` runs rollouts in-process (no pool), which is what tests
+    and tiny budgets want.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 25_000, exact_threshold: int = 150_000) -> None:
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = chunk_size
+        self.exact_threshold = exact_threshold
+        self._pool: Optional[Executor] = None
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            # spawn: forking a threaded server process is not safe
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def estimate(
+        self,
+        hero: Sequence[Card],
+        villain_range: RangeSpec = None,
+        board: Sequence[Card] = (),
+        *,
+        max_samples: int = 200_000,
+        target_stderr: Optional[float] = None,
+        time_budget: Optional[float] = None,
+        seed: Optional[int] = None,
+        exact: Optional[bool] = None,
+    ) -> EquityResult:
+        """Hero equity against `villain_range` on a 0-5 card `board`.
+
+        `exact=None` enumerates when the work fits `exact_threshold` and
+        samples otherwise; True/False force one mode.
+        """
+        hero_i = tuple(to_ints(hero))
+        board_i = tuple(to_ints(board))
+        if len(hero_i) != 2 or len(board_i) > 5 or len(set(hero_i + board_i)) != len(hero_i + board_i):
+            raise ValueError("hero needs two cards and board at most five, all distinct")
+
+        weights = parse_range(villain_range) * unblocked(mask_of(hero_i + board_i))
+        live = np.flatnonzero(weights > 0)
+        if not len(live):
+            raise ValueError("villain range is empty after card removal")
+        combos = COMBOS[live]
+        if exact is None:
+            exact = len(live) * comb(50 - len(board_i), 5 - len(board_i)) <= self.exact_threshold
+        if exact:
+            return _enumerate(hero_i, board_i, combos, weights[live])
+        cdf = np.cumsum(weights[live])
+
+        deadline = time.perf_counter() + time_budget if time_budget else None
+        seeds = np.random.SeedSequence(seed)
+        total = total_sq = 0.0
+        n = 0
+        while n < max_samples:
+            fanout = max(1, self.workers)
+            sizes: List[int] = []
+            remaining = max_samples - n
+            for _ in range(fanout):
+                size = min(self.chunk_size, remaining)
+                if size <= 0:
+                    break
+                sizes.append(size)
+                remaining -= size
+            job = partial(_rollout_chunk, hero_i, board_i, combos, cdf)
+            chunk_seeds = seeds.spawn(len(sizes))
+            if self.workers <= 1:
+                parts = [job(size, s) for size, s in zip(sizes, chunk_seeds)]
+            else:
+                parts = list(self._executor().map(job, sizes, chunk_seeds))
+            for part_total, part_sq, part_n in parts:
+                total += part_total
+                total_sq += part_sq
+                n += part_n
+            if target_stderr is not None and _result(total, total_sq, n).stderr <= target_stderr:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return _result(total, total_sq, n)
+
+    async def estimate_async(self, *args, **kwargs) -> EquityResult:
+        """`estimate` off the event loop, for async request handlers."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.estimate, *args, **kwargs))
+
+
+equity_engine = EquityEngine()
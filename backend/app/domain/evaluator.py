@@ -0,0 +1,182 @@
+"""Table-driven hand evaluator for 5, 6 and 7 card hands.
+
+Cards use the integer encoding from `cards` (``rank_index * 4 + suit_index``).
+Every hand maps to a single comparable integer strength::
+
+    strength = category << 20 | k1 << 16 | k2 << 12 | k3 << 8 | k4 << 4 | k5
+
+where category follows `_best_five_from_seven` (8=straight_flush .. 0=high)
+and k1..k5 are the tiebreak rank values (2..14, wheel straight high = 5).
+Higher strength wins; equal strength splits.
+
+Two tables are built once at import:
+
+- a rank table keyed by ``sum(5 ** rank)`` (a base-5 rank-count signature,
+  unique for counts <= 4) covering every 5-7 card rank multiset;
+- a flush table indexed by the 13-bit rank mask of the flush suit.
+"""
+from __future__ import annotations
+
+from itertools import combinations
+from typing import Dict, List, Sequence, Tuple
+
+from .cards import CARD_INDEX
+
+
+HAND_NAMES: Dict[int, str] = {
+    8: "straight_flush",
+    7: "four_of_a_kind",
+    6: "full_house",
+    5: "flush",
+    4: "straight",
+    3: "three_of_a_kind",
+    2: "two_pair",
+    1: "one_pair",
+    0: "high_card",
+}
+
+# Number of tiebreak ranks carried by each category.
+KICKER_COUNT: Dict[int, int] = {8: 1, 7: 2, 6: 2, 5: 5, 4: 1, 3: 3, 2: 3, 1: 4, 0: 5}
+
+CATEGORY_SHIFT = 20
+
+# Per-card contributions: base-5 rank signature and a nibble-packed suit counter.
+RANK_KEY: List[int] = [5 ** (c >> 2) for c in range(52)]
+SUIT_INC: List[int] = [1 << (4 * (c & 3)) for c in range(52)]
+RANK_BIT: List[int] = [1 << (c >> 2) for c in range(52)]
+
+
+def pack(category: int, kickers: Sequence[int]) -> int:
+    strength = category << CATEGORY_SHIFT
+    shift = 16
+    for k in kickers:
+        strength |= k << shift
+        shift -= 4
+    return strength
+
+
+def decode(strength: int) -> Tuple[int, Tuple[int, ...]]:
+    """Inverse of `pack`: (category, tiebreak ranks)."""
+    category = strength >> CATEGORY_SHIFT
+    n = KICKER_COUNT.get(category, 0)
+    return category, tuple((strength >> (16 - 4 * i)) & 0xF for i in range(n))
+
+
+def category_of(strength: int) -> int:
+    return strength >> CATEGORY_SHIFT
+
+
+def describe(strength: int) -> Dict:
+    category, ranks = decode(strength)
+    return {"category": HAND_NAMES.get(category, "unknown"), "ranks": list(ranks)}
+
+
+def _straight_high(mask: int) -> int:
+    """Highest straight (rank value) contained in a 13-bit rank mask, 0 if none."""
+    for top in range(12, 3, -1):
+        window = 0x1F << (top - 4)
+        if mask & window == window:
+            return top + 2
+    # Wheel: A-2-3-4-5
+    if mask & 0x100F == 0x100F:
+        return 5
+    return 0
+
+
+STRAIGHT_HIGH: List[int] = [_straight_high(m) for m in range(1 << 13)]
+
+
+def _rank_strength(present: List[int], pairs: List[int], trips: List[int], quads: List[int], mask: int) -> int:
+    """Strength of a rank multiset ignoring flushes; rank lists are descending values."""
+    if quads:
+        quad = quads[0]
+        return pack(7, (quad, next(v for v in present if v != quad)))
+    if trips and (pairs or len(trips) >= 2):
+        return pack(6, (trips[0], max(pairs[:1] + trips[1:2])))
+    s_high = STRAIGHT_HIGH[mask]
+    if s_high:
+        return pack(4, (s_high,))
+    if trips:
+        trip = trips[0]
+        return pack(3, (trip, *[v for v in present if v != trip][:2]))
+    if len(pairs) >= 2:
+        high_pair, low_pair = pairs[0], pairs[1]
+        # Kicker may come from a third pair
+        kicker = next((v for v in present if v != high_pair and v != low_pair), 0)
+        return pack(2, (high_pair, low_pair, kicker))
+    if pairs:
+        pair = pairs[0]
+        return pack(1, (pair, *[v for v in present if v != pair][:3]))
+    return pack(0, present[:5])
+
+
+def _flush_strength(mask: int) -> int:
+    sf_high = STRAIGHT_HIGH[mask]
+    if sf_high:
+        return pack(8, (sf_high,))
+    top5 = [r + 2 for r in range(12, -1, -1) if mask >> r & 1][:5]
+    return pack(5, top5)
+
+
+def _build_rank_table() -> Dict[int, int]:
+    """Walk every 5-7 card rank multiset from the ace down, tracking groups as we go."""
+    table: Dict[int, int] = {}
+    present: List[int] = []
+    groups: Dict[int, List[int]] = {2: [], 3: [], 4: []}
+
+    def walk(rank: int, total: int, key: int, mask: int) -> None:
+        if rank < 0:
+            if total >= 5:
+                table[key] = _rank_strength(present, groups[2], groups[3], groups[4], mask)
+            return
+        for n in range(min(4, 7 - total) + 1):
+            if n:
+                present.append(rank + 2)
+                if n > 1:
+                    groups[n].append(rank + 2)
+                walk(rank - 1, total + n, key + n * 5 ** rank, mask | 1 << rank)
+                present.pop()
+                if n > 1:
+                    groups[n].pop()
+            else:
+                walk(rank - 1, total, key, mask)
+
+    walk(12, 0, 0, 0)
+    return table
+
+
+def _build_flush_table() -> List[int]:
+    table = [0] * (1 << 13)
+    for size in (5, 6, 7):
+        for ranks in combinations(range(13), size):
+            mask = sum(1 << r for r in ranks)
+            table[mask] = _flush_strength(mask)
+    return table
+
+
+RANK_TABLE: Dict[int, int] = _build_rank_table()
+FLUSH_TABLE: List[int] = _build_flush_table()
+
+
+def evaluate(cards: Sequence[int]) -> int:
+    """Strength of the best five-card hand within 5-7 integer cards."""
+    key = 0
+    suit_counts = 0
+    for c in cards:
+        key += RANK_KEY[c]
+        suit_counts += SUIT_INC[c]
+    # A nibble reaches bit 3 after +3 only when that suit holds >= 5 cards.
+    flush_bits = (suit_counts + 0x3333) & 0x8888
+    if flush_bits:
+        suit = (flush_bits.bit_length() >> 2) - 1
+        mask = 0
+        for c in cards:
+            if c & 3 == suit:
+                mask |= RANK_BIT[c]
+        return FLUSH_TABLE[mask]
+    return RANK_TABLE[key]
+
+
+def evaluate_strs(cards: Sequence[str]) -> int:
+    """`evaluate` for 2-char card strings ("As", "Td", ...)."""
+    return evaluate([CARD_INDEX[c] for c in cards])
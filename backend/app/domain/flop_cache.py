@@ -0,0 +1,285 @@
+"""Board-level analysis cached per canonical flop.
+
+Coaching keeps asking the same flop questions: how the 1,326 combos split
+into made-hand categories, and how one range fares against another. Both
+answers depend on the flop only up to a suit relabelling (for ranges
+written as hand classes), so they are keyed by `flop_key`, the same
+1,755-class canonicalization behind `classify_board`, and computed on a
+representative board of that class.
+
+`FlopCache` is two tiers:
+
+- an in-process LRU (`OrderedDict`, like `InMemorySessionStore`);
+- a SQLite file under `CACHE_DIR` shared by every worker on the host. It is
+  WAL mode, keyed by ``(kind, key)``, and values are stored as JSON.
+
+Misses are computed, written to both tiers, and returned. Equity estimates
+are seeded from the key, so any worker computing the same spot stores the
+same value. The warmup job fills the disk tier for all 1,755 flops:
+
+    python -m backend.app.domain.flop_cache --workers 4 --ranges "22+,A2s+,KTs+,QTs+,JTs,ATo+,KJo+" "any"
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.config import FLOP_CACHE_ENTRIES, FLOP_CACHE_PATH
+from .batch_eval import evaluate_batch
+from .board_features import flop_key
+from .cards import CARD_INDEX, SUITS, Card, mask_of, to_ints
+from .evaluator import CATEGORY_SHIFT, HAND_NAMES
+from .ranges import COMBOS, RangeSpec, parse_range, unblocked
+
+
+# Bump whenever a computation below changes so stale disk entries are ignored.
+CACHE_VERSION = 1
+RVR_SAMPLES = 20_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS flop_cache (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+"""
+
+
+def board_of_key(key: str) -> List[int]:
+    """A representative flop for a `flop_key` (pattern letters a/b/c become the first suits)."""
+    return [CARD_INDEX[rank + SUITS["abc".index(letter)]] for rank, letter in zip(key[:3], key[3:6])]
+
+
+def all_flop_keys() -> List[str]:
+    return sorted({flop_key(flop) for flop in combinations(range(52), 3)})
+
+
+def _range_key(spec: Optional[str]) -> Optional[str]:
+    """Canonical text of a class-level range, or None when it names specific cards (not suit-symmetric)."""
+    if spec is None or not spec.strip() or spec.strip() == "any":
+        return "any"
+    tokens = sorted(t.strip() for t in spec.split(",") if t.strip())
+    if any(len(t.split(":")[0]) == 4 for t in tokens):
+        return None
+    return ",".join(tokens)
+
+
+def category_distribution(board: Sequence[int]) -> Dict[str, float]:
+    """Share of the unblocked combos making each hand category on `board` (3-5 cards)."""
+    live = np.flatnonzero(unblocked(mask_of(board)))
+    cards = np.empty((len(live), 2 + len(board)), dtype=np.int8)
+    cards[:, :2] = COMBOS[live]
+    cards[:, 2:] = board
+    counts = np.bincount(evaluate_batch(cards) >> CATEGORY_SHIFT, minlength=len(HAND_NAMES))
+    return {HAND_NAMES[c]: round(float(counts[c]) / len(live), 6) for c in sorted(HAND_NAMES, reverse=True)}
+
+
+def range_vs_range(board: Sequence[int], range_a: RangeSpec, range_b: RangeSpec, samples: int = RVR_SAMPLES, seed: int = 0) -> Dict:
+    """Monte Carlo all-in equity of `range_a` vs `range_b` from the flop to the river."""
+    rng = np.random.default_rng(seed)
+    dead = unblocked(mask_of(board))
+    weights = []
+    for spec in (range_a, range_b):
+        w = parse_range(None if spec == "any" else spec) * dead
+        if w.sum() <= 0:
+            return {"equity": None, "samples": 0}
+        weights.append(w / w.sum())
+    a = rng.choice(len(COMBOS), size=samples, p=weights[0])
+    b = rng.choice(len(COMBOS), size=samples, p=weights[1])
+    hole_a, hole_b = COMBOS[a], COMBOS[b]
+    # Redraw b where it collides with a; give up on rows that never resolve (disjoint ranges)
+    for _ in range(50):
+        clash = (hole_a[:, :, None] == hole_b[:, None, :]).any(axis=(1, 2))
+        if not clash.any():
+            break
+        b[clash] = rng.choice(len(COMBOS), size=int(clash.sum()), p=weights[1])
+        hole_b = COMBOS[b]
+    keep = ~(hole_a[:, :, None] == hole_b[:, None, :]).any(axis=(1, 2))
+    hole_a, hole_b = hole_a[keep], hole_b[keep]
+    n = len(hole_a)
+    if not n:
+        return {"equity": None, "samples": 0}
+    keys = rng.random((n, 52), dtype=np.float32)
+    rows = np.arange(n)[:, None]
+    keys[:, list(board)] = 2.0
+    keys[rows, hole_a] = 2.0
+    keys[rows, hole_b] = 2.0
+    runout = np.argpartition(keys, 2, axis=1)[:, :2].astype(np.int8)
+    shared = np.concatenate([np.broadcast_to(np.array(board, dtype=np.int8), (n, len(board))), runout], axis=1)
+    ea = evaluate_batch(np.concatenate([hole_a, shared], axis=1))
+    eb = evaluate_batch(np.concatenate([hole_b, shared], axis=1))
+    scores = (ea > eb) + 0.5 * (ea == eb)
+    return {"equity": round(float(scores.mean()), 4), "stderr": round(float(scores.std() / np.sqrt(n)), 5), "samples": n}
+
+
+class FlopCache:
+    def __init__(self, path: Optional[str] = FLOP_CACHE_PATH, max_entries: int = FLOP_CACHE_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._lru: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._counts = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(SCHEMA)
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                # Read-only or unavailable cache dir: run memory-only
+                self.path = None
+        return self._conn
+
+    def _remember(self, ident: Tuple[str, str], value: Dict) -> None:
+        self._lru[ident] = value
+        self._lru.move_to_end(ident)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get(self, kind: str, key: str, compute: Callable[[], Dict]) -> Dict:
+        ident = (kind, key)
+        with self._lock:
+            value = self._lru.get(ident)
+            if value is not None:
+                self._lru.move_to_end(ident)
+                self._counts["hits"] += 1
+                return value
+            db = self._db()
+            if db is not None:
+                row = db.execute("SELECT version, value FROM flop_cache WHERE kind = ? AND key = ?", ident).fetchone()
+                if row is not None and row[0] == CACHE_VERSION:
+                    value = json.loads(row[1])
+                    self._remember(ident, value)
+                    self._counts["disk_hits"] += 1
+                    return value
+        # Compute outside the lock; a concurrent miss on the same spot stores the same seeded value
+        value = compute()
+        self.put(kind, key, value)
+        with self._lock:
+            self._counts["misses"] += 1
+        return value
+
+    def put(self, kind: str, key: str, value: Dict) -> None:
+        with self._lock:
+            self._remember((kind, key), value)
+            db = self._db()
+            if db is not None:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO flop_cache (kind, key, version, value) VALUES (?, ?, ?, ?)",
+                        (kind, key, CACHE_VERSION, json.dumps(value, separators=(",", ":"))),
+                    )
+
+    def put_many(self, kind: str, items: Sequence[Tuple[str, Dict]]) -> None:
+        """Write many entries to disk in one transaction (the warmup path); the LRU is left alone."""
+        with self._lock:
+            db = self._db()
+            if db is not None:
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO flop_cache (kind, key, version, value) VALUES (?, ?, ?, ?)",
+                        [(kind, key, CACHE_VERSION, json.dumps(v, separators=(",", ":"))) for key, v in items],
+                    )
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._counts, "resident": len(self._lru)}
+
+    # --- Cached board questions ---
+
+    def categories(self, board: Sequence[Card]) -> Dict:
+        key = flop_key(board)
+        return self.get("categories", key, lambda: category_distribution(board_of_key(key)))
+
+    def equity(self, board: Sequence[Card], range_a: Optional[str], range_b: Optional[str]) -> Dict:
+        """Range-vs-range flop equity; ranges naming specific cards bypass the cache."""
+        key = flop_key(board)
+        ra, rb = _range_key(range_a), _range_key(range_b)
+        if ra is None or rb is None:
+            return range_vs_range(to_ints(board[:3]), range_a, range_b)
+        ident = f"{key}|{ra}|{rb}"
+        seed = zlib.crc32(ident.encode())
+        return self.get("rvr", ident, lambda: range_vs_range(board_of_key(key), ra, rb, seed=seed))
+
+
+_cache: Optional[FlopCache] = None
+_cache_lock = threading.Lock()
+
+
+def flop_cache() -> FlopCache:
+    """Process-wide cache instance."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FlopCache()
+        return _cache
+
+
+def _warm_chunk(keys: List[str], ranges: Optional[Tuple[str, str]]) -> List[Tuple[str, str, Dict]]:
+    out = []
+    for key in keys:
+        board = board_of_key(key)
+        out.append(("categories", key, category_distribution(board)))
+        if ranges is not None:
+            ra, rb = _range_key(ranges[0]), _range_key(ranges[1])
+            ident = f"{key}|{ra}|{rb}"
+            out.append(("rvr", ident, range_vs_range(board, ra, rb, seed=zlib.crc32(ident.encode()))))
+    return out
+
+
+def warm(cache: FlopCache, ranges: Optional[Tuple[str, str]] = None, workers: int = 1, chunk: int = 64) -> int:
+    """Compute every flop class into `cache`'s disk tier; returns entries written."""
+    keys = all_flop_keys()
+    chunks = [keys[i:i + chunk] for i in range(0, len(keys), chunk)]
+    if workers > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            results = pool.map(_warm_chunk, chunks, [ranges] * len(chunks))
+            written = 0
+            for rows in results:
+                written += _store(cache, rows)
+            return written
+    return sum(_store(cache, _warm_chunk(c, ranges)) for c in chunks)
+
+
+def _store(cache: FlopCache, rows: List[Tuple[str, str, Dict]]) -> int:
+    by_kind: Dict[str, List[Tuple[str, Dict]]] = {}
+    for kind, key, value in rows:
+        by_kind.setdefault(kind, []).append((key, value))
+    for kind, items in by_kind.items():
+        cache.put_many(kind, items)
+    return len(rows)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Prefill the flop cache for all 1,755 flop classes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--ranges", nargs=2, metavar=("RANGE_A", "RANGE_B"), help="also cache this range-vs-range equity on every flop")
+    parser.add_argument("--path", default=FLOP_CACHE_PATH)
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    written = warm(FlopCache(args.path), tuple(args.ranges) if args.ranges else None, args.workers)
+    print(f"wrote {written} entries to {args.path} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,228 @@
 from __future__ import annotations
 
+import math
+import threading
 import uuid
-from typing import Dict, Optional
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
 
+from ..core.config import BATCH_MAX_OPS, DB_PATH, LOCK_STRIPES, SESSION_MAX_ENTRIES, SESSION_TTL_SECONDS, WORKER_COUNT, WORKER_INDEX
+from ..core.encoding import dumps
+from ..core.metrics import ENGINE_SECONDS, timed
+from . import range_engine
+from .persistence import SessionRepository
 from .poker_adapter import PokerAdapter
+from .session_store import EVICTED, EXPIRED, InMemorySessionStore, SessionStore, shard_for
+from .villain import DEFAULT_VILLAIN, VILLAIN_MODELS
+
+
+HERO_ACTIONS = ("fold", "call", "check", "bet", "raise")
+
+
+def _valid_action(action, size) -> bool:
+    """A hero action the engine knows, with no size or a finite numeric one."""
+    if action not in HERO_ACTIONS:
+        return False
+    if size is None:
+        return True
+    return isinstance(size, (int, float)) and not isinstance(size, bool) and math.isfinite(size)
+
+
+def _per_session(method):
+    """Run `method(self, session_id, ...)` holding that session's stripe lock."""
+    @wraps(method)
+    def wrapper(self: "GameManager", session_id: str, *args, **kwargs):
+        with self._locks[hash(session_id) % len(self._locks)]:
+            return method(self, session_id, *args, **kwargs)
+    return wrapper
 
 
 class GameManager:
-    def __init__(self) -> None:
-        self.sessions: Dict[str, PokerAdapter] = {}
+    """Session registry and entry point for every game operation.
+
+    Sync routes run in Starlette's threadpool, so calls can race. Each
+    session maps to one of `lock_stripes` locks. Lookup, mutation and state
+    building for a session all happen under that lock, so actions on the same
+    session are linearized. Sessions on different stripes proceed in parallel.
+    """
 
-    def new_game(self, *, small_blind: float, big_blind: float, stack: float, seed: int, num_players: int = 2) -> Dict:
-        session_id = str(uuid.uuid4())
-        adapter = PokerAdapter(small_blind=small_blind, big_blind=big_blind, stack=stack, seed=seed, num_players=num_players)
-        self.sessions[session_id] = adapter
+    def __init__(
+        self,
+        store: Optional[SessionStore] = None,
+        repository: Optional[SessionRepository] = None,
+        shard: Tuple[int, int] = (WORKER_INDEX, WORKER_COUNT),
+        lock_stripes: int = LOCK_STRIPES,
+    ) -> None:
+        if store is None:
+            store = InMemorySessionStore(max_entries=SESSION_MAX_ENTRIES, ttl_seconds=SESSION_TTL_SECONDS)
+        self.store: SessionStore = store
+        self.repository = repository
+        # (index, count): only mint session ids that `shard_for` maps to this worker
+        self.shard = shard
+        self._locks = [threading.Lock() for _ in range(max(1, lock_stripes))]
+
+    def _new_session_id(self) -> str:
+        index, count = self.shard
+        while True:
+            session_id = str(uuid.uuid4())
+            if count <= 1 or shard_for(session_id, count) == index:
+                return session_id
+
+    @timed(ENGINE_SECONDS, "session_lookup")
+    def _lookup(self, session_id: str) -> Optional[PokerAdapter]:
+        adapter = self.store.get(session_id)
+        if adapter is None and self.repository is not None:
+            # Evicted, expired or from before a restart: rebuild from SQLite
+            adapter = self.repository.load(session_id)
+            if adapter is not None:
+                self.store.put(session_id, adapter)
+        return adapter
+
+    def _missing(self, session_id: str) -> Dict:
+        refusal = self.repository.refusal(session_id) if self.repository is not None else None
+        if refusal:
+            return {"error": refusal}
+        reason = self.store.dropped_reason(session_id)
+        if reason == EVICTED:
+            return {"error": "SESSION_EVICTED"}
+        if reason == EXPIRED:
+            return {"error": "SESSION_EXPIRED"}
+        return {"error": "SESSION_NOT_FOUND"}
+
+    def new_game(
+        self,
+        *,
+        small_blind: float,
+        big_blind: float,
+        stack: float,
+        seed: int,
+        num_players: int = 2,
+        villain_model: Optional[str] = None,
+    ) -> Dict:
+        try:
+            adapter = PokerAdapter(
+                small_blind=small_blind,
+                big_blind=big_blind,
+                stack=stack,
+                seed=seed,
+                num_players=num_players,
+                villain_model=villain_model or DEFAULT_VILLAIN,
+            )
+        except ValueError:
+            return {"error": "UNKNOWN_VILLAIN_MODEL", "villainModels": sorted(VILLAIN_MODELS)}
+        session_id = self._new_session_id()
+        self.store.put(session_id, adapter)
+        if self.repository is not None:
+            self.repository.save_session(session_id, adapter, seed)
         return {"sessionId": session_id, "state": adapter.get_state(session_id)}
 
-    def apply_action(self, session_id: str, action: str, size: Optional[float]) -> Dict:
-        adapter = self.sessions.get(session_id)
+    # `since` is the client's last `stateVersion`; when given, responses are deltas (see state_delta)
+    @_per_session
+    def apply_action(self, session_id: str, action: str, size: Optional[float], since: Optional[int] = None) -> Dict:
+        adapter = self._lookup(session_id)
         if not adapter:
-            return {"error": "SESSION_NOT_FOUND"}
+            return self._missing(session_id)
+        if not _valid_action(action, size):
+            return {"error": "INVALID_ACTION", "actions": list(HERO_ACTIONS)}
+        self._act(session_id, adapter, action, size)
+        return {**adapter.state_since(session_id, since), "aiActionApplied": True}
+
+    def _act(self, session_id: str, adapter: PokerAdapter, action: str, size: Optional[float]) -> None:
         adapter.apply_hero_action(action, size)
-        return {"state": adapter.get_state(session_id), "aiActionApplied": True}
+        if self.repository is not None:
+            self.repository.record_action(session_id, adapter, action, size)
+
+    def _reset(self, session_id: str, adapter: PokerAdapter, seed: Optional[int]) -> None:
+        adapter.reset_hand(seed=seed)
+        if self.repository is not None:
+            self.repository.save_hand(session_id, adapter)
 
-    def get_state(self, session_id: str) -> Dict:
-        adapter = self.sessions.get(session_id)
+    @_per_session
+    def get_state(self, session_id: str, since: Optional[int] = None) -> Dict:
+        adapter = self._lookup(session_id)
         if not adapter:
-            return {"error": "SESSION_NOT_FOUND"}
-        return {"state": adapter.get_state(session_id)}
+            return self._missing(session_id)
+        return adapter.state_since(session_id, since)
 
-    def reset_game(self, session_id: str, seed: Optional[int] = None) -> Dict:
-        adapter = self.sessions.get(session_id)
+    @_per_session
+    def get_state_json(self, session_id: str, since: Optional[int] = None) -> bytes:
+        """`get_state` as an encoded response body; full states come from the adapter's byte cache."""
+        adapter = self._lookup(session_id)
         if not adapter:
-            return {"error": "SESSION_NOT_FOUND"}
-        adapter.reset_hand(seed=seed)
-        return {"state": adapter.get_state(session_id)}
+            return dumps(self._missing(session_id))
+        if since is None:
+            return b'{"state":' + adapter.state_json(session_id) + b"}"
+        return dumps(adapter.state_since(session_id, since))
+
+    @_per_session
+    def reset_game(self, session_id: str, seed: Optional[int] = None, since: Optional[int] = None) -> Dict:
+        adapter = self._lookup(session_id)
+        if not adapter:
+            return self._missing(session_id)
+        self._reset(session_id, adapter, seed)
+        return adapter.state_since(session_id, since)
+
+    @_per_session
+    def apply_batch(
+        self,
+        session_id: str,
+        ops: List[Dict],
+        include_intermediate: bool = False,
+        since: Optional[int] = None,
+    ) -> Dict:
+        """Apply `{"action", "size"}` and `{"reset": true, "seed"}` ops in order.
+
+        Ops are validated before any is applied (a known action and a finite
+        numeric size or none), so a malformed batch leaves the session and
+        its action log untouched.
+        """
+        adapter = self._lookup(session_id)
+        if not adapter:
+            return self._missing(session_id)
+        if not isinstance(ops, list):
+            return {"error": "INVALID_OP", "index": None}
+        if len(ops) > BATCH_MAX_OPS:
+            return {"error": "BATCH_TOO_LARGE", "maxOps": BATCH_MAX_OPS}
+        for index, op in enumerate(ops):
+            if not isinstance(op, dict) or not (op.get("reset") or _valid_action(op.get("action"), op.get("size"))):
+                return {"error": "INVALID_OP", "index": index}
+        states = []
+        for op in ops:
+            if op.get("reset"):
+                self._reset(session_id, adapter, op.get("seed"))
+            else:
+                self._act(session_id, adapter, op["action"], op.get("size"))
+            if include_intermediate:
+                states.append(adapter.get_state(session_id))
+        result = {**adapter.state_since(session_id, since), "applied": len(ops)}
+        if include_intermediate:
+            result["states"] = states
+        return result
+
+    @_per_session
+    def estimate_range(self, session_id: str, perspective: str) -> Dict:
+        adapter = self._lookup(session_id)
+        if not adapter:
+            return self._missing(session_id)
+        return range_engine.estimate(adapter, perspective)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.store.stats(), "worker": self.shard[0]}
+
+    def start_sweeper(self, interval: float) -> None:
+        start = getattr(self.store, "start_sweeper", None)
+        if start:
+            start(interval)
+
+    def stop_sweeper(self) -> None:
+        stop = getattr(self.store, "stop_sweeper", None)
+        if stop:
+            stop()
+
+    def close(self) -> None:
+        """Flush pending persistence writes."""
+        if self.repository is not None:
+            self.repository.close()
 
 
-game_manager = GameManager()
+game_manager = GameManager(repository=SessionRepository(DB_PATH) if DB_PATH else None)
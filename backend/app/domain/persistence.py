@@ -0,0 +1,276 @@
+"""SQLite session persistence: a snapshot per hand plus an append-only action log.
+
+Writes never touch SQLite on the request path. They are queued and a single
+writer thread commits them in batches (one transaction per batch) to a
+WAL-mode database. Because the engine is deterministic, a session is rebuilt
+from the latest hand snapshot by replaying that hand's logged hero actions.
+
+A rebuild waits only for that session's own queued writes. A batch that
+hits a transient SQLite error is retried up to `WRITE_ATTEMPTS` times; a
+batch that still fails is written again row by row, so only the sessions
+whose own rows cannot be stored are marked lost. `load` refuses those
+rather than replaying a log with holes in it. `load` also
+refuses a snapshot taken against different villain data (see `villain`),
+since its replay would diverge.
+
+Tables:
+    sessions(id, config, created)                   one row per session
+    hands(session_id, hand_no, snapshot)            `PokerAdapter.snapshot()` at hand start
+    actions(session_id, hand_no, idx, action, size) hero actions within a hand
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .poker_adapter import PokerAdapter
+from .villain import VillainDataChanged
+
+
+logger = logging.getLogger(__name__)
+
+# Commit attempts per batch, and the first retry delay (doubled per attempt)
+WRITE_ATTEMPTS = 3
+RETRY_DELAY = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hands (
+    session_id TEXT NOT NULL,
+    hand_no INTEGER NOT NULL,
+    snapshot TEXT NOT NULL,
+    PRIMARY KEY (session_id, hand_no)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS actions (
+    session_id TEXT NOT NULL,
+    hand_no INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    size REAL,
+    PRIMARY KEY (session_id, hand_no, idx)
+) WITHOUT ROWID;
+"""
+
+_INSERTS = {
+    "session": "INSERT OR REPLACE INTO sessions (id, config, created) VALUES (?, ?, ?)",
+    "hand": "INSERT OR REPLACE INTO hands (session_id, hand_no, snapshot) VALUES (?, ?, ?)",
+    "action": "INSERT OR REPLACE INTO actions (session_id, hand_no, idx, action, size) VALUES (?, ?, ?, ?, ?)",
+}
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _size(size) -> Optional[float]:
+    """A logged bet size: None or a finite float."""
+    if size is None:
+        return None
+    size = float(size)
+    if not math.isfinite(size):
+        raise ValueError(f"size must be finite, got {size}")
+    return size
+
+
+def connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SessionRepository:
+    def __init__(self, path: str, flush_interval: float = 0.05, batch_size: int = 1000) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        conn = connect(path)
+        conn.executescript(SCHEMA)
+        conn.close()
+        self._queue: "queue.Queue[Optional[Tuple[str, tuple]]]" = queue.Queue()
+        # session id -> writes queued but not yet committed; guarded by `_settled`
+        self._pending: Dict[str, int] = {}
+        # session id -> why `load` refuses it (an error code for the API)
+        self._refused: Dict[str, str] = {}
+        self._settled = threading.Condition()
+        # One read connection per request thread, reused across loads
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._writer = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self._writer.start()
+
+    # --- Producers (request path: enqueue only) ---
+    def save_session(self, session_id: str, adapter: PokerAdapter, seed: int) -> None:
+        config = {
+            "sb": adapter.sb,
+            "bb": adapter.bb,
+            "stack": adapter.start_stack,
+            "seed": seed,
+            "numPlayers": adapter.num_players,
+            "villainModel": adapter.villain_model,
+        }
+        self._enqueue("session", (session_id, _dumps(config), time.time()))
+        self.save_hand(session_id, adapter)
+
+    def save_hand(self, session_id: str, adapter: PokerAdapter) -> None:
+        self._enqueue("hand", (session_id, adapter.hand_no, _dumps(adapter.snapshot())))
+
+    def record_action(self, session_id: str, adapter: PokerAdapter, action: str, size: Optional[float]) -> None:
+        # Coerce here so a bad value fails for this session alone instead of poisoning the writer's batch
+        try:
+            params = (session_id, adapter.hand_no, adapter.hand_ops, str(action), _size(size))
+        except (TypeError, ValueError):
+            logger.error("cannot log action %r (size %r) for session %s; it can no longer be rebuilt", action, size, session_id)
+            self._refuse([session_id], "SESSION_LOST")
+            return
+        self._enqueue("action", params)
+
+    def _enqueue(self, kind: str, params: tuple) -> None:
+        with self._settled:
+            self._pending[params[0]] = self._pending.get(params[0], 0) + 1
+        self._queue.put((kind, params))
+
+    def flush(self) -> None:
+        """Block until every queued write is committed."""
+        self._queue.join()
+
+    def refusal(self, session_id: str) -> Optional[str]:
+        """Why the session cannot be rebuilt: SESSION_LOST (writes dropped) or VILLAIN_DATA_CHANGED; None if it can."""
+        with self._settled:
+            return self._refused.get(session_id)
+
+    def _refuse(self, sessions, reason: str) -> None:
+        with self._settled:
+            for session_id in sessions:
+                self._refused[session_id] = reason
+
+    def _wait_for(self, session_id: str) -> None:
+        with self._settled:
+            while self._pending.get(session_id):
+                self._settled.wait()
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        for conn in self._readers:
+            conn.close()
+        self._readers.clear()
+
+    # --- Writer thread ---
+    def _run(self) -> None:
+        conn = connect(self.path)
+        stop = False
+        while not stop:
+            batch: List[Optional[Tuple[str, tuple]]] = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            items = [item for item in batch if item is not None]
+            sessions = [params[0] for _, params in items]
+            try:
+                self._commit(conn, items)
+            finally:
+                with self._settled:
+                    for session_id in sessions:
+                        left = self._pending[session_id] - 1
+                        if left:
+                            self._pending[session_id] = left
+                        else:
+                            del self._pending[session_id]
+                    self._settled.notify_all()
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, items: List[Tuple[str, tuple]]) -> None:
+        rows: Dict[str, list] = {kind: [] for kind in _INSERTS}
+        for kind, params in items:
+            rows[kind].append(params)
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                with conn:
+                    for kind, params in rows.items():
+                        if params:
+                            conn.executemany(_INSERTS[kind], params)
+                return
+            except sqlite3.OperationalError:
+                # Busy, locked or I/O: worth another try
+                if attempt + 1 < WRITE_ATTEMPTS:
+                    logger.warning("session write batch failed (attempt %d of %d); retrying", attempt + 1, WRITE_ATTEMPTS, exc_info=True)
+                    time.sleep(RETRY_DELAY * 2 ** attempt)
+            except sqlite3.Error:
+                # A bad row fails the same way every time; find it below
+                logger.warning("session write batch failed; writing it row by row", exc_info=True)
+                break
+        self._commit_rows(conn, items)
+
+    def _commit_rows(self, conn: sqlite3.Connection, items: List[Tuple[str, tuple]]) -> None:
+        """One transaction per row, so a failing row refuses only its own session."""
+        lost = set()
+        for kind, params in items:
+            if params[0] in lost:
+                continue
+            try:
+                with conn:
+                    conn.execute(_INSERTS[kind], params)
+            except sqlite3.Error:
+                logger.error("dropped a %s write for session %s", kind, params[0], exc_info=True)
+                lost.add(params[0])
+        if lost:
+            self._refuse(lost, "SESSION_LOST")
+            logger.error("%d of %d sessions in a write batch can no longer be rebuilt", len(lost), len({p[0] for _, p in items}))
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect(self.path)
+            with self._settled:
+                self._readers.append(conn)
+        return conn
+
+    # --- Rebuild ---
+    def load(self, session_id: str) -> Optional[PokerAdapter]:
+        """Rebuild a session from its latest hand snapshot plus logged actions (None if unknown or refused)."""
+        # Only this session's queued writes matter; other sessions' backlog is not waited on
+        self._wait_for(session_id)
+        if self.refusal(session_id):
+            return None
+        conn = self._reader()
+        row = conn.execute(
+            "SELECT hand_no, snapshot FROM hands WHERE session_id = ? ORDER BY hand_no DESC LIMIT 1",
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        hand_no, snapshot = row
+        try:
+            adapter = PokerAdapter.from_snapshot(json.loads(snapshot))
+        except VillainDataChanged:
+            logger.warning("not replaying session %s: villain data changed since it was saved", session_id, exc_info=True)
+            self._refuse([session_id], "VILLAIN_DATA_CHANGED")
+            return None
+        actions = conn.execute(
+            "SELECT action, size FROM actions WHERE session_id = ? AND hand_no = ? AND idx > ? ORDER BY idx",
+            (session_id, hand_no, adapter.hand_ops),
+        ).fetchall()
+        for action, size in actions:
+            adapter.apply_hero_action(action, size)
+        return adapter
@@ -1,32 +1,79 @@
 from __future__ import annotations
 
 import random
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+from ..core.encoding import dumps
+from ..core.metrics import ENGINE_SECONDS, timed
+from .board_features import flop_texture
+from .cards import RANKS, SUITS, Card, generate_deck, mask_of, to_ints, to_strs
+from .evaluator import HAND_NAMES, decode, evaluate
+from .pots import award, side_pots, to_cents
+from .state_delta import diff_state
+from .villain import DEFAULT_VILLAIN, VillainDataChanged, resolve_villain
 
-RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
-SUITS = ["s", "h", "d", "c"]
 
+# A fresh, unshuffled deck in the integer card encoding (see `cards`)
+ORDERED_DECK = bytes(range(52))
+# Recent get_state payloads kept per adapter as bases for incremental responses
+STATE_RING = 4
 
-def generate_deck() -> List[str]:
-    return [r + s for r in RANKS for s in SUITS]
 
-
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
-    stack: float
+    # Chip amounts are integer cents; `stack`, `contributed` and `current_bet`
+    # are float views in display units
+    stack_c: int
     position: str  # "btn" or "bb"
-    cards: List[str] = field(default_factory=list)
+    hole: List[int] = field(default_factory=list)  # hole cards as ints 0..51
     seat: int = 0
     folded: bool = False
     active: bool = True
-    contributed: float = 0.0
-    current_bet: float = 0.0
+    contributed_c: int = 0
+    current_bet_c: int = 0
     is_ai: bool = False
 
+    @property
+    def stack(self) -> float:
+        return self.stack_c / 100
+
+    @stack.setter
+    def stack(self, value: float) -> None:
+        self.stack_c = to_cents(value)
+
+    @property
+    def contributed(self) -> float:
+        return self.contributed_c / 100
+
+    @contributed.setter
+    def contributed(self, value: float) -> None:
+        self.contributed_c = to_cents(value)
+
+    @property
+    def current_bet(self) -> float:
+        return self.current_bet_c / 100
+
+    @current_bet.setter
+    def current_bet(self, value: float) -> None:
+        self.current_bet_c = to_cents(value)
 
-@dataclass
+    @property
+    def cards(self) -> List[str]:
+        return to_strs(self.hole)
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        self.hole = to_ints(cards)
+
+    @property
+    def mask(self) -> int:
+        return mask_of(self.hole)
+
+
+@dataclass(slots=True)
 class GameState:
     session_id: str
     street: str
@@ -46,13 +93,40 @@ class PokerAdapter:
     Replace dealing/validation with PokerKit calls as integration progresses.
     """
 
-    def __init__(self, small_blind: float, big_blind: float, stack: float, seed: int, num_players: int = 2):
+    def __init__(
+        self,
+        small_blind: float,
+        big_blind: float,
+        stack: float,
+        seed: int,
+        num_players: int = 2,
+        villain_model: str = DEFAULT_VILLAIN,
+    ):
         self.sb = small_blind
         self.bb = big_blind
         self.start_stack = stack
+        # Villain decisions come from a named model in `villain` (raises ValueError if unknown)
+        self.villain_model = villain_model
+        self._villain = resolve_villain(villain_model)
+        # The engine keeps chips in integer cents and converts only when serializing
+        self.sb_c = to_cents(small_blind)
+        self.bb_c = to_cents(big_blind)
         self.rng = random.Random(seed)
-        self.deck = generate_deck()
-        self.rng.shuffle(self.deck)
+        # Deck is a preallocated array of card ints; dealing advances a pointer
+        self._deck = bytearray(ORDERED_DECK)
+        self._deck_pos = 0
+        self.rng.shuffle(self._deck)
+        # The shuffle is the only RNG consumer, so (seed, shuffles) pins the RNG state
+        self._rng_seed = seed
+        self._shuffles = 1
+        # Hand counter and hero actions applied this hand (for action-log replay)
+        self.hand_no = 0
+        self.hand_ops = 0
+        # Bumped by every mutation; get_state reports it as `stateVersion` and
+        # memoizes its payload (and the encoded JSON) per version
+        self.version = 0
+        self._recent_states: "deque[Tuple[int, Dict]]" = deque(maxlen=STATE_RING)
+        self._state_json: Optional[Tuple[int, str, bytes]] = None
         # Multi-player scaffolding (back-compat: hero/villain remain)
         self.num_players = max(2, min(9, int(num_players)))
         self.players: List[PlayerState] = []
@@ -62,7 +136,7 @@ class PokerAdapter:
             # default positions filled below for HU
             self.players.append(
                 PlayerState(
-                    stack=stack,
+                    stack_c=to_cents(stack),
                     position="",
                     seat=seat,
                     folded=False if seat in (0, 1) else True,
@@ -76,61 +150,104 @@ class PokerAdapter:
         # Back-compat references
         self.hero = self.players[0]
         self.villain = self.players[1]
-        self.board: List[str] = []
-        self.pot = 0.0
+        self._board: List[int] = []
+        self.pot_c = 0
         self.history: List[Dict] = []
         self.street = "preflop"
         # Turn/betting state scaffolding
         self.to_act: int = 0
-        self.current_bet: float = 0.0
+        self.current_bet_c = 0
         self.last_aggressor: Optional[int] = None
         self.raises_this_street: int = 0
         self._post_blinds_and_deal()
 
-    def _draw(self, n: int) -> List[str]:
-        out = self.deck[:n]
-        self.deck = self.deck[n:]
-        return out
+    @property
+    def board(self) -> List[str]:
+        return to_strs(self._board)
+
+    @board.setter
+    def board(self, cards: List[Card]) -> None:
+        self._board = to_ints(cards)
+        self.version += 1
+
+    def touch(self) -> None:
+        """Invalidate cached state after mutating fields outside the engine's own methods."""
+        self.version += 1
+
+    @property
+    def board_mask(self) -> int:
+        return mask_of(self._board)
+
+    @property
+    def pot(self) -> float:
+        return self.pot_c / 100
+
+    @pot.setter
+    def pot(self, value: float) -> None:
+        self.pot_c = to_cents(value)
+
+    @property
+    def current_bet(self) -> float:
+        return self.current_bet_c / 100
+
+    @current_bet.setter
+    def current_bet(self, value: float) -> None:
+        self.current_bet_c = to_cents(value)
+
+    def _commit(self, player: PlayerState, amount: int) -> None:
+        """Move `amount` cents from `player`'s stack into the pot."""
+        player.stack_c -= amount
+        player.contributed_c += amount
+        self.pot_c += amount
+
+    @property
+    def deck(self) -> List[str]:
+        """Undealt cards, in dealing order."""
+        return to_strs(self._deck[self._deck_pos:])
+
+    def _draw(self, n: int) -> List[int]:
+        pos = self._deck_pos
+        self._deck_pos = pos + n
+        return list(self._deck[pos:pos + n])
 
     def _post_blinds_and_deal(self) -> None:
-        # Post blinds
-        self.hero.stack -= self.sb
-        self.villain.stack -= self.bb
-        self.pot = self.sb + self.bb
-        self.history.append({"actor": "hero", "move": "post_sb", "size": self.sb, "street": "preflop"})
-        self.history.append({"actor": "villain", "move": "post_bb", "size": self.bb, "street": "preflop"})
         # Reset folds and deal hole cards in BTN order
         for p in self.players:
             p.folded = False
-            p.cards = []
-            p.contributed = 0.0
-            p.current_bet = 0.0
+            p.hole = []
+            p.contributed_c = 0
+            p.current_bet_c = 0
         order = [(self.btn_seat + i) % self.num_players for i in range(self.num_players)]
         for seat in order:
-            self.players[seat].cards = self._draw(2)
-        # Initialize per-round contributions and current bet (SB/BB)
-        self.hero.contributed = self.sb
-        self.villain.contributed = self.bb
-        self.hero.current_bet = self.sb
-        self.villain.current_bet = self.bb
-        self.current_bet = self.bb
-        # Initialize contributed/current_bet
-        self.hero.contributed = self.sb
-        self.villain.contributed = self.bb
-        self.hero.current_bet = self.sb
-        self.villain.current_bet = self.bb
-        self.current_bet = self.bb
+            self.players[seat].hole = self._draw(2)
+        # Post blinds
+        self.pot_c = 0
+        self._commit(self.hero, self.sb_c)
+        self._commit(self.villain, self.bb_c)
+        self.hero.current_bet_c = self.sb_c
+        self.villain.current_bet_c = self.bb_c
+        self.current_bet_c = self.bb_c
+        self.history.append({"actor": "hero", "move": "post_sb", "size": self.sb_c / 100, "street": "preflop"})
+        self.history.append({"actor": "villain", "move": "post_bb", "size": self.bb_c / 100, "street": "preflop"})
         # Set first to act preflop (HU: BTN acts first)
         self.to_act = self.btn_seat
 
+    @timed(ENGINE_SECONDS, "reset_hand")
     def reset_hand(self, seed: Optional[int] = None) -> None:
         """Start a new hand, preserving current stacks, repost blinds, and redeal."""
         if seed is not None:
             self.rng = random.Random(seed)
-        self.deck = generate_deck()
-        self.rng.shuffle(self.deck)
-        self.board = []
-        self.pot = 0.0
+            self._rng_seed = seed
+            self._shuffles = 0
+        self.version += 1
+        self._deck[:] = ORDERED_DECK
+        self._deck_pos = 0
+        self.rng.shuffle(self._deck)
+        self._shuffles += 1
+        self.hand_no += 1
+        self.hand_ops = 0
+        self._board = []
+        self.pot_c = 0
         self.history = []
         self.street = "preflop"
         # Rotate button seat and reassign positions (HU for now)
@@ -140,32 +257,112 @@ class PokerAdapter:
         for i, p in enumerate(self.players):
             p.folded = False if i in (0, 1) else True
             p.active = True
-            p.contributed = 0.0
-            p.current_bet = 0.0
-            p.cards = []
+            p.contributed_c = 0
+            p.current_bet_c = 0
+            p.hole = []
         # Reset betting state scaffolding
-        self.current_bet = 0.0
+        self.current_bet_c = 0
         self.last_aggressor = None
         self.raises_this_street = 0
         self.to_act = 0
         self._post_blinds_and_deal()
 
+    def snapshot(self) -> Dict:
+        """Compact, JSON-safe copy of the full engine state.
+
+        The RNG is recorded as (seed, shuffles since seeding) rather than its
+        Mersenne Twister state; `from_snapshot` replays the shuffles. Chip
+        amounts are integer cents (``"units": "cents"``); snapshots without
+        that key hold display-unit floats and are converted on load.
+        """
+        return {
+            "units": "cents",
+            "config": [self.sb, self.bb, self.start_stack, self.num_players],
+            "villainModel": self.villain_model,
+            "villainData": self._villain.data_identity(self),
+            "rng": [self._rng_seed, self._shuffles],
+            "deckPos": self._deck_pos,
+            "hand": [self.hand_no, self.hand_ops],
+            "version": self.version,
+            "btn": self.btn_seat,
+            "street": self.street,
+            "board": list(self._board),
+            "pot": self.pot_c,
+            "betting": [self.to_act, self.current_bet_c, self.last_aggressor, self.raises_this_street],
+            "players": [
+                [p.stack_c, p.position, list(p.hole), p.folded, p.active, p.contributed_c, p.current_bet_c, p.is_ai]
+                for p in self.players
+            ],
+            "history": [dict(e) for e in self.history],
+        }
+
+    @classmethod
+    def from_snapshot(cls, snap: Dict) -> "PokerAdapter":
+        sb, bb, stack, num_players = snap["config"]
+        seed, shuffles = snap["rng"]
+        adapter = cls(
+            small_blind=sb,
+            big_blind=bb,
+            stack=stack,
+            seed=seed,
+            num_players=num_players,
+            villain_model=snap.get("villainModel", DEFAULT_VILLAIN),
+        )
+        data = adapter._villain.data_identity(adapter)
+        if snap.get("villainData") != data:
+            raise VillainDataChanged(f"snapshot was played against {snap.get('villainData')}, this host has {data}")
+        for _ in range(shuffles - 1):
+            adapter._deck[:] = ORDERED_DECK
+            adapter.rng.shuffle(adapter._deck)
+        adapter._shuffles = shuffles
+        adapter._deck_pos = snap["deckPos"]
+        adapter.hand_no, adapter.hand_ops = snap["hand"]
+        adapter.version = snap.get("version", 0)
+        adapter.btn_seat = snap["btn"]
+        adapter.street = snap["street"]
+        adapter._board = list(snap["board"])
+        chips = int if snap.get("units") == "cents" else to_cents
+        adapter.pot_c = chips(snap["pot"])
+        adapter.to_act, current_bet, adapter.last_aggressor, adapter.raises_this_street = snap["betting"]
+        adapter.current_bet_c = chips(current_bet)
+        for p, row in zip(adapter.players, snap["players"]):
+            stack, p.position, hole, p.folded, p.active, contributed, current_bet, p.is_ai = row
+            p.stack_c, p.contributed_c, p.current_bet_c = chips(stack), chips(contributed), chips(current_bet)
+            p.hole = list(hole)
+        adapter.history = [dict(e) for e in snap["history"]]
+        return adapter
+
     def legal_actions(self) -> Dict:
         # Minimal legal set for HU preflop facing BB: fold/call/raise
-        min_raise = max(self.bb * 2.0, self.bb * 2.0)  # simple min-raise rule
-        return {"toAct": "hero", "legal": ["fold", "call", "raise"], "min": round(min_raise, 2), "max": round(self.hero.stack, 2)}
+        min_raise = self.bb_c * 2  # simple min-raise rule
+        return {"toAct": "hero", "legal": ["fold", "call", "raise"], "min": min_raise / 100, "max": self.hero.stack_c / 100}
 
     def get_state(self, session_id: str) -> Dict:
-        spr = (self.hero.stack + self.villain.stack) / self.pot if self.pot else 0.0
-        features = self.classify_board(self.board, spr)
+        """Client state payload, cached per version; treat it as read-only."""
+        if self._recent_states:
+            version, state = self._recent_states[-1]
+            if version == self.version and state["sessionId"] == session_id:
+                return state
+        state = self._build_state(session_id)
+        if self._recent_states and self._recent_states[-1][0] == self.version:
+            self._recent_states[-1] = (self.version, state)
+        else:
+            self._recent_states.append((self.version, state))
+        return state
+
+    @timed(ENGINE_SECONDS, "build_state")
+    def _build_state(self, session_id: str) -> Dict:
+        spr = (self.hero.stack_c + self.villain.stack_c) / self.pot_c if self.pot_c else 0.0
+        features = self.classify_board(self._board, spr)
         min_bet = self.recommended_bet_size(self.pot, features)
         state = {
             "sessionId": session_id,
+            "stateVersion": self.version,
             "street": self.street,
-            "hero": {"stack": round(self.hero.stack, 2), "cards": self.hero.cards, "position": self.hero.position},
-            "villain": {"stack": round(self.villain.stack, 2), "position": self.villain.position},
-            "board": list(self.board),
-            "pot": round(self.pot, 2),
+            "hero": {"stack": self.hero.stack_c / 100, "cards": self.hero.cards, "position": self.hero.position},
+            "villain": {"stack": self.villain.stack_c / 100, "position": self.villain.position},
+            "board": self.board,
+            "pot": self.pot_c / 100,
             "spr": round(spr, 2),
             "action": (
                 self.legal_actions()
@@ -173,22 +370,22 @@ class PokerAdapter:
                 else (
                     {"toAct": None, "legal": [], "min": 0.0, "max": 0.0}
                     if self.street == "showdown"
-                    else {"toAct": "hero", "legal": ["check", "bet"], "min": round(min_bet, 2), "max": round(self.hero.stack, 2)}
+                    else {"toAct": "hero", "legal": ["check", "bet"], "min": min_bet, "max": self.hero.stack_c / 100}
                 )
             ),
             "history": list(self.history),
             "metadata": {
-                "opponentType": "deterministic_mock",
+                "opponentType": self._villain.opponent_type,
                 "boardFeatures": features,
                 "players": [
                     {
                         "seat": p.seat,
-                        "stack": round(p.stack, 2),
+                        "stack": p.stack_c / 100,
                         "position": p.position,
                         "folded": p.folded,
                         "active": p.active,
-                        "contributed": round(p.contributed, 2),
-                        "current_bet": round(p.current_bet, 2),
+                        "contributed": p.contributed_c / 100,
+                        "current_bet": p.current_bet_c / 100,
                         # Only reveal hero cards for now
                         "cards": p.cards if p is self.hero else [],
                         "is_ai": p.is_ai,
@@ -196,38 +393,59 @@ class PokerAdapter:
                     for p in self.players
                 ],
                 "toActSeat": self.to_act,
-                "currentBet": round(self.current_bet, 2),
+                "currentBet": self.current_bet_c / 100,
             },
         }
         return state
 
+    def state_json(self, session_id: str) -> bytes:
+        """`get_state` pre-encoded as JSON, cached until the next mutation."""
+        cached = self._state_json
+        if cached is not None and cached[0] == self.version and cached[1] == session_id:
+            return cached[2]
+        state = self.get_state(session_id)
+        start = time.perf_counter()
+        body = dumps(state)
+        ENGINE_SECONDS.observe(time.perf_counter() - start, "encode_json")
+        self._state_json = (self.version, session_id, body)
+        return body
+
+    def state_since(self, session_id: str, version: Optional[int]) -> Dict:
+        """Current state as a delta against `version`, or ``{"state": ...}`` when that base is gone."""
+        base = None
+        if version is not None:
+            base = next((s for v, s in self._recent_states if v == version), None)
+        state = self.get_state(session_id)
+        if base is None or base["sessionId"] != session_id:
+            return {"state": state}
+        return diff_state(base, state)
+
+    @timed(ENGINE_SECONDS, "apply_action")
     def apply_hero_action(self, action: str, size: Optional[float] = None) -> None:
+        self.hand_ops += 1
+        self.version += 1
         if self.street == "preflop":
             if action == "fold":
                 self.history.append({"actor": "hero", "move": "fold", "size": None, "street": "preflop"})
                 self.street = "showdown"
+                self._award_uncontested(self.villain)
                 return
             if action == "call":
-                call_amt = self.bb - self.sb
-                call_amt = max(0.0, call_amt)
-                self.hero.stack -= call_amt
-                self.hero.contributed += call_amt
-                self.hero.current_bet = self.bb
-                self.current_bet = self.bb
-                self.pot += call_amt
-                self.history.append({"actor": "hero", "move": "call", "size": round(call_amt, 2), "street": "preflop"})
+                call_amt = max(0, self.bb_c - self.sb_c)
+                self._commit(self.hero, call_amt)
+                self.hero.current_bet_c = self.bb_c
+                self.current_bet_c = self.bb_c
+                self.history.append({"actor": "hero", "move": "call", "size": call_amt / 100, "street": "preflop"})
                 # Villain checks (completes round)
                 self.history.append({"actor": "villain", "move": "check", "size": None, "street": "preflop"})
                 self._advance_to_flop()
                 return
             if action == "raise":
-                bet = float(size or (self.bb * 2.5))
-                self.hero.stack -= bet - self.sb  # additional chips beyond SB
-                self.hero.contributed += bet - self.sb
-                self.hero.current_bet = bet
-                self.current_bet = bet
-                self.pot += bet - self.sb
-                self.history.append({"actor": "hero", "move": "raise", "size": round(bet, 2), "street": "preflop"})
+                bet = to_cents(size) if size else self.bb_c * 5 // 2
+                self._commit(self.hero, bet - self.sb_c)  # additional chips beyond SB
+                self.hero.current_bet_c = bet
+                self.current_bet_c = bet
+                self.history.append({"actor": "hero", "move": "raise", "size": bet / 100, "street": "preflop"})
                 # Villain responds deterministically via pot-odds
                 self._villain_preflop_response(bet)
                 return
@@ -235,29 +453,26 @@ class PokerAdapter:
         if self.street in ("flop", "turn"):
             if action in ("check",):
                 self.history.append({"actor": "hero", "move": action, "size": None, "street": self.street})
-                features = self.classify_board(self.board, (self.hero.stack + self.villain.stack) / self.pot if self.pot else 0.0)
-                v_action, v_size = self._villain_postflop_decide(features)
+                features = self.classify_board(self._board, (self.hero.stack_c + self.villain.stack_c) / self.pot_c if self.pot_c else 0.0)
+                v_action, v_size = self._villain.postflop_decide(self, features)
                 if v_action == "bet":
-                    bet = min(v_size, self.villain.stack)
+                    bet = min(to_cents(v_size), self.villain.stack_c)
                     if bet > 0:
-                        self.villain.stack -= bet
-                        self.villain.contributed += bet
-                        self.villain.current_bet = bet
-                        self.current_bet = bet
-                        self.pot += bet
-                    self.history.append({"actor": "villain", "move": "bet", "size": round(bet, 2), "street": self.street})
+                        self._commit(self.villain, bet)
+                        self.villain.current_bet_c = bet
+                        self.current_bet_c = bet
+                    self.history.append({"actor": "villain", "move": "bet", "size": bet / 100, "street": self.street})
                     # Deterministic hero response via pot odds
                     call_amt = bet
                     if self._hero_pot_odds_call(call_amt):
-                        self.hero.stack -= call_amt
-                        self.hero.contributed += call_amt
-                        self.hero.current_bet = bet
-                        self.pot += call_amt
-                        self.history.append({"actor": "hero", "move": "call", "size": round(call_amt, 2), "street": self.street})
+                        self._commit(self.hero, call_amt)
+                        self.hero.current_bet_c = bet
+                        self.history.append({"actor": "hero", "move": "call", "size": call_amt / 100, "street": self.street})
                         self._advance_street()
                     else:
                         self.history.append({"actor": "hero", "move": "fold", "size": None, "street": self.street})
                         self.street = "showdown"
+                        self._award_uncontested(self.villain)
                     return
                 else:
                     # Both check
@@ -265,25 +480,22 @@ class PokerAdapter:
                     self._advance_street()
                     return
             if action == "bet":
-                bet = float(size or round(self.pot * 0.33, 2))
-                self.hero.stack -= bet
-                self.hero.contributed += bet
-                self.hero.current_bet = bet
-                self.current_bet = bet
-                self.pot += bet
-                self.history.append({"actor": "hero", "move": "bet", "size": round(bet, 2), "street": self.street})
+                bet = to_cents(size) if size else (self.pot_c * 33 + 50) // 100
+                self._commit(self.hero, bet)
+                self.hero.current_bet_c = bet
+                self.current_bet_c = bet
+                self.history.append({"actor": "hero", "move": "bet", "size": bet / 100, "street": self.street})
                 # Villain simple pot-odds call/fold
                 call_amt = bet
-                call_ok = self._villain_pot_odds_call(call_amt)
+                call_ok = self._villain.call_bet(self, call_amt)
                 if call_ok:
-                    self.villain.stack -= call_amt
-                    self.villain.contributed += call_amt
-                    self.villain.current_bet = bet
-                    self.pot += call_amt
-                    self.history.append({"actor": "villain", "move": "call", "size": round(call_amt, 2), "street": self.street})
+                    self._commit(self.villain, call_amt)
+                    self.villain.current_bet_c = bet
+                    self.history.append({"actor": "villain", "move": "call", "size": call_amt / 100, "street": self.street})
                 else:
                     self.history.append({"actor": "villain", "move": "fold", "size": None, "street": self.street})
                     self.street = "showdown"
+                    self._award_uncontested(self.hero)
                     return
                 self._advance_street()
                 return
@@ -294,46 +506,43 @@ class PokerAdapter:
             self.street = "showdown"
             self._evaluate_showdown()
 
+    def _award_uncontested(self, winner: PlayerState) -> None:
+        """The last player left after a fold takes the pot."""
+        winner.stack_c += self.pot_c
+        self.pot_c = 0
+
     def _advance_to_flop(self) -> None:
-        self.board += self._draw(3)
+        self._board += self._draw(3)
         self.street = "flop"
         # Postflop first to act in HU is the non-button seat
         self.to_act = 1 - self.btn_seat
 
     def _advance_street(self) -> None:
         if self.street == "flop":
-            self.board += self._draw(1)
+            self._board += self._draw(1)
             self.street = "turn"
             self.to_act = 1 - self.btn_seat
         elif self.street == "turn":
-            self.board += self._draw(1)
+            self._board += self._draw(1)
             self.street = "river"
             self.to_act = 1 - self.btn_seat
         elif self.street == "river":
             self.street = "showdown"
             self._evaluate_showdown()
 
-    def _villain_preflop_response(self, hero_bet: float) -> None:
-        to_call = hero_bet - self.bb
-        call_ok = self._villain_pot_odds_call(to_call)
-        if call_ok and to_call <= self.villain.stack:
-            self.villain.stack -= to_call
-            self.villain.contributed += to_call
-            self.villain.current_bet = hero_bet
-            self.current_bet = hero_bet
-            self.pot += to_call
-            self.history.append({"actor": "villain", "move": "call", "size": round(to_call, 2), "street": "preflop"})
+    def _villain_preflop_response(self, hero_bet: int) -> None:
+        to_call = hero_bet - self.bb_c
+        call_ok = self._villain.preflop_call(self, to_call)
+        if call_ok and to_call <= self.villain.stack_c:
+            self._commit(self.villain, to_call)
+            self.villain.current_bet_c = hero_bet
+            self.current_bet_c = hero_bet
+            self.history.append({"actor": "villain", "move": "call", "size": to_call / 100, "street": "preflop"})
             self._advance_to_flop()
         else:
             self.history.append({"actor": "villain", "move": "fold", "size": None, "street": "preflop"})
             self.street = "showdown"
-
-    def _villain_pot_odds_call(self, call_amount: float) -> bool:
-        if call_amount <= 0:
-            return True
-        pot_odds = call_amount / (self.pot + call_amount)
-        # Deterministic threshold
-        return pot_odds <= 0.4
+            self._award_uncontested(self.hero)
 
     # --- Multi-player scaffolding (future use) ---
     def next_to_act(self) -> int:
@@ -372,7 +581,7 @@ class PokerAdapter:
             return True
         # All actionable players have matched current_bet
         for i in active:
-            if abs(self.players[i].current_bet - self.current_bet) > 1e-9:
+            if self.players[i].current_bet_c != self.current_bet_c:
                 return False
         return True
 
@@ -385,38 +594,18 @@ class PokerAdapter:
         This method assumes `contributed` represents each player's total
         contribution this hand (not lifetime), and folded players are ineligible.
         All-in players remain eligible for pots up to their contributed tier.
+        Folded players' chips count toward the tiers they reached.
         """
-        # Gather eligible players with positive contributions
-        contrib = {p.seat: p.contributed for p in self.players if not p.folded and p.contributed > 0}
-        if not contrib:
-            return []
-        # Unique sorted tiers of contributions
-        tiers = sorted(set(contrib.values()))
-        pots: List[Dict] = []
-        prev = 0.0
-        for t in tiers:
-            delta = t - prev
-            if delta <= 0:
-                prev = t
-                continue
-            # Players eligible are those with contribution >= t
-            eligible = [seat for seat, c in contrib.items() if c >= t]
-            if eligible:
-                amount = delta * len(eligible)
-                pots.append({"amount": round(amount, 2), "eligible_players": eligible})
-            prev = t
-        # If total computed differs from pot (due to call/rounding), add remainder as last pot
-        total_calc = round(sum(p["amount"] for p in pots), 2)
-        remainder = round(self.pot - total_calc, 2)
-        if remainder > 0 and pots:
-            # Everyone who has any contribution is eligible for the remainder
-            eligible_any = [seat for seat in contrib.keys()]
-            pots.append({"amount": remainder, "eligible_players": eligible_any})
-        return pots
+        return [{"amount": amount / 100, "eligible_players": eligible} for amount, eligible in self._side_pots_cents()]
+
+    def _side_pots_cents(self) -> List[Tuple[int, List[int]]]:
+        live = [(p.seat, p.contributed_c) for p in self.players if not p.folded]
+        dead = [p.contributed_c for p in self.players if p.folded]
+        return side_pots(live, dead, self.pot_c)
 
     @staticmethod
     def _is_all_in(p: PlayerState) -> bool:
-        return p.stack <= 1e-9
+        return p.stack_c <= 0
 
     # --- Positions for HU (extend later for 3+) ---
     def _assign_positions_hu(self) -> None:
@@ -439,12 +628,12 @@ class PokerAdapter:
         return RANKS.index(card[0]) + 2
 
     @staticmethod
-    def classify_board(board: List[str], spr: float) -> Dict:
+    def classify_board(board: List[Card], spr: float) -> Dict:
         """
         Classifies a poker board (flop) into basic strategic features for evaluating texture and playability.
 
         Args:
-            board (List[str]): The community cards dealt so far (at least 3 for flop).
+            board (List[Card]): The community cards dealt so far (at least 3 for flop), as strings or card ints.
             spr (float): The stack-to-pot ratio.
 
         Feature explanations:
@@ -456,28 +645,18 @@ class PokerAdapter:
                   'dynamic' = both connected and high cards (action-heavy).
             sprBucket: 'shallow' (<3) = stacks smaller relative to pot; 'mid' (3-6); 'deep' (>6), affects strategy.
         """
-        feats: Dict = {
-            "monotone": False,
-            "connected": False,
-            "paired": False,
-            "highCardHeavy": False,
-            "type": "dry",
-            "sprBucket": "shallow" if spr < 3 else ("mid" if spr <= 6 else "deep"),
-        }
+        spr_bucket = "shallow" if spr < 3 else ("mid" if spr <= 6 else "deep")
         if len(board) < 3:
-            return feats
-        suits = [c[1] for c in board[:3]]
-        ranks = sorted([PokerAdapter._rank_to_val(c) for c in board[:3]])
-        feats["monotone"] = len(set(suits)) == 1
-        feats["paired"] = len(set(ranks)) < 3
-        feats["connected"] = (ranks[-1] - ranks[0]) <= 4
-        high_cards = sum(1 for r in ranks if r >= 12)
-        feats["highCardHeavy"] = high_cards >= 2 or (ranks[-1] >= RANKS.index("A"))
-        if feats["monotone"] or feats["connected"]:
-            feats["type"] = "wet"
-        if feats["connected"] and feats["highCardHeavy"]:
-            feats["type"] = "dynamic"
-        return feats
+            return {
+                "monotone": False,
+                "connected": False,
+                "paired": False,
+                "highCardHeavy": False,
+                "type": "dry",
+                "sprBucket": spr_bucket,
+            }
+        # Flop texture comes from the precomputed 1,755-class table; only SPR is live
+        return {**flop_texture(board), "sprBucket": spr_bucket}
 
     @staticmethod
     def recommended_bet_size(pot: float, features: Dict) -> float:
@@ -504,78 +683,50 @@ class PokerAdapter:
             base = 0.25
         return round(pot * base, 2)
 
-    def _villain_postflop_decide(self, features: Dict) -> Tuple[str, float]:
-        # Deterministic: bet on dry/high-card boards; check on very wet dynamic boards
-        board_type = features.get("type")
-        if board_type in ("dry",) or (features.get("highCardHeavy") and not features.get("monotone")):
-            size = self.recommended_bet_size(self.pot, features)
-            return "bet", size
-        return "check", 0.0
-
-    def _hero_pot_odds_call(self, call_amount: float) -> bool:
+    def _hero_pot_odds_call(self, call_amount: int) -> bool:
         if call_amount <= 0:
             return True
-        pot_odds = call_amount / (self.pot + call_amount)
+        pot_odds = call_amount / (self.pot_c + call_amount)
         return pot_odds <= 0.38
 
     # --- Showdown evaluation ---
+    @timed(ENGINE_SECONDS, "showdown")
     def _evaluate_showdown(self) -> None:
         """Compute multiway showdown with side pots and distribute chips.
 
         Back-compat: hero/villain fields are populated as before. Additional
         per-pot results are included in the result history event under `pots`.
         """
-        # Build hand ranks for all non-folded players
+        # Rank every hand that matters exactly once: all live seats plus hero and villain
         alive = [p for p in self.players if not p.folded]
-        hand_ranks: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
-        for p in alive:
-            best = self._best_five_from_seven(p.cards + self.board)
-            # Only rank and kickers used for comparison
-            hand_ranks[p.seat] = (best[0], tuple(best[1]))
-
-        # Compute side pots
-        pots = self.calculate_side_pots()
+        board = self._board
+        hand_ranks: Dict[int, int] = {p.seat: evaluate(p.hole + board) for p in alive}
+        for p in (self.hero, self.villain):
+            if p.seat not in hand_ranks:
+                hand_ranks[p.seat] = evaluate(p.hole + board)
+
+        # Chips move in integer cents, so what is paid out is exactly the pot
         distributions: List[Dict] = []
-        remaining_pot = self.pot
-        for pot in pots:
-            amount = pot["amount"]
-            elig = pot["eligible_players"]
-            # Determine winner(s) among eligible seats
-            best_key = None
-            winners: List[int] = []
-            for seat in elig:
-                key = hand_ranks.get(seat)
-                if key is None:
-                    continue
-                if best_key is None or key > best_key:
-                    best_key = key
-                    winners = [seat]
-                elif key == best_key:
-                    winners.append(seat)
-            if winners:
-                share = round(amount / len(winners), 2)
-                for seat in winners:
-                    self.players[seat].stack += share
-                distributions.append({"amount": amount, "winners": winners, "share": share})
-                remaining_pot = round(remaining_pot - amount, 2)
-        # Any rounding remainder goes to best overall among alive
-        if remaining_pot > 0 and alive:
-            best_overall = max((hand_ranks[p.seat], p.seat) for p in alive)[1]
-            self.players[best_overall].stack += remaining_pot
-            distributions.append({"amount": remaining_pot, "winners": [best_overall], "share": remaining_pot})
-            remaining_pot = 0.0
-
-        pot_before = self.pot
-        self.pot = 0.0
+        for amount, elig in self._side_pots_cents():
+            best_key = max(hand_ranks[seat] for seat in elig)
+            winners = [seat for seat in elig if hand_ranks[seat] == best_key]
+            for seat, cents in award(amount, winners, self.btn_seat, self.num_players).items():
+                self.players[seat].stack_c += cents
+            distributions.append({"amount": amount / 100, "winners": winners, "share": amount // len(winners) / 100})
+
+        pot_before = self.pot_c
+        self.pot_c = 0
 
         # Back-compat summary winner for HU only
         winner = "split"
-        hero_best = self._best_five_from_seven(self.hero.cards + self.board)
-        villain_best = self._best_five_from_seven(self.villain.cards + self.board)
+        hero_best = hand_ranks[self.hero.seat]
+        villain_best = hand_ranks[self.villain.seat]
         if len(alive) == 2:
-            if hand_ranks.get(self.hero.seat, (0, ())) > hand_ranks.get(self.villain.seat, (0, ())):
+            hero_live = -1 if self.hero.folded else hero_best
+            villain_live = -1 if self.villain.folded else villain_best
+            if hero_live > villain_live:
                 winner = "hero"
-            elif hand_ranks.get(self.hero.seat, (0, ())) < hand_ranks.get(self.villain.seat, (0, ())):
+            elif hero_live < villain_live:
                 winner = "villain"
             else:
                 winner = "split"
@@ -586,12 +737,13 @@ class PokerAdapter:
             "winner": winner,
             "heroBest": self._hand_desc(hero_best),
             "villainBest": self._hand_desc(villain_best),
-            "pot": round(pot_before, 2),
+            "pot": pot_before / 100,
             "pots": distributions,
         })
 
     # Hand evaluation helpers
     def _best_five_from_seven(self, cards: List[str]):
+        # Reference implementation; showdown uses the table-driven `evaluator`.
         # Returns (category_rank, tiebreaker_tuple, best5_cards_sorted_desc)
         # Category rank: 8=straight_flush,7=quads,6=full_house,5=flush,4=straight,3=trips,2=two_pair,1=pair,0=high
         ranks = [self._rank_to_val(c) for c in cards]
@@ -663,7 +815,8 @@ class PokerAdapter:
 
         if len(pairs) >= 2:
             high_pair, low_pair = pairs[0], pairs[1]
-            kicker = max([r for r in singles if r not in (high_pair, low_pair)] or [0])
+            # Kicker may come from a third pair
+            kicker = max([r for r in rank_counts if r not in (high_pair, low_pair)] or [0])
             return (2, (high_pair, low_pair, kicker), [])
 
         if pairs:
@@ -676,19 +829,12 @@ class PokerAdapter:
         return (0, tuple(top5), [])
 
     @staticmethod
-    def _hand_desc(hand_tuple) -> Dict:
-        cat, tbs, _ = hand_tuple
-        names = {
-            8: "straight_flush",
-            7: "four_of_a_kind",
-            6: "full_house",
-            5: "flush",
-            4: "straight",
-            3: "three_of_a_kind",
-            2: "two_pair",
-            1: "one_pair",
-            0: "high_card",
-        }
-        return {"category": names.get(cat, "unknown"), "ranks": list(tbs)}
+    def _hand_desc(hand) -> Dict:
+        """Describe an evaluator strength (or a legacy `_best_five_from_seven` tuple)."""
+        if isinstance(hand, int):
+            cat, tbs = decode(hand)
+        else:
+            cat, tbs = hand[0], hand[1]
+        return {"category": HAND_NAMES.get(cat, "unknown"), "ranks": list(tbs)}
 
 
@@ -0,0 +1,63 @@
+"""Side-pot construction and exact pot awards in integer cents.
+
+`side_pots` sorts live contributions once and walks the all-in levels from
+the bottom. Each pot takes its slice of every contribution, including dead
+money from folded players, up to that level. The players still eligible are
+the live suffix of the sorted order. `award` splits a pot between tied
+winners in whole cents, and odd cents go to the winners closest to the left
+of the button. Neither step rounds, so the chips paid out always equal the
+pot.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+
+def to_cents(amount: float) -> int:
+    return int(round(amount * 100))
+
+
+def side_pots(live: Sequence[Tuple[int, int]], dead: Sequence[int] = (), pot: int = 0) -> List[Tuple[int, List[int]]]:
+    """Pots as ``(amount, eligible seats in seat order)``, main pot first.
+
+    `live` holds ``(seat, contributed)`` for players who have not folded and
+    `dead` holds the folded players' contributions, all in cents. If `pot`
+    exceeds the contributions (e.g. chips carried in from elsewhere), the
+    excess becomes a final pot open to every live contributor.
+    """
+    levels = sorted((c, seat) for seat, c in live if c > 0)
+    dead_sorted = sorted(d for d in dead if d > 0)
+    pots: List[Tuple[int, List[int]]] = []
+    prev = 0
+    j = 0
+    n = len(levels)
+    for i, (level, _) in enumerate(levels):
+        if level == prev:
+            continue
+        width = level - prev
+        amount = width * (n - i)
+        # Folded contributions that end inside this tier, then those that span it
+        while j < len(dead_sorted) and dead_sorted[j] <= level:
+            amount += dead_sorted[j] - prev
+            j += 1
+        amount += width * (len(dead_sorted) - j)
+        pots.append((amount, sorted(seat for _, seat in levels[i:])))
+        prev = level
+    if pots:
+        # Dead money above the top live level belongs to the last pot
+        top, eligible = pots[-1]
+        pots[-1] = (top + sum(d - prev for d in dead_sorted[j:]), eligible)
+        remainder = pot - sum(amount for amount, _ in pots)
+        if remainder > 0:
+            pots.append((remainder, sorted(seat for _, seat in levels)))
+    return pots
+
+
+def award(amount: int, winners: Sequence[int], button: int, seats: int) -> Dict[int, int]:
+    """Split `amount` cents among tied `winners`, odd cents going left of the button first."""
+    share, odd = divmod(amount, len(winners))
+    payout = {seat: share for seat in winners}
+    if odd:
+        for seat in sorted(winners, key=lambda s: (s - button - 1) % seats)[:odd]:
+            payout[seat] += 1
+    return payout
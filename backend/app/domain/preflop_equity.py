@@ -0,0 +1,206 @@
+"""Offline 169x169 preflop hand-class equity matrix.
+
+``M[a, b]`` is the all-in preflop equity of hand class `a` against class
+`b`, with ties counted as half. Each entry averages random non-conflicting
+combo pairs and random boards, ranked with `evaluate_batch`. Card removal
+between the two classes is therefore built in. Card removal against a
+third party's hand is not. The matrix is built offline:
+
+    python -m backend.app.domain.preflop_equity --samples 2000 --workers 4
+
+The result is written to `PREFLOP_EQUITY_PATH` as a small versioned binary
+file: a `HEADER` followed by little-endian float32 rows. Workers
+`np.memmap` it read-only, so every process on a host shares one
+page-cached copy. If the file is missing or has a different version,
+lookups return None and callers keep their heuristic fallbacks.
+
+Decisions that read the matrix change when it is rebuilt. Sessions record
+`identity()` so that a replay against different data is refused rather
+than silently diverging.
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from ..core.config import PREFLOP_EQUITY_PATH
+from .batch_eval import evaluate_batch
+from .ranges import CLASS_COMBOS, CLASS_INDEX, COMBO_CLASS, COMBOS, NUM_CLASSES, RangeSpec, class_of, parse_range
+
+
+# Bump whenever the sampling or layout changes so stale files are ignored.
+MATRIX_VERSION = 1
+MAGIC = b"PTEQ"
+# magic, version, classes, samples per pair, seed; rows start at HEADER_SIZE
+HEADER = struct.Struct("<4sIIIQ")
+HEADER_SIZE = 32
+
+_CLASS_MEMBERS = [np.flatnonzero(COMBO_CLASS == c) for c in range(NUM_CLASSES)]
+
+_UNLOADED = object()
+_matrix = _UNLOADED
+# (matrix object, its identity string), recomputed when the matrix is swapped
+_identity = (None, None)
+
+
+def _pair_equity(a_class: int, b_class: int, samples: int, rng: np.random.Generator) -> float:
+    a = _CLASS_MEMBERS[a_class][rng.integers(len(_CLASS_MEMBERS[a_class]), size=samples)]
+    b_members = _CLASS_MEMBERS[b_class]
+    b = b_members[rng.integers(len(b_members), size=samples)]
+    hole_a, hole_b = COMBOS[a], COMBOS[b]
+    # Redraw the villain combo wherever it shares a card with the hero combo
+    while True:
+        clash = (hole_a[:, :, None] == hole_b[:, None, :]).any(axis=(1, 2))
+        if not clash.any():
+            break
+        b[clash] = b_members[rng.integers(len(b_members), size=int(clash.sum()))]
+        hole_b = COMBOS[b]
+    keys = rng.random((samples, 52), dtype=np.float32)
+    rows = np.arange(samples)[:, None]
+    keys[rows, hole_a] = 2.0
+    keys[rows, hole_b] = 2.0
+    board = np.argpartition(keys, 5, axis=1)[:, :5].astype(np.int8)
+    ea = evaluate_batch(np.concatenate([hole_a, board], axis=1))
+    eb = evaluate_batch(np.concatenate([hole_b, board], axis=1))
+    return float(((ea > eb) + 0.5 * (ea == eb)).mean())
+
+
+def _row(a_class: int, samples: int, seed: np.random.SeedSequence) -> Tuple[int, np.ndarray]:
+    """Equities of `a_class` against every class `b >= a_class`."""
+    rng = np.random.default_rng(seed)
+    row = np.full(NUM_CLASSES, np.nan, dtype=np.float32)
+    row[a_class] = 0.5
+    for b_class in range(a_class + 1, NUM_CLASSES):
+        row[b_class] = _pair_equity(a_class, b_class, samples, rng)
+    return a_class, row
+
+
+def build_matrix(samples: int = 2000, seed: int = 0, workers: int = 1) -> np.ndarray:
+    """Monte Carlo matrix, reproducible for a given (samples, seed) whatever `workers` is.
+
+    Only the upper triangle is sampled. The rest follows from
+    ``M[b, a] = 1 - M[a, b]``, and the diagonal is 0.5 by symmetry.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(NUM_CLASSES)
+    matrix = np.zeros((NUM_CLASSES, NUM_CLASSES), dtype=np.float32)
+    if workers > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            rows = list(pool.map(_row, range(NUM_CLASSES), [samples] * NUM_CLASSES, seeds))
+    else:
+        rows = [_row(a, samples, seeds[a]) for a in range(NUM_CLASSES)]
+    for a, row in rows:
+        matrix[a, a:] = row[a:]
+        matrix[a:, a] = 1.0 - row[a:]
+    np.fill_diagonal(matrix, 0.5)
+    return matrix
+
+
+def write_matrix(matrix: np.ndarray, path: str, samples: int, seed: int) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, MATRIX_VERSION, NUM_CLASSES, samples, seed).ljust(HEADER_SIZE, b"\0"))
+        f.write(np.ascontiguousarray(matrix, dtype="<f4").tobytes())
+    os.replace(tmp, path)
+
+
+def load_matrix(path: str = PREFLOP_EQUITY_PATH) -> Optional[np.ndarray]:
+    """Read-only memmap of the matrix at `path`, or None if it is missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            magic, version, classes, _, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != MATRIX_VERSION or classes != NUM_CLASSES:
+            return None
+        if os.path.getsize(path) != HEADER_SIZE + classes * classes * 4:
+            return None
+        return np.memmap(path, dtype="<f4", mode="r", offset=HEADER_SIZE, shape=(classes, classes))
+    except (OSError, struct.error):
+        return None
+
+
+def matrix() -> Optional[np.ndarray]:
+    """The shared matrix, mapped on first use (restart workers after rebuilding)."""
+    global _matrix
+    if _matrix is _UNLOADED:
+        _matrix = load_matrix(PREFLOP_EQUITY_PATH)
+    return _matrix
+
+
+def use_matrix(m: Optional[np.ndarray]) -> None:
+    """Install `m` as the shared matrix (None disables lookups); for tests and embedding."""
+    global _matrix
+    _matrix = m
+
+
+def identity() -> Optional[str]:
+    """Version and checksum of the loaded matrix (None without one)."""
+    global _identity
+    m = matrix()
+    if m is None:
+        return None
+    if _identity[0] is not m:
+        crc = zlib.crc32(np.ascontiguousarray(m, dtype="<f4").tobytes())
+        _identity = (m, f"{MATRIX_VERSION}:{crc:08x}")
+    return _identity[1]
+
+
+HandClass = Union[int, str]
+
+
+def _class_index(hand: HandClass) -> int:
+    return hand if isinstance(hand, int) else CLASS_INDEX[hand]
+
+
+def class_equity(hand: HandClass, villain: HandClass) -> Optional[float]:
+    m = matrix()
+    if m is None:
+        return None
+    return float(m[_class_index(hand), _class_index(villain)])
+
+
+def class_weights(spec: RangeSpec) -> np.ndarray:
+    """Combo counts per class for a range spec (1,326 vector or tokens)."""
+    return np.bincount(COMBO_CLASS, weights=parse_range(spec), minlength=NUM_CLASSES)
+
+
+def equity_vs_range(hand: HandClass, spec: RangeSpec = None) -> Optional[float]:
+    """Equity of class `hand` against a range (None = any two cards)."""
+    m = matrix()
+    if m is None:
+        return None
+    weights = class_weights(spec) if spec is not None else CLASS_COMBOS.astype(np.float64)
+    total = weights.sum()
+    if total <= 0:
+        return None
+    return float(m[_class_index(hand)] @ weights / total)
+
+
+def hole_class(hole) -> int:
+    """Class index of two hole cards in the integer encoding."""
+    return class_of(hole[0], hole[1])
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build the 169x169 preflop equity matrix")
+    parser.add_argument("--samples", type=int, default=2000, help="rollouts per class pair")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", default=PREFLOP_EQUITY_PATH)
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    m = build_matrix(args.samples, args.seed, args.workers)
+    write_matrix(m, args.out, args.samples, args.seed)
+    print(f"wrote {args.out} ({NUM_CLASSES}x{NUM_CLASSES}, {args.samples} samples/pair) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
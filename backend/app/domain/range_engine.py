@@ -0,0 +1,240 @@
+"""Per-session Bayesian range estimates over the 1,326 combos.
+
+A `RangeTracker` holds one player's combo weight vector for the current
+hand. Combos that share a card with what the observer can see are zeroed,
+and each action in `history` multiplies the vector by that action's
+likelihood under an `ActionModel`. Likelihoods depend on a combo's strength
+percentile for the street: preflop equity against a random hand (or a
+Chen score when the equity matrix is not built), or the made-hand rank
+on the board from `evaluate_batch`. They are computed once per street and
+cached, so `update` only replays the history it has not seen yet, one
+vector multiply per action.
+
+Trackers live in a `WeakKeyDictionary` keyed by the adapter, so they
+disappear with their session. A new hand (or a replaced history) resets
+them. The villain's likelihood follows the session's villain model
+(`ACTION_MODELS`). The rule-based opponent's actions carry no card
+information. The equity opponent bets and calls on its cards.
+
+Perspectives:
+
+- ``"villain"``: the villain's range as the hero sees it. The board and
+  the hero's hole cards are blockers.
+- ``"hero"``: the hero's range as an opponent would read it. Only the board
+  is a blocker, because the villain's cards are never revealed to the
+  client.
+"""
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+import numpy as np
+
+from . import preflop_equity
+from .batch_eval import evaluate_batch
+from .cards import mask_of
+from .ranges import CLASS_COMBOS, COMBO_CLASS, COMBOS, NUM_CLASSES, NUM_COMBOS, class_label, to_grid, unblocked
+
+if TYPE_CHECKING:
+    from .poker_adapter import PokerAdapter
+
+
+# Board cards visible during each street
+BOARD_CARDS = {"preflop": 0, "flop": 3, "turn": 4, "river": 5, "showdown": 5}
+
+# likelihood(move, strength percentile vector) -> per-combo multiplier
+Likelihood = Callable[[str, np.ndarray], np.ndarray]
+
+
+def _chen(label: str) -> float:
+    """Chen formula score for a class label such as "AKs", "T9o" or "77"."""
+    points = {"A": 10.0, "K": 8.0, "Q": 7.0, "J": 6.0}
+    order = "23456789TJQKA"
+    hi, lo = order.index(label[0]), order.index(label[1])
+    score = points.get(label[0], (hi + 2) / 2)
+    if hi == lo:
+        return max(5.0, score * 2)
+    if label.endswith("s"):
+        score += 2
+    gap = hi - lo - 1
+    score -= (0, 1, 2, 4)[gap] if gap < 4 else 5
+    if gap <= 1 and hi < order.index("Q"):
+        score += 1
+    return score
+
+
+CLASS_SCORE: np.ndarray = np.array([_chen(class_label(i)) for i in range(NUM_CLASSES)])
+
+
+def percentiles(strength: np.ndarray, live: np.ndarray) -> np.ndarray:
+    """Strength percentile in [0, 1] of each combo among the `live` ones (ties share the midpoint)."""
+    ordered = np.sort(strength[live])
+    if not len(ordered):
+        return np.zeros(NUM_COMBOS)
+    below = np.searchsorted(ordered, strength, side="left")
+    upto = np.searchsorted(ordered, strength, side="right")
+    return (below + upto) / (2 * len(ordered))
+
+
+def preflop_strength() -> np.ndarray:
+    """Per-combo preflop strength: equity vs a random hand from the matrix, else the Chen score."""
+    m = preflop_equity.matrix()
+    if m is None:
+        return CLASS_SCORE[COMBO_CLASS]
+    return (m @ CLASS_COMBOS / NUM_COMBOS)[COMBO_CLASS]
+
+
+def board_strength(board: list, live: np.ndarray) -> np.ndarray:
+    """Made-hand strength of every live combo on `board` (0 for blocked combos)."""
+    out = np.zeros(NUM_COMBOS)
+    idx = np.flatnonzero(live)
+    if len(idx):
+        cards = np.empty((len(idx), 2 + len(board)), dtype=np.int8)
+        cards[:, :2] = COMBOS[idx]
+        cards[:, 2:] = board
+        out[idx] = evaluate_batch(cards)
+    return out
+
+
+def flat(move: str, pct: np.ndarray) -> Optional[np.ndarray]:
+    """For opponents that decide without looking at their cards (the ``deterministic`` villain): no information."""
+    return None
+
+
+def _ahead(pct: np.ndarray, threshold: float) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-12.0 * (pct - threshold)))
+
+
+def equity_threshold(move: str, pct: np.ndarray) -> Optional[np.ndarray]:
+    """The ``equity`` villain: value-bets when well ahead, calls when ahead of the price, else checks or folds.
+
+    Strength percentile stands in for its equity against the hero range, so
+    the thresholds are soft steps rather than exact cut-offs.
+    """
+    if move in ("bet", "raise"):
+        return 0.05 + 0.95 * _ahead(pct, 0.6)
+    if move == "check":
+        return 1.0 - 0.95 * _ahead(pct, 0.6)
+    if move == "call":
+        return 0.05 + 0.95 * _ahead(pct, 0.4)
+    if move == "fold":
+        return 1.0 - 0.95 * _ahead(pct, 0.4)
+    return None
+
+
+def strength_weighted(move: str, pct: np.ndarray) -> Optional[np.ndarray]:
+    """A straightforward player: aggression and calls skew strong, checks and folds skew weak."""
+    if move in ("bet", "raise"):
+        return 0.1 + 0.9 * pct ** 2
+    if move == "call":
+        return 0.3 + 0.7 * pct
+    if move == "check":
+        return 1.0 - 0.6 * pct ** 2
+    if move == "fold":
+        return 1.0 - 0.9 * pct
+    return None
+
+
+class ActionModel:
+    """Per-actor likelihood functions for reading ranges from the history."""
+
+    def __init__(self, hero: Likelihood = strength_weighted, villain: Likelihood = flat) -> None:
+        self.likelihoods: Dict[str, Likelihood] = {"hero": hero, "villain": villain}
+
+    def likelihood(self, actor: str, move: str, pct: np.ndarray) -> Optional[np.ndarray]:
+        fn = self.likelihoods.get(actor)
+        return fn(move, pct) if fn is not None else None
+
+
+DEFAULT_MODEL = ActionModel()
+# Session villain model name (see `villain`) -> how its actions are read
+ACTION_MODELS: Dict[str, ActionModel] = {
+    "deterministic": DEFAULT_MODEL,
+    "equity": ActionModel(villain=equity_threshold),
+}
+
+
+def action_model_for(adapter: "PokerAdapter") -> ActionModel:
+    return ACTION_MODELS.get(getattr(adapter, "villain_model", None), DEFAULT_MODEL)
+
+
+class RangeTracker:
+    def __init__(self, perspective: str, model: ActionModel = DEFAULT_MODEL) -> None:
+        if perspective not in ("hero", "villain"):
+            raise ValueError(f"unknown perspective: {perspective!r}")
+        self.perspective = perspective
+        self.model = model
+        self.hand_no = -1
+        self.seen = 0
+        self.weights = np.ones(NUM_COMBOS)
+        self._dead = 0
+        # street -> strength percentiles, computed on first use
+        self._pct: Dict[str, np.ndarray] = {}
+
+    def _restart(self, hand_no: int) -> None:
+        self.hand_no = hand_no
+        self.seen = 0
+        self.weights = np.ones(NUM_COMBOS)
+        self._dead = 0
+        self._pct = {}
+
+    def _block(self, dead: int) -> None:
+        if dead != self._dead:
+            self.weights *= unblocked(dead)
+            self._dead = dead
+
+    def _percentiles(self, street: str, board: list, known: int) -> np.ndarray:
+        # Ranked among the combos live on that street, so catching up late gives the same answer
+        pct = self._pct.get(street)
+        if pct is None:
+            live = unblocked(known | mask_of(board))
+            strength = preflop_strength() if not board else board_strength(board, live)
+            pct = self._pct[street] = percentiles(strength, live)
+        return pct
+
+    def update(self, adapter: "PokerAdapter") -> np.ndarray:
+        """Bring the weights up to date with `adapter` and return them."""
+        history = adapter.history
+        if adapter.hand_no != self.hand_no or len(history) < self.seen:
+            self._restart(adapter.hand_no)
+        board = adapter._board
+        known = adapter.hero.mask if self.perspective == "villain" else 0
+        self._block(known | mask_of(board))
+        for event in history[self.seen:]:
+            if event.get("actor") != self.perspective:
+                continue
+            street = event.get("street", adapter.street)
+            pct = self._percentiles(street, board[:BOARD_CARDS.get(street, len(board))], known)
+            factor = self.model.likelihood(event["actor"], event.get("move", ""), pct)
+            if factor is not None:
+                self.weights *= factor
+        self.seen = len(history)
+        return self.weights
+
+
+_trackers: "weakref.WeakKeyDictionary[PokerAdapter, Dict[str, RangeTracker]]" = weakref.WeakKeyDictionary()
+_trackers_lock = threading.Lock()
+
+
+def tracker_for(adapter: "PokerAdapter", perspective: str) -> RangeTracker:
+    with _trackers_lock:
+        per_adapter = _trackers.setdefault(adapter, {})
+        tracker = per_adapter.get(perspective)
+        if tracker is None:
+            tracker = per_adapter[perspective] = RangeTracker(perspective, action_model_for(adapter))
+    return tracker
+
+
+def estimate(adapter: "PokerAdapter", perspective: str) -> Dict:
+    """Range grid payload for `/api/range/estimate`; callers hold the session lock."""
+    weights = tracker_for(adapter, perspective).update(adapter)
+    grid = to_grid(weights)
+    live = weights > 0
+    return {
+        "perspective": perspective,
+        "grid": grid.round(6).tolist(),
+        "combos": int(live.sum()),
+        "classes": int((np.bincount(COMBO_CLASS, weights=live, minlength=NUM_CLASSES) > 0).sum()),
+    }
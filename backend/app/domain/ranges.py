@@ -0,0 +1,129 @@
+"""Hole-card combos, 169 hand classes and range parsing.
+
+Combos are the 1,326 two-card holdings in the integer card encoding, stored
+as ``COMBOS[i] = (high_card, low_card)``. Hand classes follow the usual
+13x13 grid (aces top-left): class ``row * 13 + col`` is a pair on the
+diagonal, suited above it and offsuit below it, so a per-class vector
+reshapes straight into the grid.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from .cards import CARD_INDEX, RANKS, rank_of, suit_of, to_str
+
+
+NUM_COMBOS = 1326
+NUM_CLASSES = 169
+
+RangeSpec = Union[None, str, Iterable[str], np.ndarray]
+
+
+def _build_combos() -> np.ndarray:
+    pairs = [(hi, lo) for hi in range(52) for lo in range(hi)]
+    return np.array(pairs, dtype=np.int8)
+
+
+COMBOS: np.ndarray = _build_combos()
+COMBO_INDEX: Dict[Tuple[int, int], int] = {}
+for _i, (_hi, _lo) in enumerate(COMBOS.tolist()):
+    COMBO_INDEX[(_hi, _lo)] = _i
+    COMBO_INDEX[(_lo, _hi)] = _i
+
+
+def class_of(hi: int, lo: int) -> int:
+    """Grid class index for a two-card holding."""
+    r1, r2 = max(rank_of(hi), rank_of(lo)), min(rank_of(hi), rank_of(lo))
+    if r1 == r2:
+        return (12 - r1) * 14
+    if suit_of(hi) == suit_of(lo):
+        return (12 - r1) * 13 + (12 - r2)
+    return (12 - r2) * 13 + (12 - r1)
+
+
+def class_label(index: int) -> str:
+    row, col = divmod(index, 13)
+    if row == col:
+        return RANKS[12 - row] * 2
+    if row < col:
+        return RANKS[12 - row] + RANKS[12 - col] + "s"
+    return RANKS[12 - col] + RANKS[12 - row] + "o"
+
+
+COMBO_CLASS: np.ndarray = np.array([class_of(hi, lo) for hi, lo in COMBOS.tolist()], dtype=np.int16)
+CLASS_LABELS: List[str] = [class_label(i) for i in range(NUM_CLASSES)]
+CLASS_INDEX: Dict[str, int] = {label: i for i, label in enumerate(CLASS_LABELS)}
+# Combos per class: 6 pairs, 4 suited, 12 offsuit
+CLASS_COMBOS: np.ndarray = np.bincount(COMBO_CLASS, minlength=NUM_CLASSES).astype(np.int16)
+
+# Card bitmask of each combo, for vectorized blocker removal
+COMBO_MASKS: np.ndarray = (np.int64(1) << COMBOS[:, 0].astype(np.int64)) | (np.int64(1) << COMBOS[:, 1].astype(np.int64))
+
+
+def unblocked(dead_mask: int) -> np.ndarray:
+    """Boolean vector of combos that share no card with `dead_mask`."""
+    return (COMBO_MASKS & np.int64(dead_mask)) == 0
+
+
+def _expand_token(token: str) -> List[str]:
+    """Expand "QQ+", "ATs+", "KJ" into plain class labels."""
+    plus = token.endswith("+")
+    base = token[:-1] if plus else token
+    if len(base) == 2 and base[0] == base[1]:
+        r = RANKS.index(base[0])
+        return [RANKS[x] * 2 for x in range(r, 13 if plus else r + 1)]
+    if len(base) not in (2, 3):
+        raise ValueError(f"bad range token: {token!r}")
+    hi, lo = RANKS.index(base[0]), RANKS.index(base[1])
+    if lo > hi:
+        hi, lo = lo, hi
+    kinds = [base[2]] if len(base) == 3 else ["s", "o"]
+    kickers = range(lo, hi) if plus else [lo]
+    return [RANKS[hi] + RANKS[k] + kind for k in kickers for kind in kinds]
+
+
+def parse_range(spec: RangeSpec) -> np.ndarray:
+    """Combo weight vector (length 1,326) for a range spec.
+
+    `spec` may be ``None``/"" (any two cards), a weight vector, or tokens
+    (comma separated string or iterable) such as ``"QQ+, AKs, ATo+, KhQh"``.
+    A token may carry a weight suffix, e.g. ``"AQo:0.5"``.
+    """
+    if spec is None or (isinstance(spec, str) and not spec.strip()):
+        return np.ones(NUM_COMBOS)
+    if isinstance(spec, np.ndarray):
+        if spec.shape != (NUM_COMBOS,):
+            raise ValueError(f"range vector must have shape ({NUM_COMBOS},)")
+        return spec.astype(np.float64)
+    tokens = spec.split(",") if isinstance(spec, str) else list(spec)
+    weights = np.zeros(NUM_COMBOS)
+    for raw in tokens:
+        token = raw.strip()
+        if not token:
+            continue
+        weight = 1.0
+        if ":" in token:
+            token, w = token.split(":", 1)
+            weight = float(w)
+        if len(token) == 4 and token[:2] in CARD_INDEX and token[2:] in CARD_INDEX:
+            weights[COMBO_INDEX[(CARD_INDEX[token[:2]], CARD_INDEX[token[2:]])]] = weight
+            continue
+        for label in _expand_token(token):
+            weights[COMBO_CLASS == CLASS_INDEX[label]] = weight
+    return weights
+
+
+def to_grid(combo_weights: np.ndarray, normalize: bool = True) -> np.ndarray:
+    """Collapse combo weights to the 13x13 class grid."""
+    grid = np.bincount(COMBO_CLASS, weights=combo_weights, minlength=NUM_CLASSES)
+    total = grid.sum()
+    if normalize and total > 0:
+        grid = grid / total
+    return grid.reshape(13, 13)
+
+
+def combo_label(index: int) -> str:
+    hi, lo = COMBOS[index].tolist()
+    return to_str(hi) + to_str(lo)
@@ -0,0 +1,145 @@
+"""Session storage for `GameManager`.
+
+`InMemorySessionStore` bounds resident sessions two ways:
+
+- LRU: once `max_entries` is exceeded the least recently used session is evicted;
+- idle TTL: a session untouched for `ttl_seconds` expires, checked lazily on
+  access and by an optional background sweeper thread.
+
+Recently dropped session ids are remembered (bounded) so callers can tell
+"evicted"/"expired" apart from ids that never existed.
+
+`shard_for` is the session-to-worker mapping used in multi-worker mode: each
+worker only mints ids that hash to its own shard, so a router can send every
+request for a session to the one process that holds it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+from .poker_adapter import PokerAdapter
+
+
+EVICTED = "evicted"
+EXPIRED = "expired"
+
+
+def shard_for(session_id: str, shards: int) -> int:
+    """Worker index that owns `session_id` (stable across processes and restarts)."""
+    return zlib.crc32(session_id.encode()) % shards
+
+
+class SessionStore(Protocol):
+    def get(self, session_id: str) -> Optional[PokerAdapter]:
+        ...
+
+    def put(self, session_id: str, adapter: PokerAdapter) -> None:
+        ...
+
+    def dropped_reason(self, session_id: str) -> Optional[str]:
+        """EVICTED/EXPIRED for recently dropped ids, None if unknown."""
+        ...
+
+    def stats(self) -> Dict[str, int]:
+        ...
+
+
+class InMemorySessionStore:
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: Optional[float] = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_tombstones: int = 10_000,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._max_tombstones = max_tombstones
+        # Access order doubles as expiry order: the front is the idlest session.
+        self._sessions: "OrderedDict[str, Tuple[PokerAdapter, float]]" = OrderedDict()
+        self._tombstones: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._counts = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expired(self, last_access: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - last_access > self.ttl_seconds
+
+    def _drop(self, session_id: str, reason: str) -> None:
+        self._sessions.pop(session_id, None)
+        self._counts["evictions" if reason == EVICTED else "expirations"] += 1
+        self._tombstones[session_id] = reason
+        while len(self._tombstones) > self._max_tombstones:
+            self._tombstones.popitem(last=False)
+
+    def get(self, session_id: str) -> Optional[PokerAdapter]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            now = self._clock()
+            if entry is None or self._expired(entry[1], now):
+                if entry is not None:
+                    self._drop(session_id, EXPIRED)
+                self._counts["misses"] += 1
+                return None
+            self._sessions[session_id] = (entry[0], now)
+            self._sessions.move_to_end(session_id)
+            self._counts["hits"] += 1
+            return entry[0]
+
+    def put(self, session_id: str, adapter: PokerAdapter) -> None:
+        with self._lock:
+            self._sessions[session_id] = (adapter, self._clock())
+            self._sessions.move_to_end(session_id)
+            self._tombstones.pop(session_id, None)
+            while len(self._sessions) > self.max_entries:
+                oldest = next(iter(self._sessions))
+                self._drop(oldest, EVICTED)
+
+    def dropped_reason(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            return self._tombstones.get(session_id)
+
+    def sweep(self) -> int:
+        """Expire idle sessions; returns how many were dropped."""
+        dropped = 0
+        with self._lock:
+            now = self._clock()
+            while self._sessions:
+                session_id, (_, last_access) = next(iter(self._sessions.items()))
+                if not self._expired(last_access, now):
+                    break
+                self._drop(session_id, EXPIRED)
+                dropped += 1
+        return dropped
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._counts, "resident": len(self._sessions)}
+
+    def start_sweeper(self, interval: float = 60.0) -> None:
+        if self._sweeper is not None or self.ttl_seconds is None:
+            return
+        self._stop.clear()
+
+        def run() -> None:
+            while not self._stop.wait(interval):
+                self.sweep()
+
+        self._sweeper = threading.Thread(target=run, name="session-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        if self._sweeper is None:
+            return
+        self._stop.set()
+        self._sweeper.join()
+        self._sweeper = None
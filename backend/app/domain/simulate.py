@@ -0,0 +1,223 @@
+"""Headless self-play: drive `PokerAdapter` directly, without the HTTP layer.
+
+`simulate` plays `hands` hands for every seed with a pluggable hero policy
+against the built-in villain heuristics and fans seeds out over a process
+pool. It reports throughput (hands/sec), the hero's chip EV in big blinds per
+100 hands with its standard error, and the distribution of hand outcomes
+("showdown_hero", "villain_fold_flop", ...).
+
+Every hand is played at the configured starting depth: stacks are restored
+before each `reset_hand`, so hands are independent samples. A hero policy is
+a callable ``(adapter, rng) -> (action, size)`` and is named either by a
+`POLICIES` key or by a ``"package.module:function"`` import path, which is
+resolved inside each worker.
+
+Run it with::
+
+    python -m backend.app.domain.simulate --policy passive aggressive --hands 2000 --seeds 16
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .cards import rank_of
+from .poker_adapter import PokerAdapter
+
+
+Policy = Callable[[PokerAdapter, random.Random], Tuple[str, Optional[float]]]
+
+# Safety valve: the engine always reaches showdown, but a buggy policy must not spin forever
+MAX_ACTIONS_PER_HAND = 32
+
+
+def passive(adapter: PokerAdapter, rng: random.Random) -> Tuple[str, Optional[float]]:
+    return ("call" if adapter.street == "preflop" else "check"), None
+
+
+def aggressive(adapter: PokerAdapter, rng: random.Random) -> Tuple[str, Optional[float]]:
+    if adapter.street == "preflop":
+        return "raise", adapter.bb * 3
+    return "bet", round(adapter.pot * 0.66, 2)
+
+
+def tight(adapter: PokerAdapter, rng: random.Random) -> Tuple[str, Optional[float]]:
+    """Raise pairs and two broadway cards, fold the rest; bet postflop after raising."""
+    if adapter.street == "preflop":
+        hi, lo = sorted((rank_of(c) for c in adapter.hero.hole), reverse=True)
+        if hi == lo or lo >= 8:
+            return "raise", adapter.bb * 3
+        return "fold", None
+    return "bet", round(adapter.pot * 0.5, 2)
+
+
+def uniform(adapter: PokerAdapter, rng: random.Random) -> Tuple[str, Optional[float]]:
+    if adapter.street == "preflop":
+        return rng.choice(["fold", "call", "raise"]), adapter.bb * rng.choice([2, 2.5, 3, 4])
+    return rng.choice(["check", "bet"]), round(adapter.pot * rng.choice([0.33, 0.5, 0.75, 1.0]), 2)
+
+
+POLICIES: Dict[str, Policy] = {
+    "passive": passive,
+    "aggressive": aggressive,
+    "tight": tight,
+    "random": uniform,
+}
+
+
+def resolve_policy(name: str) -> Policy:
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"unknown policy {name!r}; use one of {sorted(POLICIES)} or 'module:function'")
+    return getattr(importlib.import_module(module), attr)
+
+
+def outcome_of(history: List[Dict]) -> str:
+    last = history[-1]
+    if last["actor"] == "result":
+        return f"showdown_{last['winner']}"
+    return f"{last['actor']}_{last['move']}_{last['street']}"
+
+
+@dataclass
+class SimResult:
+    policy: str
+    hands: int = 0
+    net: float = 0.0  # hero chips won, summed over hands
+    net_sq: float = 0.0
+    actions: int = 0
+    seconds: float = 0.0  # CPU time inside workers
+    outcomes: Counter = field(default_factory=Counter)
+    big_blind: float = 1.0
+
+    def merge(self, other: "SimResult") -> None:
+        self.hands += other.hands
+        self.net += other.net
+        self.net_sq += other.net_sq
+        self.actions += other.actions
+        self.seconds += other.seconds
+        self.outcomes.update(other.outcomes)
+
+    @property
+    def bb_per_100(self) -> float:
+        return 100.0 * self.net / self.hands / self.big_blind if self.hands else 0.0
+
+    @property
+    def stderr_bb_per_100(self) -> float:
+        if self.hands < 2:
+            return 0.0
+        mean = self.net / self.hands
+        var = max(0.0, self.net_sq / self.hands - mean * mean) * self.hands / (self.hands - 1)
+        return 100.0 * math.sqrt(var / self.hands) / self.big_blind
+
+    def to_dict(self) -> Dict:
+        return {
+            "policy": self.policy,
+            "hands": self.hands,
+            "bbPer100": round(self.bb_per_100, 2),
+            "stderrBbPer100": round(self.stderr_bb_per_100, 2),
+            "actionsPerHand": round(self.actions / self.hands, 2) if self.hands else 0.0,
+            "outcomes": {k: round(v / self.hands, 4) for k, v in self.outcomes.most_common()} if self.hands else {},
+        }
+
+
+def play_session(
+    policy: str,
+    seed: int,
+    hands: int,
+    small_blind: float = 0.5,
+    big_blind: float = 1.0,
+    stack: float = 100.0,
+) -> SimResult:
+    """Play `hands` hands on one seeded table (the unit of work sent to the pool)."""
+    act = resolve_policy(policy)
+    rng = random.Random(seed)
+    adapter = PokerAdapter(small_blind=small_blind, big_blind=big_blind, stack=stack, seed=seed)
+    result = SimResult(policy=policy, big_blind=big_blind)
+    start = time.process_time()
+    for hand in range(hands):
+        if hand:
+            for p in adapter.players:
+                p.stack = stack
+            adapter.reset_hand()
+        # Blinds are already posted; the hero's committed chips count against the hand
+        before = stack
+        ops = 0
+        while adapter.street != "showdown" and ops < MAX_ACTIONS_PER_HAND:
+            action, size = act(adapter, rng)
+            adapter.apply_hero_action(action, size)
+            ops += 1
+        net = adapter.hero.stack - before
+        result.hands += 1
+        result.net += net
+        result.net_sq += net * net
+        result.actions += ops
+        result.outcomes[outcome_of(adapter.history)] += 1
+    result.seconds = time.process_time() - start
+    return result
+
+
+def simulate(
+    policies: Sequence[str],
+    hands: int = 1_000,
+    seeds: Sequence[int] = range(8),
+    workers: Optional[int] = None,
+    **table,
+) -> Dict:
+    """Run every policy over every seed; `workers <= 1` stays in-process."""
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    jobs = [(policy, seed) for policy in policies for seed in seeds]
+    for policy in policies:
+        resolve_policy(policy)
+    results = {policy: SimResult(policy=policy, big_blind=table.get("big_blind", 1.0)) for policy in policies}
+    start = time.perf_counter()
+    if workers <= 1:
+        parts = [play_session(policy, seed, hands, **table) for policy, seed in jobs]
+    else:
+        # spawn: forking a threaded server process is not safe
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(play_session, policy, seed, hands, **table) for policy, seed in jobs]
+            parts = [f.result() for f in futures]
+    wall = time.perf_counter() - start
+    for part in parts:
+        results[part.policy].merge(part)
+    total = sum(r.hands for r in results.values())
+    return {
+        "hands": total,
+        "wallSeconds": round(wall, 3),
+        "handsPerSec": round(total / wall, 1) if wall else 0.0,
+        "workers": workers,
+        "policies": [r.to_dict() for r in results.values()],
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless self-play over PokerAdapter")
+    parser.add_argument("--policy", nargs="+", default=["passive"], help=f"{sorted(POLICIES)} or module:function")
+    parser.add_argument("--hands", type=int, default=1_000, help="hands per seed")
+    parser.add_argument("--seeds", type=int, default=8, help="number of seeded tables per policy")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--stack", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    report = simulate(args.policy, hands=args.hands, seeds=range(args.seeds), workers=args.workers, stack=args.stack)
+    print(f"{report['hands']} hands in {report['wallSeconds']}s on {report['workers']} workers: {report['handsPerSec']} hands/s")
+    for r in report["policies"]:
+        print(f"\n{r['policy']}: {r['bbPer100']:+.2f} bb/100 (+/- {r['stderrBbPer100']:.2f}), {r['actionsPerHand']} actions/hand")
+        for outcome, share in r["outcomes"].items():
+            print(f"  {outcome:<24} {share:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
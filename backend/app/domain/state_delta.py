@@ -0,0 +1,86 @@
+"""Incremental state responses.
+
+Every mutation of a `PokerAdapter` bumps its `version`, and each state dict
+carries it as ``stateVersion``. A client that sends back the version it
+already has gets a delta instead of the full state:
+
+    {"stateVersion": 7, "baseVersion": 6, "delta": {...}, "historyAppend": [...]}
+
+`delta` is a merge patch: nested dicts are merged key by key and any other
+value replaces the old one. The exception is a list of dicts, such as
+per-seat player metadata, when its length is unchanged. Its patch is a dict
+from the string index to that element's patch. The state schema has a fixed
+set of keys, so no key is ever removed. History entries added since `baseVersion` are sent in
+`historyAppend`. When a new hand starts, the history is replaced instead and
+``delta["history"]`` holds the whole new list. If the base version is no
+longer in the adapter's small ring of recent states, the response falls back
+to ``{"state": ...}``.
+"""
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+
+def _is_record_list(value) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(v, dict) for v in value)
+
+
+def _diff(old: Dict, new: Dict, skip: Tuple[str, ...] = ()) -> Dict:
+    patch: Dict = {}
+    for key, value in new.items():
+        prev = old.get(key)
+        if prev is value or key in skip:
+            continue
+        if isinstance(value, dict) and isinstance(prev, dict):
+            sub = _diff(prev, value)
+            if sub:
+                patch[key] = sub
+        elif _is_record_list(value) and _is_record_list(prev) and len(value) == len(prev):
+            items = {str(i): _diff(a, b) for i, (a, b) in enumerate(zip(prev, value)) if a != b}
+            if items:
+                patch[key] = items
+        elif prev != value or key not in old:
+            patch[key] = value
+    return patch
+
+
+def diff_state(old: Dict, new: Dict) -> Dict:
+    """Delta payload turning state `old` into state `new`."""
+    old_history, new_history = old["history"], new["history"]
+    patch = _diff(old, new, skip=("history",))
+    n = len(old_history)
+    # Entries are shared between snapshots of the same hand, so the prefix check is mostly identity hits
+    if len(new_history) >= n and new_history[:n] == old_history:
+        append = new_history[n:]
+    else:
+        patch["history"] = new_history
+        append = []
+    return {
+        "stateVersion": new["stateVersion"],
+        "baseVersion": old["stateVersion"],
+        "delta": patch,
+        "historyAppend": append,
+    }
+
+
+def apply_delta(state: Dict, payload: Dict) -> Dict:
+    """Client-side merge of a `diff_state` payload (a full ``{"state": ...}`` is passed through)."""
+    if "state" in payload:
+        return payload["state"]
+
+    def merge(base, patch: Dict):
+        if isinstance(base, list):
+            out = list(base)
+            for index, value in patch.items():
+                out[int(index)] = merge(base[int(index)], value)
+            return out
+        out = dict(base)
+        for key, value in patch.items():
+            prev = base.get(key)
+            out[key] = merge(prev, value) if isinstance(value, dict) and isinstance(prev, (dict, list)) else value
+        return out
+
+    merged = merge(state, payload["delta"])
+    if payload["historyAppend"]:
+        merged["history"] = merged["history"] + payload["historyAppend"]
+    return merged
@@ -0,0 +1,228 @@
+"""Villain decision models.
+
+A model answers the three questions the engine asks the villain:
+
+- `preflop_call`: call the hero's raise, or fold?
+- `postflop_decide`: after the hero checks, bet (and how much) or check?
+- `call_bet`: call the hero's postflop bet, or fold?
+
+Sessions pick a model by name at ``/api/game/new`` (``villainModel``). The
+name lives on the adapter and in its snapshot, so a restored session keeps
+its opponent.
+
+``deterministic`` is the original rule set. Calls depend on pot odds and
+bets depend on board texture. It never looks at its own cards or at any
+precomputed data, so it plays the same on every host.
+
+``equity`` plays its cards. It answers a hero all-in preflop (heads-up)
+from the `pushfold` equilibrium call chart for the effective stack when
+one is built. Otherwise it estimates equity against the hero's range as
+the range engine reads it, then calls when that equity covers the price and
+value-bets when it is well ahead. Each decision has a bounded cost:
+
+- preflop: one row of the 169x169 equity matrix against the hero's range
+  collapsed to classes;
+- river: exact, one `evaluate_batch` over the hero's live combos;
+- flop/turn: `EQUITY_SAMPLES` sampled (hero combo, runout) pairs.
+
+The sample budget is a fixed count, not a wall-clock cutoff, and the RNG is
+seeded from the session seed and position in the hand. With the default
+budget the p99 stays well under 5 ms; see ``tests/benchmarks``.
+
+A model that reads precomputed data reports it in `data_identity`. The
+adapter stores that in its snapshot. `PokerAdapter.from_snapshot` raises
+`VillainDataChanged` when the data on this host differs, because replaying
+the action log against other data would silently diverge.
+"""
+from __future__ import annotations
+
+import zlib
+from typing import TYPE_CHECKING, Dict, Optional, Protocol, Tuple
+
+import numpy as np
+
+from ..core.config import VILLAIN_EQUITY_SAMPLES
+from ..core.metrics import ENGINE_SECONDS, timed
+from . import preflop_equity, pushfold, range_engine
+from .batch_eval import evaluate_batch
+from .ranges import COMBO_CLASS, COMBOS, NUM_CLASSES, unblocked
+
+if TYPE_CHECKING:
+    from .poker_adapter import PokerAdapter
+
+
+# Equity at which the equity villain bets when checked to
+VALUE_EQUITY = 0.6
+EQUITY_SAMPLES = VILLAIN_EQUITY_SAMPLES
+
+
+class VillainDataChanged(RuntimeError):
+    """A snapshot was taken against different villain data than this host has."""
+
+
+class VillainModel(Protocol):
+    opponent_type: str
+
+    def data_identity(self, adapter: "PokerAdapter") -> Optional[Dict]:
+        ...
+
+    def preflop_call(self, adapter: "PokerAdapter", to_call: int) -> bool:
+        ...
+
+    def postflop_decide(self, adapter: "PokerAdapter", features: Dict) -> Tuple[str, float]:
+        ...
+
+    def call_bet(self, adapter: "PokerAdapter", to_call: int) -> bool:
+        ...
+
+
+def pot_odds(adapter: "PokerAdapter", to_call: int) -> float:
+    """Share of the final pot the villain would be putting in (chips in cents)."""
+    return to_call / (adapter.pot_c + to_call) if to_call > 0 else 0.0
+
+
+def pushfold_call(adapter: "PokerAdapter") -> Optional[bool]:
+    """Equilibrium call-or-fold against a heads-up preflop shove, or None without a chart for the spot."""
+    if adapter.num_players != 2 or adapter.hero.stack_c > 0:
+        return None
+    effective = min(p.stack_c + p.contributed_c for p in (adapter.hero, adapter.villain))
+    chart = pushfold.lookup(effective / adapter.bb_c, adapter.sb_c / adapter.bb_c)
+    if chart is None:
+        return None
+    return bool(chart.call[preflop_equity.hole_class(adapter.villain.hole)] >= 0.5)
+
+
+class DeterministicVillain:
+    opponent_type = "deterministic_mock"
+
+    def data_identity(self, adapter: "PokerAdapter") -> Optional[Dict]:
+        return None
+
+    def preflop_call(self, adapter: "PokerAdapter", to_call: int) -> bool:
+        return self.call_bet(adapter, to_call)
+
+    def postflop_decide(self, adapter: "PokerAdapter", features: Dict) -> Tuple[str, float]:
+        # Bet on dry/high-card boards; check on very wet dynamic boards
+        board_type = features.get("type")
+        if board_type in ("dry",) or (features.get("highCardHeavy") and not features.get("monotone")):
+            return "bet", adapter.recommended_bet_size(adapter.pot, features)
+        return "check", 0.0
+
+    def call_bet(self, adapter: "PokerAdapter", to_call: int) -> bool:
+        # Deterministic threshold
+        return pot_odds(adapter, to_call) <= 0.4
+
+
+def hero_range(adapter: "PokerAdapter") -> np.ndarray:
+    """The hero's range as the range engine reads it, minus combos the villain's own cards block."""
+    weights = range_engine.tracker_for(adapter, "hero").update(adapter)
+    return weights * unblocked(adapter.villain.mask)
+
+
+def _decision_rng(adapter: "PokerAdapter") -> np.random.Generator:
+    spot = f"{adapter._rng_seed}:{adapter.hand_no}:{len(adapter.history)}"
+    return np.random.default_rng(zlib.crc32(spot.encode()))
+
+
+def _showdown_scores(villain: np.ndarray, hero: np.ndarray, board: np.ndarray) -> np.ndarray:
+    vs = evaluate_batch(np.concatenate([np.broadcast_to(villain, (len(hero), 2)), board], axis=1))
+    hs = evaluate_batch(np.concatenate([hero, board], axis=1))
+    return (vs > hs) + 0.5 * (vs == hs)
+
+
+def postflop_equity(adapter: "PokerAdapter", weights: np.ndarray, samples: int = EQUITY_SAMPLES) -> Optional[float]:
+    """Villain equity vs hero combos weighted by `weights` on the current board."""
+    live = np.flatnonzero(weights > 0)
+    if not len(live):
+        return None
+    villain = np.array(adapter.villain.hole, dtype=np.int8)
+    board = list(adapter._board)
+    missing = 5 - len(board)
+    if missing == 0:
+        # River: every hero combo exactly
+        shared = np.broadcast_to(np.array(board, dtype=np.int8), (len(live), 5))
+        scores = _showdown_scores(villain, COMBOS[live], shared)
+        return float(np.average(scores, weights=weights[live]))
+    rng = _decision_rng(adapter)
+    p = weights[live] / weights[live].sum()
+    hero = COMBOS[live[rng.choice(len(live), size=samples, p=p)]]
+    keys = rng.random((samples, 52), dtype=np.float32)
+    keys[:, board + list(adapter.villain.hole)] = 2.0
+    keys[np.arange(samples)[:, None], hero] = 2.0
+    runout = np.argpartition(keys, missing, axis=1)[:, :missing].astype(np.int8)
+    shared = np.concatenate([np.broadcast_to(np.array(board, dtype=np.int8), (samples, len(board))), runout], axis=1)
+    return float(_showdown_scores(villain, hero, shared).mean())
+
+
+def preflop_equity_vs(adapter: "PokerAdapter", weights: np.ndarray) -> Optional[float]:
+    """Villain class equity vs the hero range collapsed to classes (None without the matrix)."""
+    m = preflop_equity.matrix()
+    if m is None:
+        return None
+    by_class = np.bincount(COMBO_CLASS, weights=weights, minlength=NUM_CLASSES)
+    total = by_class.sum()
+    if total <= 0:
+        return None
+    return float(m[preflop_equity.hole_class(adapter.villain.hole)] @ by_class / total)
+
+
+class EquityVillain:
+    opponent_type = "equity"
+
+    def __init__(self, samples: int = EQUITY_SAMPLES) -> None:
+        self.samples = samples
+        self._fallback = DeterministicVillain()
+
+    def data_identity(self, adapter: "PokerAdapter") -> Optional[Dict]:
+        # The matrix drives preflop decisions and, through the range engine, the hero range on every street;
+        # the structure's push/fold charts answer preflop shoves
+        return {
+            "preflopEquity": preflop_equity.identity(),
+            "pushfold": pushfold.identity(adapter.sb_c / adapter.bb_c),
+        }
+
+    def equity(self, adapter: "PokerAdapter") -> Optional[float]:
+        weights = hero_range(adapter)
+        if adapter.street == "preflop":
+            return preflop_equity_vs(adapter, weights)
+        return postflop_equity(adapter, weights, self.samples)
+
+    @timed(ENGINE_SECONDS, "villain_decide")
+    def preflop_call(self, adapter: "PokerAdapter", to_call: int) -> bool:
+        shove = pushfold_call(adapter)
+        if shove is not None:
+            return shove
+        equity = self.equity(adapter)
+        if equity is None:
+            return self._fallback.preflop_call(adapter, to_call)
+        return equity >= pot_odds(adapter, to_call)
+
+    @timed(ENGINE_SECONDS, "villain_decide")
+    def postflop_decide(self, adapter: "PokerAdapter", features: Dict) -> Tuple[str, float]:
+        equity = self.equity(adapter)
+        if equity is None:
+            return self._fallback.postflop_decide(adapter, features)
+        if equity >= VALUE_EQUITY:
+            return "bet", adapter.recommended_bet_size(adapter.pot, features)
+        return "check", 0.0
+
+    @timed(ENGINE_SECONDS, "villain_decide")
+    def call_bet(self, adapter: "PokerAdapter", to_call: int) -> bool:
+        equity = self.equity(adapter)
+        if equity is None:
+            return self._fallback.call_bet(adapter, to_call)
+        return equity >= pot_odds(adapter, to_call)
+
+
+VILLAIN_MODELS: Dict[str, VillainModel] = {
+    "deterministic": DeterministicVillain(),
+    "equity": EquityVillain(),
+}
+DEFAULT_VILLAIN = "deterministic"
+
+
+def resolve_villain(name: Optional[str]) -> VillainModel:
+    model = VILLAIN_MODELS.get(name or DEFAULT_VILLAIN)
+    if model is None:
+        raise ValueError(f"unknown villain model {name!r}; choose from {sorted(VILLAIN_MODELS)}")
+    return model
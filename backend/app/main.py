@@ -1,11 +1,38 @@
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .routes import game, reason, review, coach, range, health
-
-
-def create_app() -> FastAPI:
-    app = FastAPI(title="Poker Trainer MVP", version="0.1.0")
+from .core.config import PROFILE_DIR, PROFILE_SECONDS, PROFILE_SIGNAL, SESSION_SWEEP_SECONDS
+from .core.metrics import Gauge, MetricsMiddleware, Registry
+from .core.profiler import install_signal_handler
+from .domain import preflop_equity, pushfold
+from .domain.game_manager import GameManager, game_manager
+from .routes import admin, game, reason, review, coach, range, health
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    manager: GameManager = app.state.game_manager
+    manager.start_sweeper(SESSION_SWEEP_SECONDS)
+    install_signal_handler(PROFILE_SIGNAL, PROFILE_SECONDS, PROFILE_DIR)
+    # Map the shared equity matrix and default push/fold charts now rather than on the first preflop decision
+    preflop_equity.matrix()
+    pushfold.charts()
+    yield
+    manager.stop_sweeper()
+    manager.close()
+
+
+def create_app(manager: Optional[GameManager] = None) -> FastAPI:
+    app = FastAPI(title="Poker Trainer MVP", version="0.1.0", lifespan=lifespan)
+    # Routes resolve the manager per app so several worker apps can share a process in tests
+    app.state.game_manager = manager if manager is not None else game_manager
+    # Per-app metrics, rendered next to the process-wide registry by /metrics
+    app.state.metrics = Registry()
+    sessions = app.state.metrics.register(Gauge("sessions_active", "Sessions resident in this worker's store"))
+    sessions.set_function(lambda: app.state.game_manager.stats()["resident"])
 
     app.add_middleware(
         CORSMiddleware,
@@ -14,8 +41,9 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(MetricsMiddleware)
 
-    for router in [game.router, reason.router, review.router, coach.router, range.router, health.router]:
+    for router in [game.router, reason.router, review.router, coach.router, range.router, health.router, admin.router]:
         app.include_router(router)
 
     return app
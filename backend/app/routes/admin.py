@@ -0,0 +1,33 @@
+import hmac
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from ..core import config
+from ..core.profiler import profile
+
+
+router = APIRouter()
+
+
+def _require_admin(token: str) -> None:
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(status_code=404)
+    if not hmac.compare_digest(token, config.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="admin token required")
+
+
+@router.get("/admin/profile", response_class=PlainTextResponse)
+def run_profile(
+    seconds: float = Query(10.0, gt=0, le=120),
+    interval: float = Query(0.005, ge=0.001, le=1.0),
+    idle: bool = False,
+    x_admin_token: str = Header(""),
+):
+    """Sample this worker for `seconds` and return collapsed stacks (flamegraph input).
+
+    Sync route: it sleeps in a threadpool thread while the event loop keeps serving.
+    """
+    _require_admin(x_admin_token)
+    result = profile(seconds, interval=interval, include_idle=idle)
+    if result is None:
+        raise HTTPException(status_code=409, detail="a profile is already running")
+    return PlainTextResponse(result)
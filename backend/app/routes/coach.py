@@ -1,8 +1,16 @@
 import asyncio
 import json
+import math
+import re
+from typing import Optional
 from uuid import uuid4
 from fastapi import APIRouter, Request
 from sse_starlette.sse import EventSourceResponse
+from ..core.metrics import SSE_STREAMS
+from ..domain.board_features import flop_key, flop_texture
+from ..domain import pushfold
+from ..domain.flop_cache import flop_cache
+from ..domain.ranges import CLASS_INDEX
 
 
 router = APIRouter()
@@ -14,13 +22,17 @@ async def coach_ask(payload: dict, request: Request):
 
     async def gen():
         # In a shared channel design, we would multiplex types; here we emit coach_suggestion
-        preface = "Consider position and pot odds. "
-        for token in (preface + question).split(" "):
-            if await request.is_disconnected():
-                break
-            await asyncio.sleep(0.03)
-            yield {"id": uuid4().hex, "data": json.dumps({"type": "coach_suggestion", "content": token + " "})}
-        yield {"id": "z", "data": json.dumps({"type": "end", "content": ""})}
+        SSE_STREAMS.inc("/api/coach/ask")
+        try:
+            preface = "Consider position and pot odds. "
+            for token in (preface + question).split(" "):
+                if await request.is_disconnected():
+                    break
+                await asyncio.sleep(0.03)
+                yield {"id": uuid4().hex, "data": json.dumps({"type": "coach_suggestion", "content": token + " "})}
+            yield {"id": "z", "data": json.dumps({"type": "end", "content": ""})}
+        finally:
+            SSE_STREAMS.dec("/api/coach/ask")
 
     if request.headers.get("accept", "").startswith("text/event-stream"):
         return EventSourceResponse(gen())
@@ -29,3 +41,48 @@ async def coach_ask(payload: dict, request: Request):
     return {"suggestion": "Consider position and pot odds."}
 
 
+
+
+@router.get("/api/coach/board")
+def board_report(board: str, hero: Optional[str] = None, villain: Optional[str] = None):
+    """Flop texture, combo category mix and (with both ranges) range-vs-range equity, served from the flop cache."""
+    cards = re.findall(r"[2-9TJQKA][shdc]", board)
+    if len(cards) < 3 or len(set(cards[:3])) < 3:
+        return {"error": "INVALID_BOARD"}
+    flop = cards[:3]
+    report = {"flop": flop_key(flop), "texture": flop_texture(flop), "categories": flop_cache().categories(flop)}
+    if hero and villain:
+        try:
+            report["equity"] = flop_cache().equity(flop, hero, villain)
+        except (ValueError, KeyError):
+            return {"error": "INVALID_RANGE"}
+    return report
+
+
+@router.get("/api/coach/pushfold")
+def pushfold_chart(stack: float, sb: float = 0.5, ante: float = 0.0, hand: Optional[str] = None):
+    """Heads-up push/fold equilibrium at an effective stack (BB): SB shove and BB call frequency per class."""
+    if hand is not None and hand not in CLASS_INDEX:
+        return {"error": "INVALID_HAND"}
+    if not all(map(math.isfinite, (stack, sb, ante))):
+        return {"error": "INVALID_STACK"}
+    grid = pushfold.charts(sb, ante)
+    if grid is None:
+        return {"error": "PUSHFOLD_CHARTS_MISSING"}
+    chart = grid.lookup(stack)
+    if chart is None:
+        stacks = grid.stacks
+        return {"error": "STACK_OUT_OF_RANGE", "min": float(stacks[0]), "max": float(stacks[-1])}
+    report = {
+        "stack": round(chart.stack, 4),
+        "sb": round(chart.sb, 4),
+        "ante": round(chart.ante, 4),
+        "push": chart.push.reshape(13, 13).round(4).tolist(),
+        "call": chart.call.reshape(13, 13).round(4).tolist(),
+        "pushShare": round(pushfold.range_share(chart.push), 4),
+        "callShare": round(pushfold.range_share(chart.call), 4),
+    }
+    if hand is not None:
+        i = CLASS_INDEX[hand]
+        report["hand"] = {"class": hand, "push": round(float(chart.push[i]), 4), "call": round(float(chart.call[i]), 4)}
+    return report
@@ -1,6 +1,7 @@
-from typing import Dict
-from fastapi import APIRouter
-from ..domain.game_manager import game_manager
+from typing import Dict, Optional
+from fastapi import APIRouter, Depends, Response
+from ..core.deps import get_game_manager
+from ..domain.game_manager import GameManager
 
 
 router = APIRouter()
@@ -9,7 +10,7 @@ _sessions: Dict[str, Dict] = {}
 
 
 @router.post("/api/game/new")
-def new_game(payload: Dict):
+def new_game(payload: Dict, game_manager: GameManager = Depends(get_game_manager)):
     # TODO: Add variable new game options
     return game_manager.new_game(
         small_blind=float(payload.get("smallBlind", 0.5)),
@@ -17,24 +18,40 @@ def new_game(payload: Dict):
         stack=float(payload.get("stack", 100)),
         seed=int(payload.get("seed", 42)),
         num_players=int(payload.get("numPlayers", 2)),
+        villain_model=payload.get("villainModel"),
     )
 
 
 @router.post("/api/game/action")
-def apply_action(payload: Dict):
+def apply_action(payload: Dict, game_manager: GameManager = Depends(get_game_manager)):
     return game_manager.apply_action(
         session_id=payload["sessionId"],
         action=payload["action"],
         size=payload.get("size"),
+        since=payload.get("stateVersion"),
+    )
+
+
+@router.post("/api/game/batch")
+def apply_batch(payload: Dict, game_manager: GameManager = Depends(get_game_manager)):
+    return game_manager.apply_batch(
+        session_id=payload["sessionId"],
+        ops=payload.get("ops", []),
+        include_intermediate=bool(payload.get("includeIntermediate", False)),
+        since=payload.get("stateVersion"),
     )
 
 
 @router.get("/api/game/state")
-def get_state(sessionId: str):
-    return game_manager.get_state(sessionId)
+def get_state(sessionId: str, stateVersion: Optional[int] = None, game_manager: GameManager = Depends(get_game_manager)):
+    # Polling hot path: serve the cached encoded state without re-serializing
+    return Response(game_manager.get_state_json(sessionId, since=stateVersion), media_type="application/json")
 
 
 @router.post("/api/game/reset")
-def reset_game(payload: Dict):
-    return game_manager.reset_game(session_id=payload["sessionId"], seed=payload.get("seed"))
-
+def reset_game(payload: Dict, game_manager: GameManager = Depends(get_game_manager)):
+    return game_manager.reset_game(
+        session_id=payload["sessionId"],
+        seed=payload.get("seed"),
+        since=payload.get("stateVersion"),
+    )
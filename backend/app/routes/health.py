@@ -1,4 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
+from ..core.deps import get_game_manager
+from ..core.metrics import REGISTRY
+from ..domain.game_manager import GameManager
 
 
 router = APIRouter()
@@ -9,3 +13,14 @@ def health():
     return {"ok": True}
 
 
+@router.get("/health/sessions")
+def session_stats(game_manager: GameManager = Depends(get_game_manager)):
+    return game_manager.stats()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(request: Request, game_manager: GameManager = Depends(get_game_manager)):
+    # Prometheus text exposition format 0.0.4; every sample carries this worker's index
+    labels = {"worker": str(game_manager.shard[0])}
+    body = REGISTRY.render(labels) + request.app.state.metrics.render(labels)
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
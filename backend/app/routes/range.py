@@ -1,15 +1,32 @@
-from typing import Literal
-from fastapi import APIRouter
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends
+from ..core.deps import get_game_manager
+from ..domain import preflop_equity
+from ..domain.game_manager import GameManager
+from ..domain.ranges import CLASS_INDEX
 
 
 router = APIRouter()
 
 
 @router.get("/api/range/estimate")
-def estimate_range(sessionId: str, perspective: Literal["hero", "villain"]):
-    # Simple uniform grid placeholder
-    val = 1.0 / 169.0
-    grid = [[val for _ in range(13)] for _ in range(13)]
-    return {"grid": grid}
+def estimate_range(sessionId: str, perspective: Literal["hero", "villain"], game_manager: GameManager = Depends(get_game_manager)):
+    # Kept incrementally per session: each call only folds in actions since the last one
+    return game_manager.estimate_range(sessionId, perspective)
 
 
+@router.get("/api/range/equity")
+def preflop_class_equity(hand: str, vs: Optional[str] = None):
+    """Preflop all-in equity of a hand class ("AKs") vs a class or range ("QQ+, AQs"); any two cards if omitted."""
+    if hand not in CLASS_INDEX:
+        return {"error": "INVALID_HAND"}
+    try:
+        if vs in CLASS_INDEX:
+            equity = preflop_equity.class_equity(hand, vs)
+        else:
+            equity = preflop_equity.equity_vs_range(hand, vs or None)
+    except (ValueError, KeyError):
+        return {"error": "INVALID_RANGE"}
+    if equity is None:
+        return {"error": "EQUITY_MATRIX_MISSING"}
+    return {"hand": hand, "vs": vs or "random", "equity": round(equity, 4)}
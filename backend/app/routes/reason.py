@@ -3,6 +3,7 @@ import json
 from uuid import uuid4
 from fastapi import APIRouter, Request
 from sse_starlette.sse import EventSourceResponse
+from ..core.metrics import SSE_STREAMS
 
 
 router = APIRouter()
@@ -24,8 +25,12 @@ async def reason_stream(sessionId: str, archetype: str, request: Request):
 
     async def with_heartbeat():
         # Simple heartbeat every 10s emitting empty token to keep connection alive
-        async for evt in gen():
-            yield evt
+        SSE_STREAMS.inc("/api/reason/stream")
+        try:
+            async for evt in gen():
+                yield evt
+        finally:
+            SSE_STREAMS.dec("/api/reason/stream")
         # Note: in real impl we'd push periodic heartbeats while stream is open
 
     return EventSourceResponse(with_heartbeat())
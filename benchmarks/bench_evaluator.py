@@ -0,0 +1,54 @@
+"""Seven-card evaluation throughput: legacy `_best_five_from_seven` vs `evaluator`
+and the NumPy `evaluate_batch` path.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_evaluator [num_hands]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from backend.app.domain.batch_eval import evaluate_batch, to_array
+from backend.app.domain.cards import generate_deck, to_ints
+from backend.app.domain.evaluator import evaluate
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def _hands(n: int, seed: int = 1234):
+    rng = random.Random(seed)
+    deck = generate_deck()
+    return [rng.sample(deck, 7) for _ in range(n)]
+
+
+def _rate(fn, hands) -> float:
+    start = time.perf_counter()
+    for h in hands:
+        fn(h)
+    return len(hands) / (time.perf_counter() - start)
+
+
+def main(argv=None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    n = int(args[0]) if args else 200_000
+    hands = _hands(n)
+    int_hands = [to_ints(h) for h in hands]
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+
+    before = _rate(adapter._best_five_from_seven, hands)
+    after = _rate(evaluate, int_hands)
+    array = to_array(hands)
+    start = time.perf_counter()
+    evaluate_batch(array)
+    batch = n / (time.perf_counter() - start)
+    print(f"hands:                   {n}")
+    print(f"before (_best_five):     {before:,.0f} hands/sec")
+    print(f"after  (evaluator):      {after:,.0f} hands/sec")
+    print(f"batch  (evaluate_batch): {batch:,.0f} hands/sec")
+    print(f"speedup:                 {after / before:.1f}x scalar, {batch / before:.1f}x batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Resident bytes per training session for 2-, 6- and 9-handed tables.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_memory [sessions_per_size]
+
+Each session is a `PokerAdapter` that has played to the flop, so the
+figure includes dealt cards, board and a short `history`.
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def bytes_per_session(num_players: int, sessions: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = []
+    for seed in range(sessions):
+        adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=seed, num_players=num_players)
+        adapter.apply_hero_action("call")
+        held.append(adapter)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / sessions
+
+
+def main(argv=None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    sessions = int(args[0]) if args else 2_000
+    # Warm lazily built tables so they are not charged to the first size
+    PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=0).apply_hero_action("call")
+    print(f"sessions per size: {sessions}")
+    for num_players in (2, 6, 9):
+        per = bytes_per_session(num_players, sessions)
+        print(f"{num_players}-handed: {per:,.0f} bytes/session  (~{1024 ** 3 / per:,.0f} sessions per GiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Per-action latency of `GameManager` with and without SQLite persistence.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_persistence [hands]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.persistence import SessionRepository
+
+
+def _play(manager: GameManager, hands: int) -> float:
+    session_id = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=1)["sessionId"]
+    ops = 0
+    start = time.perf_counter()
+    for _ in range(hands):
+        for action in ("call", "check", "check", "check"):
+            manager.apply_action(session_id, action, None)
+            ops += 1
+        manager.reset_game(session_id)
+        ops += 1
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+def main(argv=None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    hands = int(args[0]) if args else 5_000
+    memory_only = _play(GameManager(), hands)
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = SessionRepository(os.path.join(tmp, "bench.db"))
+        persisted = _play(GameManager(repository=repository), hands)
+        start = time.perf_counter()
+        repository.close()
+        drain = time.perf_counter() - start
+    print(f"hands:                 {hands}")
+    print(f"in-memory:             {memory_only:.1f} us/op")
+    print(f"with persistence:      {persisted:.1f} us/op")
+    print(f"writer drain at close: {drain * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
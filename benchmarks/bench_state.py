@@ -0,0 +1,41 @@
+"""Cost of serving a state poll: full recompute vs the per-version cache.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_state [polls]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def _per_poll(fn, polls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(polls):
+        fn()
+    return (time.perf_counter() - start) / polls * 1e6
+
+
+def main(argv=None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    polls = int(args[0]) if args else 20_000
+    print(f"polls: {polls}")
+    for seats in (2, 6, 9):
+        adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1, num_players=seats)
+        adapter.apply_hero_action("call")
+
+        def uncached() -> bytes:
+            adapter.touch()
+            return json.dumps(adapter.get_state("s")).encode()
+
+        cold = _per_poll(uncached, polls)
+        warm = _per_poll(lambda: adapter.state_json("s"), polls)
+        print(f"{seats} seats: recompute+encode {cold:7.1f} us   cached bytes {warm:5.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,7 +33,7 @@ export default function App() {
         if (!sid) return
         const street = useStore.getState().gameState?.street
         const action = street === 'preflop' ? 'call' : 'check'
-        const r = await applyAction(sid, action)
+        const r = await applyAction(sid, action, undefined, useStore.getState().gameState)
         useStore.getState().setGameState(r.state)
       }}>{gameState?.street === 'preflop' ? 'Call (to see flop)' : 'Check (exercise villain)'}</button>
       <div style={{ marginTop: 8 }}>
@@ -64,7 +64,7 @@ export default function App() {
             <button onClick={async () => {
               const sid = useStore.getState().sessionId
               if (!sid) return
-              const r = await resetGame(sid)
+              const r = await resetGame(sid, undefined, useStore.getState().gameState)
               useStore.getState().setGameState(r.state)
             }}>Next Hand</button>
           </div>
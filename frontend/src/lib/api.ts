@@ -13,30 +13,68 @@ export async function createSession(params?: {
   return res.json() as Promise<{ sessionId: string; state: any }>
 }
 
-export async function applyAction(sessionId: string, action: string, size?: number) {
+// Incremental responses: sending the last known stateVersion gets a merge patch
+// (`delta` + `historyAppend`) instead of the full state; see backend state_delta.py
+type StatePayload =
+  | { state: any }
+  | { stateVersion: number; baseVersion: number; delta: any; historyAppend: any[] }
+
+function mergePatch(base: any, patch: any): any {
+  const out: any = Array.isArray(base) ? [...base] : { ...base }
+  for (const [key, value] of Object.entries(patch)) {
+    const prev = base?.[key as any]
+    const nested = value !== null && typeof value === 'object' && !Array.isArray(value)
+    out[key] = nested && prev !== null && typeof prev === 'object' ? mergePatch(prev, value) : value
+  }
+  return out
+}
+
+export function applyStatePayload(base: any, payload: StatePayload): any {
+  if (!('delta' in payload)) return (payload as any).state
+  const merged = mergePatch(base, payload.delta)
+  if (payload.historyAppend.length) merged.history = [...merged.history, ...payload.historyAppend]
+  return merged
+}
+
+export async function applyAction(sessionId: string, action: string, size?: number, base?: any) {
   const res = await fetch('/api/game/action', {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
-    body: JSON.stringify({ sessionId, action, size }),
+    body: JSON.stringify({ sessionId, action, size, stateVersion: base?.stateVersion }),
   })
   if (!res.ok) throw new Error('Failed to apply action')
-  return res.json() as Promise<{ state: any; aiActionApplied: boolean }>
+  const payload = (await res.json()) as StatePayload & { aiActionApplied: boolean }
+  return { state: applyStatePayload(base, payload), aiActionApplied: payload.aiActionApplied }
 }
 
-export async function getState(sessionId: string) {
-  const res = await fetch(`/api/game/state?sessionId=${encodeURIComponent(sessionId)}`)
+export async function getState(sessionId: string, base?: any) {
+  const since = base?.stateVersion !== undefined ? `&stateVersion=${base.stateVersion}` : ''
+  const res = await fetch(`/api/game/state?sessionId=${encodeURIComponent(sessionId)}${since}`)
   if (!res.ok) throw new Error('Failed to get state')
-  return res.json() as Promise<{ state: any }>
+  return { state: applyStatePayload(base, (await res.json()) as StatePayload) }
 }
 
-export async function resetGame(sessionId: string, seed?: number) {
+export async function resetGame(sessionId: string, seed?: number, base?: any) {
   const res = await fetch('/api/game/reset', {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
-    body: JSON.stringify({ sessionId, seed }),
+    body: JSON.stringify({ sessionId, seed, stateVersion: base?.stateVersion }),
   })
   if (!res.ok) throw new Error('Failed to reset game')
-  return res.json() as Promise<{ state: any }>
+  return { state: applyStatePayload(base, (await res.json()) as StatePayload) }
 }
 
 
+
+export type BatchOp = { action: string; size?: number } | { reset: true; seed?: number }
+
+export async function applyBatch(sessionId: string, ops: BatchOp[], base?: any, includeIntermediate = false) {
+  const res = await fetch('/api/game/batch', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ sessionId, ops, includeIntermediate, stateVersion: base?.stateVersion }),
+  })
+  if (!res.ok) throw new Error('Failed to apply batch')
+  const payload = (await res.json()) as StatePayload & { applied: number; states?: any[] }
+  return { state: applyStatePayload(base, payload), applied: payload.applied, states: payload.states }
+}
@@ -0,0 +1,114 @@
+"""Engine performance suite (pytest-benchmark).
+
+In a plain ``pytest`` run each benchmark body runs once as a smoke test. Timing
+and the regression check are opt-in:
+
+    python -m pytest tests/benchmarks --perf                     # time and compare to baseline.json
+    python -m pytest tests/benchmarks --perf --perf-tolerance 0.5
+    python -m pytest tests/benchmarks --perf --perf-update       # re-record baseline.json
+
+Each median is stored relative to a fixed pure-Python calibration loop timed
+right next to it. That cancels most of the machine speed and CPU frequency
+drift between the recording run and the checking run. A benchmark fails when
+its normalized median exceeds the baseline by more than the tolerance: the
+baseline file's "tolerance" unless overridden.
+"""
+import json
+import os
+import platform
+import statistics
+import time
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:  # optional dev dependency
+    collect_ignore_glob = ["test_*.py"]
+
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+_measured = {}
+
+
+def _calibration_unit() -> float:
+    """Median time of a fixed interpreter-bound workload (dict/list/int ops)."""
+    def workload():
+        d = {}
+        for i in range(2000):
+            d[i & 255] = d.get(i & 255, 0) + i
+        return sorted(d.values())
+
+    samples = []
+    for _ in range(21):
+        start = time.perf_counter()
+        workload()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf")
+    group.addoption("--perf", action="store_true", help="time benchmarks and compare against the stored baseline")
+    group.addoption("--perf-tolerance", type=float, default=None, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    group.addoption("--perf-update", action="store_true", help="rewrite the stored baseline with this run's medians")
+
+
+def _load_baseline():
+    if not os.path.exists(BASELINE_FILE):
+        return {"tolerance": 0.5, "benchmarks": {}}
+    with open(BASELINE_FILE) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def perf_baseline():
+    return _load_baseline()
+
+
+@pytest.fixture
+def bench(benchmark, request, perf_baseline):
+    """Run `fn` under pytest-benchmark and check its median against the baseline.
+
+    With `setup`, every round gets fresh arguments from ``setup()`` (returning
+    ``(args, kwargs)``), which is how stateful engine calls are measured.
+    """
+    config = request.config
+    timed = config.getoption("--perf", default=False)
+    benchmark.disabled = not timed
+
+    def run(fn, *args, setup=None, rounds=1000):
+        if setup is not None:
+            result = benchmark.pedantic(fn, setup=setup, rounds=rounds, warmup_rounds=min(10, rounds))
+        else:
+            result = benchmark(fn, *args)
+        if not timed:
+            return result
+        name = request.node.name
+        median = benchmark.stats.stats.median
+        relative = median / _calibration_unit()
+        _measured[name] = relative
+        baseline = perf_baseline["benchmarks"].get(name)
+        if baseline is not None and not config.getoption("--perf-update", default=False):
+            tolerance = config.getoption("--perf-tolerance", default=None)
+            if tolerance is None:
+                tolerance = perf_baseline.get("tolerance", 0.5)
+            assert relative <= baseline * (1 + tolerance), (
+                f"{name}: {relative:.2f} calibration units (median {median * 1e6:.1f}us) "
+                f"exceeds baseline {baseline:.2f} +{tolerance:.0%}"
+            )
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session):
+    if not _measured or not session.config.getoption("--perf-update", default=False):
+        return
+    data = _load_baseline()
+    data["machine"] = f"{platform.python_implementation()} {platform.python_version()} {platform.machine()}"
+    data["benchmarks"].update({name: round(relative, 6) for name, relative in sorted(_measured.items())})
+    with open(BASELINE_FILE, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.domain.cards import to_strs
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.main import create_app
+
+
+def _adapter(seats: int = 2, seed: int = 1) -> PokerAdapter:
+    return PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=seed, num_players=seats)
+
+
+def _deals(n: int, cards: int, seed: int = 1):
+    rng = random.Random(seed)
+    return [rng.sample(range(52), cards) for _ in range(n)]
+
+
+def _showdown_table(seats: int) -> PokerAdapter:
+    """River with every seat live, three contribution tiers and two all-in tiers."""
+    adapter = _adapter(seats, seed=seats)
+    deck = list(range(52))
+    random.Random(seats).shuffle(deck)
+    for i, p in enumerate(adapter.players):
+        p.folded = False
+        p.hole = deck[2 * i:2 * i + 2]
+        p.contributed = 10.0 * (1 + i % 3)
+        p.stack = 50.0 if i % 3 == 2 else 0.0
+    adapter._board = deck[2 * seats:2 * seats + 5]
+    adapter.pot = sum(p.contributed for p in adapter.players)
+    adapter.street = "river"
+    return adapter
+
+
+def test_best_five_from_seven(bench):
+    adapter = _adapter()
+    hands = [to_strs(h) for h in _deals(100, 7)]
+    bench(lambda: [adapter._best_five_from_seven(h) for h in hands])
+
+
+@pytest.mark.parametrize("seats", [2, 6, 9])
+def test_evaluate_showdown(bench, seats):
+    bench(PokerAdapter._evaluate_showdown, setup=lambda: ((_showdown_table(seats),), {}))
+
+
+def test_calculate_side_pots_many_tiers(bench):
+    adapter = _adapter(9)
+    for i, p in enumerate(adapter.players):
+        p.folded = False
+        p.contributed = 5.0 * (i + 1)
+        p.stack = 0.0
+    adapter.pot = sum(p.contributed for p in adapter.players)
+    pots = bench(adapter.calculate_side_pots)
+    assert len(pots) == 9
+
+
+def test_classify_board(bench):
+    boards = _deals(100, 5, seed=2)
+    bench(lambda: [PokerAdapter.classify_board(b, 4.0) for b in boards])
+
+
+def test_get_state_serialization(bench):
+    adapter = _adapter(9)
+    adapter.apply_hero_action("call")
+
+    def poll() -> bytes:
+        adapter.touch()
+        return adapter.state_json("s")
+
+    bench(poll)
+
+
+def test_reset_hand(bench):
+    adapter = _adapter(6)
+    bench(adapter.reset_hand)
+
+
+def test_http_action_round_trip(bench):
+    manager = GameManager()
+    client = TestClient(create_app(manager))
+    sid = client.post("/api/game/new", json={"seed": 1}).json()["sessionId"]
+    payload = {"sessionId": sid, "action": "call"}
+
+    def fresh_hand():
+        manager.reset_game(sid)
+        return (), {}
+
+    response = bench(lambda: client.post("/api/game/action", json=payload), setup=fresh_hand)
+    assert response.status_code == 200
+
+
+def test_equity_villain_decision(bench):
+    """Flop call-or-fold of the equity villain at the default sample budget (p99 target: 5 ms)."""
+    from backend.app.domain.villain import resolve_villain
+
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=4, villain_model="equity")
+    adapter.apply_hero_action("raise", 3.0)
+    model = resolve_villain("equity")
+    bench(model.call_bet, adapter, adapter.pot_c)
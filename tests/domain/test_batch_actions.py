@@ -0,0 +1,68 @@
+import sqlite3
+
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.persistence import SessionRepository
+
+DRILL = [
+    {"action": "call"},
+    {"action": "check"},
+    {"action": "bet", "size": 2.0},
+    {"reset": True},
+    {"action": "raise", "size": 3.0},
+    {"reset": True, "seed": 9},
+    {"action": "call"},
+]
+
+
+def _session(manager: GameManager) -> str:
+    return manager.new_game(small_blind=0.5, big_blind=1.0, stack=100.0, seed=4)["sessionId"]
+
+
+def test_batch_matches_sequential_requests():
+    sequential, batched = GameManager(), GameManager()
+    sid_a, sid_b = _session(sequential), _session(batched)
+    for op in DRILL:
+        if op.get("reset"):
+            sequential.reset_game(sid_a, seed=op.get("seed"))
+        else:
+            sequential.apply_action(sid_a, op["action"], op.get("size"))
+
+    result = batched.apply_batch(sid_b, DRILL)
+    assert result["applied"] == len(DRILL) and "states" not in result
+    expected = sequential.get_state(sid_a)["state"]
+    assert result["state"] == {**expected, "sessionId": sid_b}
+
+
+def test_batch_intermediate_states_and_delta():
+    manager = GameManager()
+    sid = _session(manager)
+    base = manager.get_state(sid)["state"]
+    result = manager.apply_batch(sid, DRILL[:3], include_intermediate=True, since=base["stateVersion"])
+    assert [s["stateVersion"] for s in result["states"]] == [1, 2, 3]
+    assert result["baseVersion"] == 0 and result["stateVersion"] == 3
+
+
+def test_invalid_batch_is_rejected_before_applying():
+    manager = GameManager()
+    sid = _session(manager)
+    result = manager.apply_batch(sid, [{"action": "call"}, {"size": 2.0}])
+    assert result == {"error": "INVALID_OP", "index": 1}
+    assert manager.get_state(sid)["state"]["stateVersion"] == 0
+    assert manager.apply_batch("missing", []) == {"error": "SESSION_NOT_FOUND"}
+
+
+def test_malformed_op_leaves_state_and_log_untouched(tmp_path):
+    repository = SessionRepository(str(tmp_path / "sessions.db"))
+    manager = GameManager(repository=repository)
+    sid = _session(manager)
+    before = manager.get_state(sid)
+
+    for bad in ({"action": "call", "size": [1]}, {"action": "shove"}, {"action": "bet", "size": float("nan")}):
+        assert manager.apply_batch(sid, [{"action": "call"}, bad]) == {"error": "INVALID_OP", "index": 1}
+        assert manager.apply_action(sid, bad["action"], bad.get("size"))["error"] == "INVALID_ACTION"
+
+    repository.flush()
+    assert manager.get_state(sid) == before
+    logged = sqlite3.connect(repository.path).execute("SELECT COUNT(*) FROM actions").fetchone()[0]
+    assert logged == 0 and repository.refusal(sid) is None
+    manager.close()
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from backend.app.domain.batch_eval import evaluate_batch, to_array
+from backend.app.domain.evaluator import evaluate, evaluate_strs
+
+
+@pytest.mark.parametrize("k", [5, 6, 7])
+def test_batch_matches_scalar(k):
+    rng = np.random.default_rng(k)
+    hands = np.array([rng.choice(52, size=k, replace=False) for _ in range(5000)], dtype=np.int8)
+
+    batch = evaluate_batch(hands)
+
+    assert batch.dtype == np.int32
+    assert batch.tolist() == [evaluate(h) for h in hands.tolist()]
+
+
+def test_batch_flushes_and_straights():
+    hands = [
+        ["Ah", "Kh", "Qh", "Jh", "Th", "2c", "3d"],
+        ["Ah", "2h", "3h", "4h", "9h", "Kc", "Kd"],
+        ["As", "2d", "3c", "4h", "5s", "Kc", "Kd"],
+        ["Ks", "Kd", "Kc", "2h", "2s", "9h", "8h"],
+    ]
+    batch = evaluate_batch(to_array(hands))
+    assert batch.tolist() == [evaluate_strs(h) for h in hands]
+    assert batch[0] > batch[3] > batch[1] > batch[2]
+
+
+def test_batch_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        evaluate_batch(np.zeros((3, 4), dtype=np.int8))
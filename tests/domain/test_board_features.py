@@ -67,3 +67,53 @@ def test_hu_contributions_and_toact_on_flop():
     assert ad.villain.contributed >= 0
 
 
+
+
+def _reference_features(board):
+    """Original per-call classify_board rules, kept to check the table."""
+    suits = [c[1] for c in board[:3]]
+    ranks = sorted([PokerAdapter._rank_to_val(c) for c in board[:3]])
+    feats = {"monotone": len(set(suits)) == 1, "paired": len(set(ranks)) < 3, "connected": (ranks[-1] - ranks[0]) <= 4}
+    feats["highCardHeavy"] = sum(1 for r in ranks if r >= 12) >= 2 or ranks[-1] >= 12
+    feats["type"] = "wet" if feats["monotone"] or feats["connected"] else "dry"
+    if feats["connected"] and feats["highCardHeavy"]:
+        feats["type"] = "dynamic"
+    return feats
+
+
+def test_flop_table_has_1755_classes_and_matches_rules():
+    from itertools import combinations
+
+    from backend.app.domain.board_features import build_table, flop_key
+    from backend.app.domain.cards import generate_deck
+
+    table = build_table()
+    assert len(table) == 1755
+    for flop in combinations(generate_deck(), 3):
+        feats = PokerAdapter.classify_board(list(flop), spr=4)
+        assert feats == {**_reference_features(flop), "sprBucket": "mid"}, flop
+        assert table[flop_key(flop)] == {k: v for k, v in feats.items() if k != "sprBucket"}
+
+
+def test_flop_key_is_suit_isomorphic():
+    from backend.app.domain.board_features import flop_key
+
+    assert flop_key(["Kh", "Ks", "7h"]) == flop_key(["Kd", "7d", "Kc"]) == "KK7aba"
+    assert flop_key(["Kh", "Ks", "7d"]) == "KK7abc"
+    assert flop_key(["9h", "8h", "7h"]) == "987aaa"
+
+
+def test_flop_table_disk_cache_rebuilds_on_version_change(tmp_path):
+    import json
+
+    from backend.app.domain import board_features
+
+    table = board_features.load_table(str(tmp_path))
+    path = tmp_path / board_features.TABLE_FILE
+    stored = json.loads(path.read_text())
+    assert stored["version"] == board_features.TEXTURE_VERSION
+    assert stored["flops"] == table
+
+    path.write_text(json.dumps({"version": -1, "flops": {}}))
+    assert board_features.load_table(str(tmp_path)) == table
+    assert json.loads(path.read_text())["version"] == board_features.TEXTURE_VERSION
@@ -0,0 +1,37 @@
+from backend.app.domain.cards import CARD_INDEX, generate_deck, mask_of, to_strs
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def test_int_encoding_matches_generate_deck():
+    deck = generate_deck()
+    assert [CARD_INDEX[c] for c in deck] == list(range(52))
+    assert to_strs(range(52)) == deck
+
+
+def test_deal_advances_pointer_without_reallocating_deck():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=5, num_players=3)
+    deck = adapter._deck
+    assert adapter._deck_pos == 6
+
+    adapter.apply_hero_action("call")
+    assert adapter._deck_pos == 9
+    assert adapter.board == to_strs(adapter._deck[6:9])
+
+    adapter.reset_hand()
+    assert adapter._deck is deck
+    assert sorted(adapter._deck) == list(range(52))
+    dealt = [c for p in adapter.players for c in p.hole]
+    assert len(set(dealt)) == 6
+    assert len(adapter.deck) == 46
+
+
+def test_cards_round_trip_and_masks():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=5)
+    adapter.hero.cards = ["As", "Kd"]
+    adapter.board = ["2c", "7h", "Ts"]
+
+    assert adapter.hero.hole == [CARD_INDEX["As"], CARD_INDEX["Kd"]]
+    assert adapter.hero.cards == ["As", "Kd"]
+    assert adapter.hero.mask & adapter.board_mask == 0
+    assert adapter.board_mask == mask_of(CARD_INDEX[c] for c in ["2c", "7h", "Ts"])
+    assert adapter.get_state("s")["board"] == ["2c", "7h", "Ts"]
@@ -0,0 +1,30 @@
+import random
+
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.domain.simulate import POLICIES
+
+
+def test_chips_are_conserved_exactly():
+    """Integer cents: stacks plus pot never drift, whatever the bet sizes."""
+    adapter = PokerAdapter(small_blind=0.05, big_blind=0.1, stack=10.0, seed=3, num_players=2)
+    policy, rng = POLICIES["random"], random.Random(3)
+    total = sum(p.stack_c for p in adapter.players) + adapter.pot_c
+    for _ in range(200):
+        while adapter.street != "showdown":
+            adapter.apply_hero_action(*policy(adapter, rng))
+            assert sum(p.stack_c for p in adapter.players) + adapter.pot_c == total
+        # Refill between hands, as the simulator does, so nobody plays from a busted stack
+        for p in adapter.players:
+            p.stack_c = 1000
+        adapter.reset_hand()
+        assert sum(p.stack_c for p in adapter.players) + adapter.pot_c == total
+
+
+def test_float_views_round_trip():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    adapter.hero.stack = 12.34
+    adapter.pot = 0.3
+    adapter.touch()
+    assert adapter.hero.stack_c == 1234 and adapter.pot_c == 30
+    state = adapter.get_state("s")
+    assert state["hero"]["stack"] == 12.34 and state["pot"] == 0.3
@@ -0,0 +1,67 @@
+import sys
+import threading
+
+from backend.app.domain.game_manager import GameManager
+
+STACK = 100.0
+HAND = [{"action": "call"}, {"action": "check"}, {"action": "bet", "size": 2.0}, {"action": "check"}, {"reset": True}]
+
+
+def _chips(state: dict) -> float:
+    return sum(p["stack"] for p in state["metadata"]["players"][:2]) + state["pot"]
+
+
+def test_one_session_hammered_from_many_threads_conserves_chips():
+    """Whole-hand batches from many writers plus concurrent readers on one session."""
+    manager = GameManager()
+    sid = manager.new_game(small_blind=0.5, big_blind=1.0, stack=STACK, seed=7)["sessionId"]
+    threads, hands = 8, 40
+    errors = []
+
+    def writer() -> None:
+        for _ in range(hands):
+            manager.apply_batch(sid, HAND)
+
+    def reader(stop: threading.Event) -> None:
+        while not stop.is_set():
+            state = manager.get_state(sid)["state"]
+            if abs(_chips(state) - 2 * STACK) > 0.011:
+                errors.append(state)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # force frequent thread switches to provoke races
+    stop = threading.Event()
+    readers = [threading.Thread(target=reader, args=(stop,)) for _ in range(2)]
+    writers = [threading.Thread(target=writer) for _ in range(threads)]
+    try:
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join()
+    finally:
+        stop.set()
+        for t in readers:
+            t.join()
+        sys.setswitchinterval(interval)
+
+    adapter = manager.store.get(sid)
+    assert not errors
+    # No lost updates: every op bumped the version exactly once
+    assert adapter.version == threads * hands * len(HAND)
+    assert adapter.hand_no == threads * hands
+    assert abs(adapter.hero.stack + adapter.villain.stack + adapter.pot - 2 * STACK) < 1e-6
+
+
+def test_sessions_on_different_stripes_do_not_block_each_other():
+    manager = GameManager(lock_stripes=64)
+    a = manager.new_game(small_blind=0.5, big_blind=1.0, stack=STACK, seed=1)["sessionId"]
+    b = next(
+        sid for sid in (manager.new_game(small_blind=0.5, big_blind=1.0, stack=STACK, seed=2)["sessionId"] for _ in range(64))
+        if hash(sid) % 64 != hash(a) % 64
+    )
+    lock_a = manager._locks[hash(a) % 64]
+    with lock_a:
+        # `a` is locked by this thread; `b` must still be served from another thread
+        done = threading.Event()
+        threading.Thread(target=lambda: (manager.apply_action(b, "call", None), done.set())).start()
+        assert done.wait(5)
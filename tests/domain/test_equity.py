@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from backend.app.domain import equity
+from backend.app.domain.equity import EquityEngine
+from backend.app.domain.ranges import CLASS_COMBOS, CLASS_INDEX, parse_range, to_grid
+
+
+def test_parse_range_tokens():
+    weights = parse_range("QQ+, AKs, KhQh:0.5")
+    assert weights.sum() == pytest.approx(3 * 6 + 4 + 0.5)
+    assert parse_range("ATs+").sum() == 4 * 4
+    assert parse_range(None).sum() == 1326
+    assert CLASS_COMBOS[CLASS_INDEX["AKo"]] == 12
+
+
+def test_to_grid_layout():
+    grid = to_grid(parse_range("AA, AKs, AKo"), normalize=False)
+    assert grid[0, 0] == 6
+    assert grid[0, 1] == 4
+    assert grid[1, 0] == 12
+
+
+def test_aa_vs_kk_preflop_in_process():
+    engine = EquityEngine(workers=0)
+    result = engine.estimate(["As", "Ah"], "KK", max_samples=40_000, seed=3)
+    assert result.samples == 40_000
+    assert result.equity == pytest.approx(0.82, abs=0.015)
+    assert result.ci_low < result.equity < result.ci_high
+
+
+def test_seeded_runs_are_reproducible():
+    engine = EquityEngine(workers=0, chunk_size=5_000)
+    a = engine.estimate(["Qs", "Jh"], "22+, AK", board=["Ts", "9d", "2c"], max_samples=20_000, seed=9)
+    b = engine.estimate(["Qs", "Jh"], "22+, AK", board=["Ts", "9d", "2c"], max_samples=20_000, seed=9)
+    assert a == b
+
+
+def test_precision_budget_stops_early():
+    engine = EquityEngine(workers=0, chunk_size=2_000)
+    result = engine.estimate(["As", "Kd"], None, max_samples=500_000, target_stderr=0.01, seed=1)
+    assert result.samples < 500_000
+    assert result.stderr <= 0.01
+
+
+def test_card_removal_and_empty_range():
+    engine = EquityEngine(workers=0)
+    # Only AdAc remains once hero holds two aces: a near coin flip
+    result = engine.estimate(["As", "Ah"], "AA", max_samples=20_000, seed=4)
+    assert result.equity == pytest.approx(0.5, abs=0.03)
+    with pytest.raises(ValueError):
+        engine.estimate(["As", "Ah"], "AsAd", board=["Ad", "2c", "3h"])
+
+
+def test_process_pool_fanout_and_async():
+    engine = EquityEngine(workers=2, chunk_size=4_000)
+    try:
+        result = asyncio.run(engine.estimate_async(["As", "Ah"], "KK", max_samples=16_000, seed=5))
+    finally:
+        engine.close()
+    assert result.samples == 16_000
+    assert result.equity == pytest.approx(0.82, abs=0.03)
+
+
+def _brute_force_equity(hero, board, villain_spec):
+    from itertools import combinations
+
+    from backend.app.domain.cards import CARD_INDEX, generate_deck
+    from backend.app.domain.evaluator import evaluate
+    from backend.app.domain.ranges import COMBOS
+
+    known = [CARD_INDEX[c] for c in hero + board]
+    weights = parse_range(villain_spec)
+    total = won = 0.0
+    for i, (a, b) in enumerate(COMBOS.tolist()):
+        if weights[i] == 0 or a in known or b in known:
+            continue
+        rest = [CARD_INDEX[c] for c in generate_deck() if CARD_INDEX[c] not in known + [a, b]]
+        for runout in combinations(rest, 5 - len(board)):
+            full = known[2:] + list(runout)
+            h, v = evaluate(known[:2] + full), evaluate([a, b] + full)
+            total += weights[i]
+            won += weights[i] * ((h > v) + 0.5 * (h == v))
+    return won / total
+
+
+def test_exact_turn_matches_brute_force_and_dedups_suits():
+    engine = EquityEngine(workers=0)
+    hero, board = ["As", "Ah"], ["Kd", "Kc", "7s", "7h"]
+
+    result = engine.estimate(hero, "77+, AK, KQs:0.5", board=board)
+
+    assert result.exact
+    assert result.stderr == 0.0
+    assert result.equity == pytest.approx(_brute_force_equity(hero, board, "77+, AK, KQs:0.5"))
+    # s<->h and d<->c symmetries collapse isomorphic scenarios
+    assert result.evaluated < result.samples
+
+
+@pytest.mark.parametrize("board", [["Ad", "Kd", "5s", "7c"], ["Ad", "Kd", "5s"]])
+def test_exact_ignores_suit_swaps_between_hero_and_board(monkeypatch, board):
+    """h<->d maps {AhKh, AdKd} onto itself but not the spot; merging under it skewed exact equity."""
+    engine = EquityEngine(workers=0)
+    reduced = engine.estimate(["Ah", "Kh"], None, board=board, exact=True)
+    monkeypatch.setattr(equity, "_stabilizer", lambda hero, board: equity.SUIT_PERMS[:1])
+    unreduced = engine.estimate(["Ah", "Kh"], None, board=board, exact=True)
+    assert equity.SUIT_PERMS[0].tolist() == list(range(52))
+    assert reduced.equity == pytest.approx(unreduced.equity, abs=1e-12)
+    assert reduced.samples == unreduced.samples
+
+
+def test_exact_river_and_auto_switch():
+    engine = EquityEngine(workers=0)
+    river = engine.estimate(["Qs", "Jh"], None, board=["Ts", "9d", "2c", "8h", "3s"])
+    assert river.exact and river.samples == 990
+    assert river.equity == pytest.approx(_brute_force_equity(["Qs", "Jh"], ["Ts", "9d", "2c", "8h", "3s"], None))
+
+    flop = engine.estimate(["Qs", "Jh"], None, board=["Ts", "9d", "2c"], max_samples=5_000, seed=2)
+    assert not flop.exact
+    sampled = engine.estimate(["Qs", "Jh"], None, board=["Ts", "9d", "2c", "8h"], max_samples=5_000, seed=2, exact=False)
+    assert not sampled.exact and sampled.samples == 5_000
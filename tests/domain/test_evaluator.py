@@ -0,0 +1,85 @@
+from itertools import combinations
+
+from backend.app.domain.cards import CARD_INDEX, RANKS, SUITS, generate_deck
+from backend.app.domain.evaluator import decode, describe, evaluate, evaluate_strs
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def _legacy(adapter, cards):
+    cat, tbs, _ = adapter._best_five_from_seven(cards)
+    return cat, tuple(tbs)
+
+
+def _rank_multisets(total, rank=0):
+    """Yield count vectors (13 ranks, each <= 4) summing to `total`."""
+    if rank == 12:
+        if total <= 4:
+            yield (total,)
+        return
+    for n in range(min(4, total) + 1):
+        for rest in _rank_multisets(total - n, rank + 1):
+            yield (n,) + rest
+
+
+def _offsuit_cards(counts):
+    """Spread a rank multiset over suits so no suit holds five cards."""
+    cards = []
+    i = 0
+    for r, n in enumerate(counts):
+        for _ in range(n):
+            cards.append(RANKS[r] + SUITS[i % 4])
+            i += 1
+    return cards
+
+
+def test_parity_every_non_flush_rank_class():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    checked = 0
+    for total in (5, 6, 7):
+        for counts in _rank_multisets(total):
+            cards = _offsuit_cards(counts)
+            assert decode(evaluate_strs(cards)) == _legacy(adapter, cards), cards
+            checked += 1
+    assert checked == 6175 + 18395 + 49205
+
+
+def test_parity_every_flush_class():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    for size in (5, 6, 7):
+        for ranks in combinations(range(13), size):
+            suited = [RANKS[r] + "h" for r in ranks]
+            # Fill to seven cards with off-suit cards that cannot improve the hand
+            fillers = [RANKS[ranks[0]] + "s", RANKS[ranks[1]] + "d"][: 7 - size]
+            cards = suited + fillers
+            assert decode(evaluate_strs(cards)) == _legacy(adapter, cards), cards
+
+
+def test_strength_order_matches_legacy_order():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=7)
+    deck = generate_deck()
+    hands = []
+    for _ in range(300):
+        adapter.rng.shuffle(deck)
+        hands.append(deck[:7])
+    by_strength = sorted(hands, key=evaluate_strs)
+    legacy_keys = [_legacy(adapter, h) for h in by_strength]
+    assert legacy_keys == sorted(legacy_keys)
+
+
+def test_three_pair_kicker_uses_third_pair():
+    strength = evaluate_strs(["Ah", "Ad", "Kh", "Kd", "Qs", "Qc", "2h"])
+    assert describe(strength) == {"category": "two_pair", "ranks": [14, 13, 12]}
+
+
+def test_wheel_and_steel_wheel():
+    wheel = evaluate([CARD_INDEX[c] for c in ["Ah", "2d", "3s", "4c", "5h", "9d", "Jc"]])
+    steel = evaluate_strs(["Ah", "2h", "3h", "4h", "5h", "9d", "Jc"])
+    assert describe(wheel) == {"category": "straight", "ranks": [5]}
+    assert describe(steel) == {"category": "straight_flush", "ranks": [5]}
+    assert steel > wheel
+
+
+def test_hand_desc_accepts_strength_and_legacy_tuple():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    cards = ["Ah", "Kh", "Qh", "2c", "2d", "Jh", "Th"]
+    assert adapter._hand_desc(evaluate_strs(cards)) == adapter._hand_desc(adapter._best_five_from_seven(cards))
@@ -0,0 +1,41 @@
+from backend.app.domain.board_features import flop_key
+from backend.app.domain.flop_cache import FlopCache, all_flop_keys, board_of_key, warm
+
+
+def test_representative_boards_round_trip_their_key():
+    keys = all_flop_keys()
+    assert len(keys) == 1755
+    assert all(flop_key(board_of_key(key)) == key for key in keys)
+
+
+def test_isomorphic_flops_share_one_entry(tmp_path):
+    cache = FlopCache(str(tmp_path / "flops.sqlite"))
+    first = cache.categories(["Ah", "Kd", "7c"])
+    assert cache.categories(["As", "Kh", "7d"]) is first
+    assert abs(sum(first.values()) - 1.0) < 1e-5
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
+
+    eq = cache.equity(["Ah", "Kd", "7c"], "QQ+, AK", "22+")
+    assert cache.equity(["Ac", "Ks", "7h"], "AK,QQ+", "22+") is eq
+    assert 0.0 < eq["equity"] < 1.0
+
+
+def test_disk_tier_is_shared_and_prefillable(tmp_path):
+    path = str(tmp_path / "flops.sqlite")
+    assert warm(FlopCache(path), chunk=500) == 1755
+    other = FlopCache(path)
+    other.categories(["9s", "9h", "2c"])
+    assert other.stats() == {"hits": 0, "disk_hits": 1, "misses": 0, "resident": 1}
+
+
+def test_specific_card_ranges_bypass_the_cache(tmp_path):
+    cache = FlopCache(str(tmp_path / "flops.sqlite"))
+    cache.equity(["Ah", "Kd", "7c"], "KhQh", "22+")
+    assert cache.stats()["resident"] == 0
+
+
+def test_lru_is_bounded():
+    cache = FlopCache(path=None, max_entries=2)
+    for board in (["Ah", "Kd", "7c"], ["2h", "3d", "4c"], ["5h", "6d", "8c"]):
+        cache.categories(board)
+    assert cache.stats()["resident"] == 2
@@ -30,3 +30,15 @@ def test_postflop_check_villain_bet_contributions():
     assert adapter.street in ("turn", "showdown")
     assert adapter.current_bet == pytest.approx(adapter.villain.current_bet)
     assert adapter.hero.contributed == pytest.approx(adapter.villain.contributed)
+
+
+def test_fold_pays_the_pot_to_the_remaining_player():
+    adapter = _make_adapter()
+    adapter.apply_hero_action("fold")
+    assert adapter.pot == 0.0
+    assert adapter.villain.stack == 100.5 and adapter.hero.stack == 99.5
+
+    adapter = _make_adapter()
+    adapter.apply_hero_action("raise", 30.0)
+    assert adapter.history[-1] == {"actor": "villain", "move": "fold", "size": None, "street": "preflop"}
+    assert adapter.pot == 0.0 and adapter.hero.stack == 101.0
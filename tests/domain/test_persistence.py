@@ -0,0 +1,147 @@
+import sqlite3
+import time
+
+from backend.app.domain import persistence
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.persistence import SessionRepository
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.domain.session_store import InMemorySessionStore
+
+
+def test_snapshot_round_trip_mid_hand():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=8, num_players=3)
+    adapter.reset_hand(seed=99)
+    adapter.reset_hand()
+    adapter.apply_hero_action("call")
+
+    restored = PokerAdapter.from_snapshot(adapter.snapshot())
+
+    assert restored.get_state("s") == adapter.get_state("s")
+    assert restored.deck == adapter.deck
+    # Both continue identically, including future shuffles
+    for a in (adapter, restored):
+        a.apply_hero_action("check")
+        a.reset_hand()
+    assert restored.get_state("s") == adapter.get_state("s")
+
+
+def test_sessions_survive_restart(tmp_path):
+    db = str(tmp_path / "sessions.db")
+    manager = GameManager(repository=SessionRepository(db))
+    session_id = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=12)["sessionId"]
+    manager.apply_action(session_id, "call", None)
+    manager.apply_action(session_id, "check", None)
+    manager.reset_game(session_id, seed=5)
+    manager.apply_action(session_id, "raise", 3.0)
+    expected = manager.get_state(session_id)
+    manager.close()
+
+    restarted = GameManager(repository=SessionRepository(db))
+    assert restarted.get_state(session_id) == expected
+    restarted.close()
+
+
+def test_evicted_session_is_rebuilt_from_log(tmp_path):
+    repository = SessionRepository(str(tmp_path / "sessions.db"))
+    manager = GameManager(store=InMemorySessionStore(max_entries=1, ttl_seconds=None), repository=repository)
+    first = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=1)["sessionId"]
+    manager.apply_action(first, "call", None)
+    expected = manager.get_state(first)
+    manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=2)
+
+    assert manager.get_state(first) == expected
+    manager.close()
+
+
+def test_writes_are_batched_in_wal_mode(tmp_path):
+    db = str(tmp_path / "sessions.db")
+    repository = SessionRepository(db, flush_interval=0.2)
+    manager = GameManager(repository=repository)
+    session_id = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=3)["sessionId"]
+    for _ in range(3):
+        manager.apply_action(session_id, "call", None)
+    repository.flush()
+
+    conn = sqlite3.connect(db)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("SELECT COUNT(*) FROM actions WHERE session_id = ?", (session_id,)).fetchone()[0] == 3
+    assert conn.execute("SELECT COUNT(*) FROM hands WHERE session_id = ?", (session_id,)).fetchone()[0] == 1
+    conn.close()
+    manager.close()
+
+
+def test_float_snapshot_from_before_cents_loads():
+    """Snapshots without "units" hold display-unit floats."""
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=8)
+    adapter.apply_hero_action("raise", 3.3)
+    snap = adapter.snapshot()
+    legacy = {k: v for k, v in snap.items() if k != "units"}
+    legacy["pot"] = snap["pot"] / 100
+    legacy["betting"] = [snap["betting"][0], snap["betting"][1] / 100, *snap["betting"][2:]]
+    legacy["players"] = [[r[0] / 100, *r[1:5], r[5] / 100, r[6] / 100, r[7]] for r in snap["players"]]
+
+    restored = PokerAdapter.from_snapshot(legacy)
+
+    assert restored.get_state("s") == adapter.get_state("s")
+    assert restored.hero.stack_c == adapter.hero.stack_c
+
+
+def test_unknown_session_does_not_wait_for_other_sessions_writes(tmp_path):
+    """A miss only waits for its own session's queued writes, not the whole queue."""
+    repository = SessionRepository(str(tmp_path / "sessions.db"), flush_interval=1.0)
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=4)
+    repository.save_session("busy", adapter, 4)
+
+    start = time.perf_counter()
+    assert repository.load("unknown") is None
+    assert time.perf_counter() - start < 0.5
+    assert repository.load("busy").get_state("s") == adapter.get_state("s")
+    repository.close()
+
+
+def test_failed_batch_marks_its_sessions_lost(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "RETRY_DELAY", 0.0)
+    repository = SessionRepository(str(tmp_path / "sessions.db"))
+    manager = GameManager(store=InMemorySessionStore(max_entries=1, ttl_seconds=None), repository=repository)
+    session_id = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=6)["sessionId"]
+    repository.flush()
+    monkeypatch.setitem(persistence._INSERTS, "action", "INSERT INTO no_such_table VALUES (?, ?, ?, ?, ?)")
+    manager.apply_action(session_id, "call", None)
+    repository.flush()
+
+    assert repository.refusal(session_id) == "SESSION_LOST" and repository.load(session_id) is None
+    manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=7)
+    assert manager.get_state(session_id) == {"error": "SESSION_LOST"}
+    manager.close()
+
+
+def test_bad_row_refuses_only_its_own_session(tmp_path):
+    repository = SessionRepository(str(tmp_path / "sessions.db"), flush_interval=0.5)
+    healthy = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    broken = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=2)
+    repository.save_session("healthy", healthy, 1)
+    repository.save_session("broken", broken, 2)
+    healthy.apply_hero_action("call")
+    repository.record_action("healthy", healthy, "call", None)
+    # Slips past record_action's coercion; SQLite cannot bind a list
+    repository._enqueue("action", ("broken", broken.hand_no, 1, "call", [1]))
+    repository.flush()
+
+    assert repository.refusal("broken") == "SESSION_LOST"
+    assert repository.refusal("healthy") is None
+    assert repository.load("healthy").get_state("s") == healthy.get_state("s")
+    repository.close()
+
+
+def test_record_action_coerces_or_refuses_before_queueing(tmp_path):
+    repository = SessionRepository(str(tmp_path / "sessions.db"))
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=3)
+    repository.save_session("s", adapter, 3)
+    adapter.apply_hero_action("raise", 3)
+    repository.record_action("s", adapter, "raise", 3)
+    repository.record_action("t", adapter, "raise", [1])
+    repository.flush()
+
+    assert repository.load("s").get_state("s") == adapter.get_state("s")
+    assert repository.refusal("t") == "SESSION_LOST"
+    repository.close()
@@ -0,0 +1,45 @@
+from backend.app.domain.pots import award, side_pots
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def test_nine_handed_tiers_conserve_chips():
+    """Every all-in level gets its own pot and the pots sum to the contributions."""
+    live = [(seat, (seat + 1) * 1001) for seat in range(8)]
+    dead = [2500]
+    pots = side_pots(live, dead, pot=sum(c for _, c in live) + 2500)
+
+    assert len(pots) == 8
+    assert sum(amount for amount, _ in pots) == sum(c for _, c in live) + 2500
+    assert pots[0] == (1001 * 9, list(range(8)))
+    assert pots[-1][1] == [7]
+
+
+def test_dead_money_stays_in_the_tiers_it_reached():
+    pots = side_pots([(0, 500), (1, 1000)], dead=[800])
+    assert pots == [(1500, [0, 1]), (800, [1])]
+
+
+def test_odd_cents_go_left_of_button_first():
+    assert award(100, [0, 2, 5], button=3, seats=6) == {5: 34, 0: 33, 2: 33}
+    assert award(101, [0, 2, 5], button=1, seats=6) == {2: 34, 5: 34, 0: 33}
+
+
+def test_showdown_pays_out_exact_pot():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=5, num_players=9)
+    deck = [r + s for r in "23456789TJQKA" for s in "cdhs"]
+    adapter.board = deck[:5]
+    adapter.street = "river"
+    for i, player in enumerate(adapter.players):
+        player.cards = deck[5 + 2 * i:7 + 2 * i]
+        player.folded = i == 8
+        player.contributed = round(1.37 * (i + 1), 2)
+    adapter.pot = round(sum(p.contributed for p in adapter.players), 2)
+    before = sum(p.stack for p in adapter.players)
+
+    pot = adapter.pot
+    adapter._evaluate_showdown()
+
+    paid = sum(d["amount"] for d in adapter.history[-1]["pots"])
+    assert round(paid, 2) == round(pot, 2)
+    assert round(sum(p.stack for p in adapter.players) - before, 2) == round(pot, 2)
+    assert adapter.pot == 0.0
@@ -0,0 +1,95 @@
+import numpy as np
+
+from backend.app.domain import preflop_equity
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.persistence import SessionRepository
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.domain.ranges import CLASS_INDEX, NUM_CLASSES
+
+
+def _synthetic() -> np.ndarray:
+    """Antisymmetric stand-in: the better-indexed class (aces first) wins 70%."""
+    m = np.full((NUM_CLASSES, NUM_CLASSES), 0.5, dtype=np.float32)
+    upper = np.triu_indices(NUM_CLASSES, 1)
+    m[upper] = 0.7
+    m[upper[1], upper[0]] = 0.3
+    return m
+
+
+def test_matrix_file_round_trips_through_memmap(tmp_path):
+    path = str(tmp_path / "eq.bin")
+    preflop_equity.write_matrix(_synthetic(), path, samples=10, seed=3)
+    loaded = preflop_equity.load_matrix(path)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, _synthetic())
+
+    with open(path, "r+b") as f:
+        f.seek(4)
+        f.write((preflop_equity.MATRIX_VERSION + 1).to_bytes(4, "little"))
+    assert preflop_equity.load_matrix(path) is None
+    assert preflop_equity.load_matrix(str(tmp_path / "missing.bin")) is None
+
+
+def test_pair_equity_sampling():
+    rng = np.random.default_rng(0)
+    aa_vs_72 = preflop_equity._pair_equity(CLASS_INDEX["AA"], CLASS_INDEX["72o"], 2000, rng)
+    assert 0.84 < aa_vs_72 < 0.91
+    # Same class: symmetric up to sampling noise
+    assert abs(preflop_equity._pair_equity(CLASS_INDEX["AKs"], CLASS_INDEX["AKs"], 2000, rng) - 0.5) < 0.05
+
+
+def test_lookups_and_missing_matrix(monkeypatch):
+    monkeypatch.setattr(preflop_equity, "_matrix", None)
+    assert preflop_equity.class_equity("AA", "KK") is None
+    monkeypatch.setattr(preflop_equity, "_matrix", _synthetic())
+    assert preflop_equity.class_equity("AA", "KK") == np.float32(0.7)
+    assert preflop_equity.equity_vs_range("AA", "AA") == 0.5
+    assert preflop_equity.equity_vs_range("AA") > preflop_equity.equity_vs_range("32o")
+
+
+def test_only_the_equity_villain_reads_the_matrix(monkeypatch):
+    """Premium defence is opt-in: the default villain plays the same with or without the file."""
+    def play(matrix, model):
+        monkeypatch.setattr(preflop_equity, "_matrix", matrix)
+        adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1, villain_model=model)
+        adapter.villain.cards = ["As", "Ah"]
+        adapter.hero.cards = ["7c", "2d"]
+        adapter.apply_hero_action("raise", 6.0)
+        return adapter.history[-1]["move"] if adapter.street == "showdown" else adapter.street
+
+    assert play(None, "deterministic") == play(_synthetic(), "deterministic") == "fold"
+    assert play(None, "equity") == "fold"
+    assert play(_synthetic(), "equity") == "flop"
+
+
+def test_default_villain_ignores_the_matrix_over_many_hands(monkeypatch):
+    def responses(matrix):
+        monkeypatch.setattr(preflop_equity, "_matrix", matrix)
+        moves = []
+        for seed in range(200):
+            adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=seed)
+            adapter.apply_hero_action("raise", 30.0)
+            moves.append(adapter.history[3]["move"])
+        return moves
+
+    assert responses(None) == responses(_synthetic())
+
+
+def test_replay_against_a_different_matrix_is_refused(monkeypatch, tmp_path):
+    monkeypatch.setattr(preflop_equity, "_matrix", _synthetic())
+    db = str(tmp_path / "sessions.db")
+    manager = GameManager(repository=SessionRepository(db))
+    session_id = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=2, villain_model="equity")["sessionId"]
+    manager.apply_action(session_id, "raise", 6.0)
+    manager.close()
+
+    rebuilt = np.full((NUM_CLASSES, NUM_CLASSES), 0.5, dtype=np.float32)
+    monkeypatch.setattr(preflop_equity, "_matrix", rebuilt)
+    restarted = GameManager(repository=SessionRepository(db))
+    assert restarted.get_state(session_id) == {"error": "VILLAIN_DATA_CHANGED"}
+    restarted.close()
+
+    monkeypatch.setattr(preflop_equity, "_matrix", _synthetic())
+    restarted = GameManager(repository=SessionRepository(db))
+    assert "state" in restarted.get_state(session_id)
+    restarted.close()
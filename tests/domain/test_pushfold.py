@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from backend.app.domain import pushfold
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.domain.range_engine import CLASS_SCORE
+from backend.app.domain.ranges import CLASS_INDEX, NUM_CLASSES
+from backend.app.domain.villain import VillainDataChanged
+
+
+def _equity() -> np.ndarray:
+    """Antisymmetric stand-in for the equity matrix: the higher Chen score is the favourite."""
+    diff = CLASS_SCORE[:, None] - CLASS_SCORE[None, :]
+    return (0.5 + 0.35 * np.tanh(diff / 8)).astype(np.float32)
+
+
+def test_pair_weights_include_card_removal():
+    weights = pushfold.pair_weights()
+    assert abs(weights.sum() - 1.0) < 1e-9
+    # Six AA combos, each leaving exactly one AA combo for the other player
+    assert round(weights[CLASS_INDEX["AA"], CLASS_INDEX["AA"]] * 1326 * 1225) == 6
+    assert round(weights[CLASS_INDEX["AKo"], CLASS_INDEX["AA"]] * 1326 * 1225) == 12 * 3
+
+
+def test_equilibrium_converges_and_tightens_with_depth():
+    shares = []
+    for stack in (3.0, 10.0, 25.0):
+        push, call, gap = pushfold.solve(_equity(), stack, iterations=400)
+        assert gap < 1e-3
+        assert push[CLASS_INDEX["AA"]] == 1.0 and call[CLASS_INDEX["AA"]] == 1.0
+        shares.append(pushfold.range_share(push))
+    assert shares[0] > shares[1] > shares[2]
+    assert pushfold.range_share(pushfold.solve(_equity(), 25.0, iterations=400)[1]) < shares[2]
+
+
+def test_charts_round_trip_with_constant_time_lookup(tmp_path):
+    stacks = pushfold.stack_grid(2.0, 1.0, 4)
+    push, call = pushfold.solve_grid(_equity(), stacks=stacks, iterations=100)
+    path = pushfold.chart_path(0.5, 0.0, str(tmp_path))
+    pushfold.write_charts(pushfold.ChartGrid(0.5, 0.0, 2.0, 1.0, push, call), path, iterations=100)
+
+    grid = pushfold.load_charts(path)
+    chart = grid.lookup(3.4)
+    assert chart.stack == 3.0 and np.array_equal(chart.push, push[1].astype(np.float32))
+    assert grid.lookup(0.5) is None and grid.lookup(40.0) is None
+
+    with open(path, "r+b") as f:
+        f.seek(4)
+        f.write((pushfold.CHART_VERSION + 1).to_bytes(4, "little"))
+    assert pushfold.load_charts(path) is None
+    assert pushfold.load_charts(str(tmp_path / "missing.bin")) is None
+
+
+def test_equity_villain_answers_shoves_from_the_chart(monkeypatch):
+    def shove(call_everything: bool, model: str) -> str:
+        call = np.full((1, NUM_CLASSES), float(call_everything))
+        grid = pushfold.ChartGrid(0.5, 0.0, 10.0, 1.0, np.ones((1, NUM_CLASSES)), call)
+        monkeypatch.setattr(pushfold, "_charts", {(0.5, 0.0): grid})
+        adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=10.0, seed=7, villain_model=model)
+        adapter.apply_hero_action("raise", 10.0)
+        response = adapter.history[3]
+        assert response["actor"] == "villain"
+        return response["move"]
+
+    assert shove(True, "equity") == "call"
+    assert shove(False, "equity") == "fold"
+    # The default villain keeps its pot-odds rule, which folds to this shove, whatever the charts say
+    assert shove(True, "deterministic") == shove(False, "deterministic") == "fold"
+
+
+def test_chart_identity_is_recorded_by_the_equity_villain(tmp_path, monkeypatch):
+    stacks = pushfold.stack_grid(2.0, 1.0, 2)
+    push, call = pushfold.solve_grid(_equity(), stacks=stacks, iterations=50)
+    path = pushfold.chart_path(0.5, 0.0, str(tmp_path))
+    pushfold.write_charts(pushfold.ChartGrid(0.5, 0.0, 2.0, 1.0, push, call), path, iterations=50)
+    grid = pushfold.load_charts(path)
+    assert grid.iterations == 50 and grid.identity.startswith(f"{pushfold.CHART_VERSION}:50:")
+
+    monkeypatch.setattr(pushfold, "_charts", {(0.5, 0.0): grid})
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=10.0, seed=7, villain_model="equity")
+    snap = adapter.snapshot()
+    assert snap["villainData"]["pushfold"] == grid.identity
+    assert PokerAdapter(small_blind=0.5, big_blind=1.0, stack=10.0, seed=7).snapshot()["villainData"] is None
+
+    rebuilt = pushfold.ChartGrid(0.5, 0.0, 2.0, 1.0, push, 1.0 - call, iterations=50)
+    monkeypatch.setattr(pushfold, "_charts", {(0.5, 0.0): rebuilt})
+    with pytest.raises(VillainDataChanged):
+        PokerAdapter.from_snapshot(snap)
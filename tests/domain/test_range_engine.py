@@ -0,0 +1,55 @@
+import numpy as np
+
+from backend.app.domain import range_engine
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.domain.range_engine import RangeTracker
+from backend.app.domain.ranges import CLASS_INDEX, COMBO_CLASS, COMBOS
+
+
+def test_villain_range_blocks_hero_and_board():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=4)
+    adapter.apply_hero_action("call")
+    weights = RangeTracker("villain").update(adapter)
+    seen = set(adapter.hero.hole) | set(adapter._board)
+    blocked = np.array([bool(seen & {hi, lo}) for hi, lo in COMBOS.tolist()])
+    assert not weights[blocked].any()
+    assert (weights[~blocked] > 0).all()
+    # 5 known cards leave C(47, 2) villain combos
+    assert int((weights > 0).sum()) == 1081
+
+
+def test_hero_raise_shifts_range_toward_strong_hands():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=4)
+    adapter.apply_hero_action("raise", 3.0)
+    weights = RangeTracker("hero").update(adapter)
+    best = lambda label: weights[COMBO_CLASS == CLASS_INDEX[label]].max()
+    assert best("AA") > best("72o") * 5
+
+
+def test_tracker_is_incremental_and_resets_each_hand():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=9)
+    tracker = range_engine.tracker_for(adapter, "hero")
+    assert range_engine.tracker_for(adapter, "hero") is tracker
+    adapter.apply_hero_action("call")
+    incremental = tracker.update(adapter).copy()
+    adapter.apply_hero_action("check")
+    tracker.update(adapter)
+    assert tracker.seen == len(adapter.history)
+    assert np.allclose(tracker.weights, RangeTracker("hero").update(adapter))
+    assert not np.allclose(tracker.weights, incremental)
+
+    adapter.reset_hand()
+    assert np.allclose(tracker.update(adapter), RangeTracker("hero").update(adapter))
+
+
+def test_villain_likelihood_follows_the_villain_model():
+    """Bets by the equity villain narrow its range; the rule-based villain's bets say nothing."""
+    ranges = {}
+    for model in ("deterministic", "equity"):
+        adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=4, villain_model=model)
+        adapter.apply_hero_action("call")
+        adapter.history.append({"actor": "villain", "move": "bet", "size": 1.0, "street": "flop"})
+        ranges[model] = range_engine.tracker_for(adapter, "villain").update(adapter)
+    live = ranges["deterministic"] > 0
+    assert np.ptp(ranges["deterministic"][live]) == 0
+    assert ranges["equity"][live].max() > 10 * ranges["equity"][live].min()
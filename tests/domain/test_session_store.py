@@ -0,0 +1,77 @@
+import time
+
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.domain.session_store import EVICTED, EXPIRED, InMemorySessionStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _adapter(seed: int = 1) -> PokerAdapter:
+    return PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=seed)
+
+
+def test_lru_eviction_keeps_recently_used():
+    store = InMemorySessionStore(max_entries=2, ttl_seconds=None)
+    store.put("a", _adapter())
+    store.put("b", _adapter())
+    assert store.get("a") is not None  # "b" is now least recently used
+
+    store.put("c", _adapter())
+
+    assert store.get("b") is None
+    assert store.dropped_reason("b") == EVICTED
+    assert store.get("a") is not None and store.get("c") is not None
+    assert store.stats() == {"hits": 3, "misses": 1, "evictions": 1, "expirations": 0, "resident": 2}
+
+
+def test_idle_ttl_expires_lazily_and_on_sweep():
+    clock = FakeClock()
+    store = InMemorySessionStore(max_entries=10, ttl_seconds=30, clock=clock)
+    store.put("a", _adapter())
+    store.put("b", _adapter())
+
+    clock.now = 20
+    assert store.get("a") is not None  # touching "a" refreshes its idle timer
+    clock.now = 40
+    assert store.get("b") is None
+    assert store.dropped_reason("b") == EXPIRED
+
+    clock.now = 80
+    assert store.sweep() == 1
+    assert len(store) == 0
+    assert store.stats()["expirations"] == 2
+
+
+def test_background_sweeper_runs():
+    clock = FakeClock()
+    store = InMemorySessionStore(ttl_seconds=1, clock=clock)
+    store.put("a", _adapter())
+    clock.now = 5
+    store.start_sweeper(interval=0.01)
+    try:
+        deadline = time.monotonic() + 2
+        while len(store) and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        store.stop_sweeper()
+    assert len(store) == 0
+
+
+def test_game_manager_reports_distinct_error_codes():
+    clock = FakeClock()
+    manager = GameManager(store=InMemorySessionStore(max_entries=1, ttl_seconds=10, clock=clock))
+    first = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=1)["sessionId"]
+    second = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=2)["sessionId"]
+
+    assert manager.get_state(first) == {"error": "SESSION_EVICTED"}
+    clock.now = 11
+    assert manager.apply_action(second, "call", None) == {"error": "SESSION_EXPIRED"}
+    assert manager.reset_game("nope") == {"error": "SESSION_NOT_FOUND"}
+    assert manager.stats()["resident"] == 0
@@ -0,0 +1,25 @@
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.domain.simulate import outcome_of, play_session, simulate
+
+
+def test_outcome_of_classifies_a_preflop_fold():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    adapter.apply_hero_action("fold")
+    assert outcome_of(adapter.history) == "hero_fold_preflop"
+
+
+def test_self_play_is_deterministic_per_seed():
+    first = play_session("random", seed=3, hands=200)
+    again = play_session("random", seed=3, hands=200)
+    assert (first.net, first.outcomes) == (again.net, again.outcomes)
+    assert first.hands == 200 and sum(first.outcomes.values()) == 200
+    assert any(k.startswith("showdown_") for k in first.outcomes)
+
+
+def test_simulate_report_in_process_matches_pool():
+    local = simulate(["passive", "tight"], hands=50, seeds=range(3), workers=1)
+    pooled = simulate(["passive", "tight"], hands=50, seeds=range(3), workers=2)
+    assert local["hands"] == 300 and local["handsPerSec"] > 0
+    assert local["policies"] == pooled["policies"]
+    tight = local["policies"][1]
+    assert tight["policy"] == "tight" and "hero_fold_preflop" in tight["outcomes"]
@@ -29,3 +29,14 @@ def test_state_back_compat_minimal():
     assert extra_meta["cards"] == []
     assert extra_meta["contributed"] == 0.0
     assert extra_meta["current_bet"] == 0.0
+
+
+def test_player_state_is_slotted():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=11, num_players=9)
+
+    for p in adapter.players:
+        assert not hasattr(p, "__dict__")
+
+    adapter.hero.stack = 50.0
+    adapter.hero.cards = ["As", "Kd"]
+    assert adapter.get_state("session")["hero"] == {"stack": 50.0, "cards": ["As", "Kd"], "position": adapter.hero.position}
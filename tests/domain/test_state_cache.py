@@ -0,0 +1,51 @@
+import json
+
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def _adapter() -> PokerAdapter:
+    return PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=3, num_players=6)
+
+
+def test_get_state_is_memoized_per_version():
+    adapter = _adapter()
+    first = adapter.get_state("s")
+    assert adapter.get_state("s") is first
+    assert adapter.get_state("other") is not first
+
+    adapter.apply_hero_action("call")
+    after_action = adapter.get_state("s")
+    assert after_action is not first and after_action["street"] == "flop"
+
+    adapter.reset_hand()
+    assert adapter.get_state("s") is not after_action
+
+
+def test_direct_writes_invalidate_via_touch_or_setters():
+    adapter = _adapter()
+    state = adapter.get_state("s")
+    adapter.board = ["2c", "7h", "Ts"]
+    assert adapter.get_state("s")["board"] == ["2c", "7h", "Ts"]
+
+    adapter.hero.stack = 42.0
+    adapter.touch()
+    assert adapter.get_state("s")["hero"]["stack"] == 42.0
+    assert state["board"] == []
+
+
+def test_state_json_is_cached_encoding_of_state():
+    adapter = _adapter()
+    body = adapter.state_json("s")
+    assert json.loads(body) == adapter.get_state("s")
+    assert adapter.state_json("s") is body
+    adapter.apply_hero_action("call")
+    assert adapter.state_json("s") is not body
+
+
+def test_manager_state_json_matches_dict_response():
+    manager = GameManager()
+    sid = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)["sessionId"]
+    assert json.loads(manager.get_state_json(sid)) == manager.get_state(sid)
+    assert json.loads(manager.get_state_json(sid, since=0)) == manager.get_state(sid, since=0)
+    assert json.loads(manager.get_state_json("missing")) == {"error": "SESSION_NOT_FOUND"}
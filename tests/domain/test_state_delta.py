@@ -0,0 +1,63 @@
+import json
+
+from backend.app.domain.poker_adapter import STATE_RING, PokerAdapter
+from backend.app.domain.state_delta import apply_delta
+
+
+def _adapter(num_players: int = 2) -> PokerAdapter:
+    return PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=7, num_players=num_players)
+
+
+def test_mutations_bump_state_version():
+    adapter = _adapter()
+    assert adapter.get_state("s")["stateVersion"] == 0
+    adapter.apply_hero_action("call")
+    assert adapter.get_state("s")["stateVersion"] == 1
+    adapter.reset_hand()
+    assert adapter.get_state("s")["stateVersion"] == 2
+
+
+def test_delta_merges_to_full_state():
+    """Deltas over a hand and across a reset rebuild exactly the full state."""
+    adapter = _adapter()
+    client = adapter.get_state("s")
+    for action in ["call", "check", "check", "check"]:
+        adapter.apply_hero_action(action)
+        payload = adapter.state_since("s", client["stateVersion"])
+        assert "state" not in payload and payload["baseVersion"] == client["stateVersion"]
+        client = apply_delta(client, payload)
+        assert client == adapter.get_state("s")
+    adapter.reset_hand()
+    payload = adapter.state_since("s", client["stateVersion"])
+    assert "history" in payload["delta"] and payload["historyAppend"] == []
+    assert apply_delta(client, payload) == adapter.get_state("s")
+
+
+def test_history_is_appended_not_resent():
+    adapter = _adapter()
+    base = adapter.get_state("s")
+    adapter.apply_hero_action("call")
+    payload = adapter.state_since("s", base["stateVersion"])
+    assert "history" not in payload["delta"]
+    assert payload["historyAppend"] == adapter.history[len(base["history"]):]
+    assert "sessionId" not in payload["delta"]
+
+
+def test_unknown_or_stale_version_falls_back_to_full_state():
+    adapter = _adapter()
+    adapter.get_state("s")
+    assert "state" in adapter.state_since("s", 99)
+    assert "state" in adapter.state_since("s", None)
+    for _ in range(STATE_RING + 1):
+        adapter.reset_hand()
+        adapter.get_state("s")
+    assert "state" in adapter.state_since("s", 0)
+
+
+def test_delta_is_smaller_than_full_state_at_nine_seats():
+    adapter = _adapter(num_players=9)
+    base = adapter.get_state("s")
+    adapter.apply_hero_action("call")
+    delta = adapter.state_since("s", base["stateVersion"])
+    full = adapter.get_state("s")
+    assert len(json.dumps(delta)) < len(json.dumps(full)) / 2
@@ -0,0 +1,64 @@
+import pytest
+
+from backend.app.domain import villain
+from backend.app.domain.cards import to_ints
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.persistence import SessionRepository
+from backend.app.domain.poker_adapter import PokerAdapter
+
+
+def _river(villain_hole, seed: int = 3) -> PokerAdapter:
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=seed, villain_model="equity")
+    adapter.apply_hero_action("call")
+    adapter.street = "river"
+    adapter._board = to_ints(["Ah", "Kd", "7c", "2s", "9h"])
+    adapter.hero.hole = to_ints(["3c", "4c"])
+    adapter.villain.hole = to_ints(villain_hole)
+    return adapter
+
+
+def test_default_model_is_the_deterministic_mock():
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    assert adapter.villain_model == "deterministic"
+    assert adapter.get_state("s")["metadata"]["opponentType"] == "deterministic_mock"
+    with pytest.raises(ValueError):
+        PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1, villain_model="maniac")
+
+
+def test_equity_villain_plays_its_cards():
+    """Facing a pot-sized bet on the river it calls with the nuts and folds air."""
+    model = villain.resolve_villain("equity")
+    strong = _river(["As", "Ad"])
+    assert model.equity(strong) > 0.95 and model.call_bet(strong, strong.pot_c)
+    weak = _river(["3d", "4d"])
+    assert model.equity(weak) < 0.05 and not model.call_bet(weak, weak.pot_c)
+
+
+def test_sampled_decisions_are_reproducible():
+    """Flop/turn equity is sampled from an RNG seeded by the spot, not the clock."""
+    model = villain.resolve_villain("equity")
+    first, second = _river(["Qs", "Qd"]), _river(["Qs", "Qd"])
+    for adapter in (first, second):
+        adapter.street = "flop"
+        adapter._board = adapter._board[:3]
+    assert model.equity(first) == model.equity(second)
+
+
+def test_equity_sessions_replay_identically(tmp_path):
+    db = str(tmp_path / "sessions.db")
+    manager = GameManager(repository=SessionRepository(db))
+    session_id = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=21, villain_model="equity")["sessionId"]
+    for _ in range(4):
+        for action in ("call", "check", "bet", "check", "check"):
+            manager.apply_action(session_id, action, None)
+        manager.reset_game(session_id, seed=None)
+    manager.apply_action(session_id, "call", None)
+    manager.apply_action(session_id, "bet", 2.0)
+    expected = manager.get_state(session_id)
+    manager.close()
+
+    restarted = GameManager(repository=SessionRepository(db))
+    state = restarted.get_state(session_id)
+    assert state == expected and state["state"]["metadata"]["opponentType"] == "equity"
+    assert restarted.new_game(small_blind=0.5, big_blind=1.0, stack=100, seed=1, villain_model="maniac")["error"] == "UNKNOWN_VILLAIN_MODEL"
+    restarted.close()
@@ -0,0 +1,67 @@
+import asyncio
+
+import httpx
+
+from backend.app.cluster import SessionRouter
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.session_store import shard_for
+from backend.app.main import create_app
+
+
+def _cluster(n: int):
+    managers = [GameManager(shard=(i, n)) for i in range(n)]
+    clients = [
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app(m)), base_url="http://worker")
+        for m in managers
+    ]
+    return managers, SessionRouter(clients)
+
+
+def test_manager_mints_ids_for_its_own_shard():
+    manager = GameManager(shard=(2, 4))
+    for seed in range(20):
+        sid = manager.new_game(small_blind=0.5, big_blind=1.0, stack=100.0, seed=seed)["sessionId"]
+        assert shard_for(sid, 4) == 2
+
+
+def test_router_pins_sessions_to_owning_worker():
+    """Sessions spread across workers and every follow-up request finds its session."""
+    managers, router = _cluster(3)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=router), base_url="http://router") as client:
+            sids = []
+            for seed in range(9):
+                resp = await client.post("/api/game/new", json={"seed": seed})
+                sids.append(resp.json()["sessionId"])
+            for sid in sids:
+                resp = await client.post("/api/game/action", json={"sessionId": sid, "action": "call"})
+                assert "error" not in resp.json()
+                resp = await client.get("/api/game/state", params={"sessionId": sid})
+                assert resp.json()["state"]["sessionId"] == sid
+        await router.aclose()
+        return sids
+
+    sids = asyncio.run(run())
+    for i, manager in enumerate(managers):
+        owned = [sid for sid in sids if shard_for(sid, 3) == i]
+        assert len(owned) == 3
+        assert manager.stats()["resident"] == 3
+        assert all(manager.store.get(sid) is not None for sid in owned)
+
+
+def test_router_merges_worker_metrics():
+    managers, router = _cluster(2)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=router), base_url="http://router") as client:
+            for seed in range(4):
+                await client.post("/api/game/new", json={"seed": seed})
+            text = (await client.get("/metrics")).text
+        await router.aclose()
+        return text
+
+    text = asyncio.run(run())
+    assert text.count("# TYPE sessions_active gauge") == 1
+    assert 'sessions_active{worker="0"} 2' in text and 'sessions_active{worker="1"} 2' in text
+    assert 'cluster_worker_up{worker="1"} 1' in text
@@ -0,0 +1,88 @@
+import numpy as np
+from fastapi.testclient import TestClient
+
+from backend.app.domain.game_manager import GameManager
+from backend.app.main import create_app
+
+
+def test_state_poll_serves_cached_bytes():
+    manager = GameManager()
+    client = TestClient(create_app(manager))
+    sid = client.post("/api/game/new", json={"seed": 5}).json()["sessionId"]
+    first = client.get("/api/game/state", params={"sessionId": sid})
+    assert first.headers["content-type"] == "application/json"
+    assert first.json() == manager.get_state(sid)
+    assert client.get("/api/game/state", params={"sessionId": sid}).content == first.content
+
+    client.post("/api/game/action", json={"sessionId": sid, "action": "call"})
+    assert client.get("/api/game/state", params={"sessionId": sid}).json()["state"]["street"] == "flop"
+
+
+def test_batch_endpoint_plays_hands_in_one_request():
+    client = TestClient(create_app(GameManager()))
+    sid = client.post("/api/game/new", json={"seed": 2}).json()["sessionId"]
+    ops = [{"action": "call"}, {"action": "check"}, {"action": "check"}, {"action": "check"}, {"reset": True}] * 3
+    body = client.post("/api/game/batch", json={"sessionId": sid, "ops": ops, "includeIntermediate": True}).json()
+    assert body["applied"] == len(ops) and len(body["states"]) == len(ops)
+    assert body["state"]["street"] == "preflop"
+    assert body["state"] == client.get("/api/game/state", params={"sessionId": sid}).json()["state"]
+
+
+def test_new_game_selects_villain_model():
+    client = TestClient(create_app(GameManager()))
+    body = client.post("/api/game/new", json={"seed": 3, "villainModel": "equity"}).json()
+    assert body["state"]["metadata"]["opponentType"] == "equity"
+    assert client.post("/api/game/new", json={"villainModel": "maniac"}).json()["error"] == "UNKNOWN_VILLAIN_MODEL"
+
+
+def test_range_estimate_follows_the_session():
+    client = TestClient(create_app(GameManager()))
+    sid = client.post("/api/game/new", json={"seed": 3}).json()["sessionId"]
+    before = client.get("/api/range/estimate", params={"sessionId": sid, "perspective": "hero"}).json()
+    client.post("/api/game/action", json={"sessionId": sid, "action": "raise", "size": 3})
+    after = client.get("/api/range/estimate", params={"sessionId": sid, "perspective": "hero"}).json()
+    assert len(after["grid"]) == 13 and abs(sum(map(sum, after["grid"])) - 1.0) < 1e-4
+    assert after["grid"] != before["grid"]
+    villain = client.get("/api/range/estimate", params={"sessionId": sid, "perspective": "villain"}).json()
+    assert villain["combos"] < 1326
+    missing = client.get("/api/range/estimate", params={"sessionId": "nope", "perspective": "hero"}).json()
+    assert missing == {"error": "SESSION_NOT_FOUND"}
+
+
+def test_preflop_equity_lookup(monkeypatch):
+    from backend.app.domain import preflop_equity
+    client = TestClient(create_app(GameManager()))
+    monkeypatch.setattr(preflop_equity, "_matrix", None)
+    assert client.get("/api/range/equity", params={"hand": "AKs"}).json() == {"error": "EQUITY_MATRIX_MISSING"}
+    monkeypatch.setattr(preflop_equity, "_matrix", np.full((169, 169), 0.5, dtype=np.float32))
+    body = client.get("/api/range/equity", params={"hand": "AKs", "vs": "QQ+"}).json()
+    assert body == {"hand": "AKs", "vs": "QQ+", "equity": 0.5}
+    assert client.get("/api/range/equity", params={"hand": "AKx"}).json() == {"error": "INVALID_HAND"}
+
+
+def test_coach_board_report(monkeypatch, tmp_path):
+    from backend.app.domain import flop_cache
+    monkeypatch.setattr(flop_cache, "_cache", flop_cache.FlopCache(str(tmp_path / "flops.sqlite")))
+    client = TestClient(create_app(GameManager()))
+    body = client.get("/api/coach/board", params={"board": "AhKd7c", "hero": "QQ+,AK", "villain": "22+"}).json()
+    assert body["flop"] == "AK7abc" and body["texture"]["highCardHeavy"]
+    assert body["categories"]["one_pair"] > 0 and 0 < body["equity"]["equity"] < 1
+    assert client.get("/api/coach/board", params={"board": "AhAh7c"}).json() == {"error": "INVALID_BOARD"}
+
+
+def test_coach_pushfold_chart(monkeypatch):
+    from backend.app.domain import pushfold
+    client = TestClient(create_app(GameManager()))
+    monkeypatch.setattr(pushfold, "_charts", {(0.5, 0.0): None})
+    assert client.get("/api/coach/pushfold", params={"stack": 10}).json() == {"error": "PUSHFOLD_CHARTS_MISSING"}
+    push = np.zeros((3, 169))
+    push[:, 0] = 1.0
+    monkeypatch.setattr(pushfold, "_charts", {(0.5, 0.0): pushfold.ChartGrid(0.5, 0.0, 5.0, 5.0, push, push)})
+    body = client.get("/api/coach/pushfold", params={"stack": 9, "hand": "AA"}).json()
+    assert body["stack"] == 10.0 and body["hand"] == {"class": "AA", "push": 1.0, "call": 1.0}
+    assert body["push"][0][0] == 1.0 and body["pushShare"] == round(6 / 1326, 4)
+    assert client.get("/api/coach/pushfold", params={"stack": 40}).json()["error"] == "STACK_OUT_OF_RANGE"
+    assert client.get("/api/coach/pushfold", params={"stack": 10, "hand": "AKx"}).json() == {"error": "INVALID_HAND"}
+    for stack in ("nan", "inf", "-inf"):
+        assert client.get("/api/coach/pushfold", params={"stack": stack}).json() == {"error": "INVALID_STACK"}
+    assert pushfold.charts().lookup(float("nan")) is None
@@ -0,0 +1,59 @@
+from fastapi.testclient import TestClient
+
+from backend.app.core.metrics import ENGINE_SECONDS, HTTP_REQUESTS, Registry, Counter, Histogram, merge_expositions
+from backend.app.domain.game_manager import GameManager
+from backend.app.main import create_app
+
+
+def test_histogram_and_counter_exposition():
+    registry = Registry()
+    hist = registry.register(Histogram("op_seconds", "op latency", ("op",), buckets=(0.1, 1.0)))
+    hits = registry.register(Counter("hits_total", "hits"))
+    hist.observe(0.05, "a")
+    hist.observe(0.5, "a")
+    hist.observe(5.0, "a")
+    hits.inc()
+    text = registry.render()
+    assert 'op_seconds_bucket{op="a",le="0.1"} 1' in text
+    assert 'op_seconds_bucket{op="a",le="1"} 2' in text
+    assert 'op_seconds_bucket{op="a",le="+Inf"} 3' in text
+    assert 'op_seconds_count{op="a"} 3' in text
+    assert "# TYPE hits_total counter\nhits_total 1" in text
+
+
+def test_metrics_route_reports_requests_engine_and_sessions():
+    client = TestClient(create_app(GameManager()))
+    before = HTTP_REQUESTS.value("POST", "/api/game/action", "200")
+    showdowns = ENGINE_SECONDS.count("showdown")
+    sid = client.post("/api/game/new", json={"seed": 1}).json()["sessionId"]
+    for action in ["call", "check", "check", "check"]:
+        client.post("/api/game/action", json={"sessionId": sid, "action": action})
+    client.get("/api/game/state", params={"sessionId": sid})
+
+    assert HTTP_REQUESTS.value("POST", "/api/game/action", "200") == before + 4
+    assert ENGINE_SECONDS.count("showdown") == showdowns + 1
+    body = client.get("/metrics")
+    assert body.headers["content-type"].startswith("text/plain")
+    text = body.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/game/state",worker="0"}' in text
+    assert 'engine_seconds_bucket{op="apply_action",worker="0",le="+Inf"}' in text
+    assert 'engine_seconds_count{op="encode_json",worker="0"}' in text
+    assert 'sessions_active{worker="0"} 1' in text
+
+
+def test_session_gauge_belongs_to_each_app():
+    """Creating another app no longer rebinds the gauge of the first one."""
+    first = TestClient(create_app(GameManager(shard=(0, 2))))
+    second = TestClient(create_app(GameManager(shard=(1, 2))))
+    for _ in range(2):
+        first.post("/api/game/new", json={"seed": 1})
+    assert 'sessions_active{worker="0"} 2' in first.get("/metrics").text
+    assert 'sessions_active{worker="1"} 0' in second.get("/metrics").text
+
+
+def test_merge_expositions_keeps_one_header_per_family():
+    a = '# HELP x_total x\n# TYPE x_total counter\nx_total{worker="0"} 1\n'
+    b = '# HELP x_total x\n# TYPE x_total counter\nx_total{worker="1"} 2\n'
+    assert merge_expositions([a, b]) == (
+        '# HELP x_total x\n# TYPE x_total counter\nx_total{worker="0"} 1\nx_total{worker="1"} 2\n'
+    )
@@ -0,0 +1,64 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.core import config
+from backend.app.core.profiler import SamplingProfiler, install_signal_handler
+from backend.app.domain.game_manager import GameManager
+from backend.app.domain.poker_adapter import PokerAdapter
+from backend.app.main import create_app
+
+
+def _play_hands(stop: threading.Event) -> None:
+    adapter = PokerAdapter(small_blind=0.5, big_blind=1.0, stack=100.0, seed=1)
+    while not stop.is_set():
+        for action in ("call", "check", "check", "check"):
+            adapter.apply_hero_action(action)
+        adapter.reset_hand()
+
+
+def test_sampler_sees_engine_hot_path():
+    stop = threading.Event()
+    worker = threading.Thread(target=_play_hands, args=(stop,), name="engine-worker")
+    worker.start()
+    try:
+        profiler = SamplingProfiler(interval=0.002).run(0.3)
+    finally:
+        stop.set()
+        worker.join()
+    out = profiler.collapsed()
+    assert profiler.samples > 10
+    engine = [line for line in out.splitlines() if line.startswith("engine-worker;")]
+    assert engine and all(line.rsplit(" ", 1)[1].isdigit() for line in engine)
+    assert any("poker_adapter.py:PokerAdapter.apply_hero_action" in line for line in engine)
+
+
+def test_profile_route_requires_admin_token(monkeypatch):
+    client = TestClient(create_app(GameManager()))
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "")
+    assert client.get("/admin/profile", params={"seconds": 0.05}).status_code == 404
+
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "s3cret")
+    assert client.get("/admin/profile", params={"seconds": 0.05}, headers={"X-Admin-Token": "nope"}).status_code == 403
+    resp = client.get("/admin/profile", params={"seconds": 0.05, "idle": True}, headers={"X-Admin-Token": "s3cret"})
+    assert resp.status_code == 200 and resp.headers["content-type"].startswith("text/plain")
+    assert resp.text.strip()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="needs SIGUSR2")
+def test_signal_writes_collapsed_profile(tmp_path):
+    previous = signal.getsignal(signal.SIGUSR2)
+    try:
+        assert install_signal_handler("SIGUSR2", 0.1, str(tmp_path))
+        os.kill(os.getpid(), signal.SIGUSR2)
+        deadline = time.monotonic() + 5
+        while not list(tmp_path.glob("profile-*.collapsed")) and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        signal.signal(signal.SIGUSR2, previous)
+    files = list(tmp_path.glob("profile-*.collapsed"))
+    assert len(files) == 1